@@ -56,6 +56,7 @@ from geocoder.api import (  # noqa
     maxmind,
     opencage,
     osm,
+    prepare,
     tamu,
     tgos,
     tomtom,
@@ -64,8 +65,28 @@ from geocoder.api import (  # noqa
     yahoo,
     yandex,
 )
-from geocoder.cli import cli  # noqa
 from geocoder.distance import Distance  # noqa
 from geocoder.location import Location  # noqa
 
-logging.basicConfig(level=logging.DEBUG)
+# Library never configures logging itself, see "Configuring Logging for a Library"
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+
+def __getattr__(name: str):
+    # Command line interface depends on click, so it is imported only when used.
+    # "geocoder.cli" is always the submodule, as any submodule import binds it to
+    # package attribute, command is exported with not clashing name.
+    if name == "cli":
+        import geocoder.cli
+
+        return geocoder.cli
+    if name == "cli_command":
+        from geocoder.cli import cli
+
+        return cli
+    # Client imports requests and base classes, so it is imported only when used
+    if name == "GeocoderClient":
+        from geocoder.client import GeocoderClient
+
+        return GeocoderClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,181 @@
+"""
+Structured access log of provider requests.
+
+:class:`AccessLog` writes one NDJSON record per query call, built with
+``after_call`` hook (see :mod:`geocoder.hooks`). Records are put to a bounded queue
+and written by background thread, so logging never blocks request path. When queue
+is full, records are dropped and counted in :attr:`AccessLog.dropped`.
+
+    >>> import geocoder
+    >>> from geocoder.accesslog import AccessLog
+    >>> with AccessLog("access.ndjson", sample_rate=0.1):
+    ...     geocoder.osm("Ottawa, Ontario")
+
+Record example::
+
+    {"ts": 1666000000.123, "provider": "osm", "method": "geocode",
+     "url": "https://nominatim.openstreetmap.org/search", "params": {...},
+     "status": 200, "outcome": "ok", "latency": 0.182, "bytes": 1543,
+     "results": 1, "error": null}
+
+API keys and other credentials are masked in ``params``, see
+:attr:`MultipleResultsQuery.redacted_params`.
+"""
+__all__ = ["AccessLog"]
+
+import io
+import logging
+import os
+import queue
+import random
+import threading
+import time
+from typing import IO, Optional, Union
+
+from geocoder import hooks, jsonlib
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class AccessLog(object):
+    """Sampled NDJSON access log with background writer thread
+
+    :param target: File path to append records to, or writable text or binary stream
+    :param float sample_rate: Share of query calls to log, from 0 to 1
+    :param bool always_log_errors: Log all failed calls regardless of sampling
+    :param int queue_size: Max number of records, waiting for write
+    :param float flush_interval: Max seconds between stream flushes
+
+    :ivar int written: Number of written records
+    :ivar int dropped: Number of records, dropped because of full queue
+    """
+
+    def __init__(
+        self,
+        target: Union[str, os.PathLike, IO],
+        sample_rate: float = 1.0,
+        always_log_errors: bool = True,
+        queue_size: int = 10000,
+        flush_interval: float = 1.0,
+    ):
+        if not 0 <= sample_rate <= 1:
+            raise ValueError("sample_rate should be between 0 and 1")
+        self.target = target
+        self.sample_rate = sample_rate
+        self.always_log_errors = always_log_errors
+        self.flush_interval = flush_interval
+        self.written = 0
+        self.dropped = 0
+        # log is called from all query threads
+        self._dropped_lock = threading.Lock()
+
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._stream: Optional[IO] = None
+        self._owns_stream = False
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def __repr__(self) -> str:
+        return f"<AccessLog {self.target!r} - {self.written} written>"
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self):
+        """Open target, start writer thread and subscribe to query calls"""
+        if self.running:
+            raise RuntimeError("Access log is already started")
+
+        if isinstance(self.target, (str, os.PathLike)):
+            self._stream = open(self.target, "ab")
+            self._owns_stream = True
+        else:
+            self._stream = self.target
+            self._owns_stream = False
+
+        self._thread = threading.Thread(
+            target=self._writer, name="geocoder-accesslog", daemon=True
+        )
+        self._thread.start()
+        hooks.subscribe("after_call", self.log)
+        return self
+
+    def stop(self):
+        """Unsubscribe from query calls, write all queued records and stop thread"""
+        if not self.running:
+            return
+        hooks.unsubscribe("after_call", self.log)
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
+        if self._owns_stream:
+            self._stream.close()
+        self._stream = None
+
+    def log(self, query, **details):
+        """Queue record of finished query call, ``after_call`` hook callback
+
+        :param MultipleResultsQuery query: Called query
+        """
+        if self.sample_rate < 1 and random.random() >= self.sample_rate:
+            if not (self.always_log_errors and query.error):
+                return
+
+        try:
+            self._queue.put_nowait(self.build_record(query))
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+
+    @staticmethod
+    def build_record(query) -> dict:
+        """Access log record of called query
+
+        :param MultipleResultsQuery query: Called query
+        """
+        return {
+            "ts": time.time(),
+            "provider": query._PROVIDER,
+            "method": query._METHOD,
+            "url": query.url,
+            "params": query.redacted_params,
+            "status": query.status_code,
+            "outcome": query.outcome,
+            "latency": query.timings.total,
+            "bytes": query.response_size,
+            "results": len(query),
+            "error": query.error,
+        }
+
+    def _writer(self):
+        binary = not isinstance(self._stream, io.TextIOBase)
+        last_flush = time.monotonic()
+        while True:
+            try:
+                record = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                record = None
+
+            if record is _STOP:
+                self._stream.flush()
+                return
+
+            if record is not None:
+                try:
+                    line = jsonlib.dumpb(record, default=str) + b"\n"
+                    self._stream.write(line if binary else line.decode("utf-8"))
+                    self.written += 1
+                except (OSError, TypeError, ValueError) as err:
+                    logger.error("Access log record is not written: %s", err)
+
+            if time.monotonic() - last_flush >= self.flush_interval:
+                self._stream.flush()
+                last_flush = time.monotonic()
@@ -1,190 +1,203 @@
+import importlib
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Dict
+
 from geocoder.distance import Distance
-from geocoder.providers import (
-    ArcgisQuery,
-    ArcgisReverse,
-    BaiduQuery,
-    BaiduReverse,
-    BingBatchForward,
-    BingBatchReverse,
-    BingQuery,
-    BingQueryDetail,
-    BingReverse,
-    CanadapostQuery,
-    FreeGeoIPQuery,
-    GaodeQuery,
-    GaodeReverse,
-    GeocodeFarmQuery,
-    GeocodeFarmReverse,
-    GeocodeXYZQuery,
-    GeolyticaQuery,
-    GeonamesChildren,
-    GeonamesDetails,
-    GeonamesHierarchy,
-    GeonamesQuery,
-    GeonamesTimezone,
-    GisgraphyQuery,
-    GisgraphyReverse,
-    GoogleElevationQuery,
-    GooglePlacesQuery,
-    GoogleQuery,
-    GoogleReverse,
-    GoogleTimezone,
-    HereQuery,
-    HereReverse,
-    IpfinderQuery,
-    IpinfoQuery,
-    KomootQuery,
-    KomootReverse,
-    LocationIQQuery,
-    LocationIQReverse,
-    MapboxQuery,
-    MapboxReverse,
-    MapquestBatch,
-    MapquestQuery,
-    MapquestReverse,
-    MapzenQuery,
-    MapzenReverse,
-    MaxmindQuery,
-    OpenCageQuery,
-    OpenCageReverse,
-    OsmQuery,
-    OsmQueryDetail,
-    OsmReverse,
-    TamuQuery,
-    TgosQuery,
-    TomtomQuery,
-    USCensusBatch,
-    USCensusQuery,
-    USCensusReverse,
-    W3WQuery,
-    W3WReverse,
-    YahooQuery,
-    YandexQuery,
-    YandexReverse,
-)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from geocoder.base import PreparedQuery
+    from geocoder.providers.osm import OsmQuery
+
+
+class ProviderMethods(Mapping):
+    """Mapping of provider's method names to query classes
+
+    Provider module is imported only on first query class access, so registry of all
+    providers can be inspected without import of any provider implementation.
+
+    :param str provider: Provider module name in :mod:`geocoder.providers` package
+    :param methods: Method names mapping to query class names in provider module
+    """
+
+    def __init__(self, provider: str, **methods: str):
+        self.provider = provider
+        self._class_names: Dict[str, str] = methods
+        self._classes: Dict[str, type] = {}
+
+    def __getitem__(self, method: str) -> type:
+        try:
+            return self._classes[method]
+        except KeyError:
+            class_name = self._class_names[method]
+            module = importlib.import_module(f"geocoder.providers.{self.provider}")
+            query_class = self._classes[method] = getattr(module, class_name)
+            return query_class
+
+    def __contains__(self, method) -> bool:
+        return method in self._class_names
+
+    def __iter__(self):
+        return iter(self._class_names)
+
+    def __len__(self) -> int:
+        return len(self._class_names)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.provider!r}, {self._class_names!r})"
+
 
 options = {
-    "osm": {
-        "geocode": OsmQuery,
-        "details": OsmQueryDetail,
-        "reverse": OsmReverse,
-    },
-    "tgos": {
-        "geocode": TgosQuery,
-    },
-    "here": {
-        "geocode": HereQuery,
-        "reverse": HereReverse,
-    },
-    "baidu": {
-        "geocode": BaiduQuery,
-        "reverse": BaiduReverse,
-    },
-    "gaode": {
-        "geocode": GaodeQuery,
-        "reverse": GaodeReverse,
-    },
-    "yahoo": {
-        "geocode": YahooQuery,
-    },
-    "tomtom": {
-        "geocode": TomtomQuery,
-    },
-    "arcgis": {
-        "geocode": ArcgisQuery,
-        "reverse": ArcgisReverse,
-    },
-    "mapbox": {
-        "geocode": MapboxQuery,
-        "reverse": MapboxReverse,
-    },
-    "maxmind": {
-        "geocode": MaxmindQuery,
-    },
-    "ipinfo": {
-        "geocode": IpinfoQuery,
-    },
-    "geonames": {
-        "geocode": GeonamesQuery,
-        "details": GeonamesDetails,
-        "timezone": GeonamesTimezone,
-        "children": GeonamesChildren,
-        "hierarchy": GeonamesHierarchy,
-    },
-    "freegeoip": {
-        "geocode": FreeGeoIPQuery,
-    },
-    "w3w": {
-        "geocode": W3WQuery,
-        "reverse": W3WReverse,
-    },
-    "yandex": {
-        "geocode": YandexQuery,
-        "reverse": YandexReverse,
-    },
-    "mapquest": {
-        "geocode": MapquestQuery,
-        "reverse": MapquestReverse,
-        "batch": MapquestBatch,
-    },
-    "geolytica": {
-        "geocode": GeolyticaQuery,
-    },
-    "canadapost": {
-        "geocode": CanadapostQuery,
-    },
-    "opencage": {
-        "geocode": OpenCageQuery,
-        "reverse": OpenCageReverse,
-    },
-    "bing": {
-        "geocode": BingQuery,
-        "details": BingQueryDetail,
-        "reverse": BingReverse,
-        "batch": BingBatchForward,
-        "batch_reverse": BingBatchReverse,
-    },
-    "google": {
-        "geocode": GoogleQuery,
-        "reverse": GoogleReverse,
-        "timezone": GoogleTimezone,
-        "elevation": GoogleElevationQuery,
-        "places": GooglePlacesQuery,
-    },
-    "mapzen": {
-        "geocode": MapzenQuery,
-        "reverse": MapzenReverse,
-    },
-    "komoot": {
-        "geocode": KomootQuery,
-        "reverse": KomootReverse,
-    },
-    "tamu": {
-        "geocode": TamuQuery,
-    },
-    "geocodefarm": {
-        "geocode": GeocodeFarmQuery,
-        "reverse": GeocodeFarmReverse,
-    },
-    "uscensus": {
-        "geocode": USCensusQuery,
-        "reverse": USCensusReverse,
-        "batch": USCensusBatch,
-    },
-    "locationiq": {
-        "geocode": LocationIQQuery,
-        "reverse": LocationIQReverse,
-    },
-    "gisgraphy": {
-        "geocode": GisgraphyQuery,
-        "reverse": GisgraphyReverse,
-    },
-    "geocodexyz": {
-        "geocode": GeocodeXYZQuery,
-    },
-    "ipfinder": {
-        "geocode": IpfinderQuery,
-    },
+    "osm": ProviderMethods(
+        "osm",
+        geocode="OsmQuery",
+        details="OsmQueryDetail",
+        reverse="OsmReverse",
+    ),
+    "tgos": ProviderMethods(
+        "tgos",
+        geocode="TgosQuery",
+    ),
+    "here": ProviderMethods(
+        "here",
+        geocode="HereQuery",
+        reverse="HereReverse",
+    ),
+    "baidu": ProviderMethods(
+        "baidu",
+        geocode="BaiduQuery",
+        reverse="BaiduReverse",
+    ),
+    "gaode": ProviderMethods(
+        "gaode",
+        geocode="GaodeQuery",
+        reverse="GaodeReverse",
+    ),
+    "yahoo": ProviderMethods(
+        "yahoo",
+        geocode="YahooQuery",
+    ),
+    "tomtom": ProviderMethods(
+        "tomtom",
+        geocode="TomtomQuery",
+    ),
+    "arcgis": ProviderMethods(
+        "arcgis",
+        geocode="ArcgisQuery",
+        reverse="ArcgisReverse",
+    ),
+    "mapbox": ProviderMethods(
+        "mapbox",
+        geocode="MapboxQuery",
+        reverse="MapboxReverse",
+    ),
+    "maxmind": ProviderMethods(
+        "maxmind",
+        geocode="MaxmindQuery",
+    ),
+    "ipinfo": ProviderMethods(
+        "ipinfo",
+        geocode="IpinfoQuery",
+    ),
+    "geonames": ProviderMethods(
+        "geonames",
+        geocode="GeonamesQuery",
+        details="GeonamesDetails",
+        timezone="GeonamesTimezone",
+        children="GeonamesChildren",
+        hierarchy="GeonamesHierarchy",
+    ),
+    "freegeoip": ProviderMethods(
+        "freegeoip",
+        geocode="FreeGeoIPQuery",
+    ),
+    "w3w": ProviderMethods(
+        "w3w",
+        geocode="W3WQuery",
+        reverse="W3WReverse",
+    ),
+    "yandex": ProviderMethods(
+        "yandex",
+        geocode="YandexQuery",
+        reverse="YandexReverse",
+    ),
+    "mapquest": ProviderMethods(
+        "mapquest",
+        geocode="MapquestQuery",
+        reverse="MapquestReverse",
+        batch="MapquestBatch",
+    ),
+    "geolytica": ProviderMethods(
+        "geolytica",
+        geocode="GeolyticaQuery",
+    ),
+    "canadapost": ProviderMethods(
+        "canadapost",
+        geocode="CanadapostQuery",
+    ),
+    "opencage": ProviderMethods(
+        "opencage",
+        geocode="OpenCageQuery",
+        reverse="OpenCageReverse",
+    ),
+    "bing": ProviderMethods(
+        "bing",
+        geocode="BingQuery",
+        details="BingQueryDetail",
+        reverse="BingReverse",
+        batch="BingBatchForward",
+        batch_reverse="BingBatchReverse",
+    ),
+    "google": ProviderMethods(
+        "google",
+        geocode="GoogleQuery",
+        reverse="GoogleReverse",
+        timezone="GoogleTimezone",
+        elevation="GoogleElevationQuery",
+        places="GooglePlacesQuery",
+    ),
+    "mapzen": ProviderMethods(
+        "mapzen",
+        geocode="MapzenQuery",
+        reverse="MapzenReverse",
+    ),
+    "komoot": ProviderMethods(
+        "komoot",
+        geocode="KomootQuery",
+        reverse="KomootReverse",
+    ),
+    "tamu": ProviderMethods(
+        "tamu",
+        geocode="TamuQuery",
+    ),
+    "geocodefarm": ProviderMethods(
+        "geocodefarm",
+        geocode="GeocodeFarmQuery",
+        reverse="GeocodeFarmReverse",
+    ),
+    "uscensus": ProviderMethods(
+        "uscensus",
+        geocode="USCensusQuery",
+        reverse="USCensusReverse",
+        batch="USCensusBatch",
+    ),
+    "locationiq": ProviderMethods(
+        "locationiq",
+        geocode="LocationIQQuery",
+        reverse="LocationIQReverse",
+    ),
+    "gisgraphy": ProviderMethods(
+        "gisgraphy",
+        geocode="GisgraphyQuery",
+        reverse="GisgraphyReverse",
+    ),
+    "geocodexyz": ProviderMethods(
+        "geocodexyz",
+        geocode="GeocodeXYZQuery",
+    ),
+    "ipfinder": ProviderMethods(
+        "ipfinder",
+        geocode="IpfinderQuery",
+    ),
 }
 
 
@@ -194,7 +207,9 @@ def get_results(query, provider: str = "osm", method: str = "geocode", **kwargs)
     :param query: Location, locations list, or ip you want to geocode.
     :param provider: The geocoding engine you want to use.
     :param method: Any provider's supported request method.
-    :param kwargs: Any other provider related options.
+    :param kwargs: Any other provider related options. For example ``fields`` list
+        of needed result properties, that reduces provider answer size, when
+        provider supports it, and limits parsing to these properties.
     """
     provider = provider.lower().strip()
     method = method.lower().strip()
@@ -202,14 +217,49 @@ def get_results(query, provider: str = "osm", method: str = "geocode", **kwargs)
     if not isinstance(query, str) and method == "geocode":
         raise ValueError("Query should be a string")
 
+    provider_instance = get_query_class(provider, method)(query, **kwargs)
+    return provider_instance()
+
+
+def get_query_class(provider: str = "osm", method: str = "geocode") -> type:
+    """Return provider's query class for method
+
+    :param provider: The geocoding engine you want to use.
+    :param method: Any provider's supported request method.
+    :raises ValueError: On unknown provider or method
+    """
+    provider = provider.lower().strip()
+    method = method.lower().strip()
+
     if provider not in options:
         raise ValueError("Invalid provider")
 
     if method not in options[provider]:
         raise ValueError("Invalid method")
 
-    provider_instance = options[provider][method](query, **kwargs)
-    return provider_instance()
+    return options[provider][method]
+
+
+def prepare(
+    provider: str = "osm", method: str = "geocode", **kwargs
+) -> "PreparedQuery":
+    """Return reusable query, that do all per-provider setup only once
+
+    Provider and method validation, api key resolution, headers and provider options
+    setup are done on preparation. Returned :class:`geocoder.base.PreparedQuery` is
+    thread-safe callable, that accepts location only.
+
+        >>> import geocoder
+        >>> osm = geocoder.prepare("osm", max_results=3)
+        >>> [osm(address).latlng for address in ["Ottawa", "Toronto"]]
+
+    :param provider: The geocoding engine you want to use.
+    :param method: Any provider's supported request method.
+    :param kwargs: Any other provider related options.
+    """
+    from geocoder.base import PreparedQuery
+
+    return PreparedQuery(get_query_class(provider, method), **kwargs)
 
 
 def distance(*locations, units: str = "kilometers", **kwargs):
@@ -469,7 +519,7 @@ def mapquest(query, method: str = "geocode", **kwargs):
     return get_results(query, provider="mapquest", method=method, **kwargs)
 
 
-def osm(query, method: str = "geocode", **kwargs) -> OsmQuery:
+def osm(query, method: str = "geocode", **kwargs) -> "OsmQuery":
     """OSM Provider
 
     Provider supported methods:
@@ -0,0 +1,208 @@
+"""
+Compressed archive of raw provider responses.
+
+Each request, made with ``archive`` parameter, is stored as one NDJSON line with
+request parameters (credentials redacted), status code, timing and raw provider
+payload. Archived payloads can be parsed again at any time without network access
+with :func:`replay`, for example after result class received new fields or parsing
+fixes.
+
+Segments are compressed with zstd, when :mod:`zstandard` is installed, and with gzip
+otherwise.
+"""
+__all__ = ["ResponseArchive", "read_archive", "replay"]
+
+import base64
+import gzip
+import logging
+import os
+import threading
+import time
+import uuid
+from typing import Iterator, Optional
+
+from geocoder import jsonlib
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+EXTENSIONS = {"zstd": ".ndjson.zst", "gzip": ".ndjson.gz", "none": ".ndjson"}
+
+
+def _default(value):
+    """Make query params with uploaded files (batch providers) JSON serializable"""
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="replace")
+    return str(value)
+
+
+class ResponseArchive(object):
+    """Thread-safe writer of raw provider responses to compressed NDJSON segments
+
+    :param str directory: Directory for archive segments, created if not exists.
+    :param int segment_size: Number of entries in one segment file, before new
+        segment is started.
+    :param Optional[str] compression: One of ``zstd``, ``gzip`` or ``none``. By
+        default ``zstd`` is used, when :mod:`zstandard` is installed, ``gzip``
+        otherwise.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        segment_size: int = 10000,
+        compression: Optional[str] = None,
+    ):
+        compression = compression or ("zstd" if zstandard else "gzip")
+        if compression not in EXTENSIONS:
+            raise ValueError(f"Unknown compression. Got {compression}")
+        if compression == "zstd" and zstandard is None:
+            raise ValueError("zstd compression requires 'zstandard' package")
+
+        self.directory = directory
+        self.segment_size = segment_size
+        self.compression = compression
+
+        self._lock = threading.Lock()
+        self._file = None
+        self._stream = None
+        self._entries = 0
+        self._segments = 0
+        # archives of one process or restarted one with same pid never share names
+        self._name = uuid.uuid4().hex[:8]
+        os.makedirs(directory, exist_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _open_segment(self):
+        self._segments += 1
+        name = "{0}-{1}-{2}-{3:05d}{4}".format(
+            time.strftime("%Y%m%dT%H%M%S"),
+            os.getpid(),
+            self._name,
+            self._segments,
+            EXTENSIONS[self.compression],
+        )
+        path = os.path.join(self.directory, name)
+        # recorded data is never truncated
+        self._file = open(path, "xb")
+        if self.compression == "zstd":
+            self._stream = zstandard.ZstdCompressor().stream_writer(self._file)
+        elif self.compression == "gzip":
+            self._stream = gzip.GzipFile(fileobj=self._file, mode="wb")
+        else:
+            self._stream = self._file
+        self._entries = 0
+        logger.debug("Started archive segment %s", path)
+
+    def _close_segment(self):
+        if self._stream is not self._file:
+            self._stream.close()
+        self._file.close()
+        self._file = self._stream = None
+
+    def record(self, query, payload, elapsed: float):
+        """Store one provider answer
+
+        :param MultipleResultsQuery query: Query, that made the request
+        :param payload: Raw provider answer, JSON or bytes for batch providers
+        :param float elapsed: Request duration in seconds
+        """
+        entry = {
+            "timestamp": time.time(),
+            "provider": query._PROVIDER,
+            "method": query._METHOD,
+            "location": query.location,
+            "url": query.url,
+            "params": query.redacted_params,
+            "status_code": query.status_code,
+            "elapsed": elapsed,
+        }
+        if isinstance(payload, bytes):
+            entry["payload_b64"] = base64.b64encode(payload).decode("ascii")
+        else:
+            entry["payload"] = payload
+        line = jsonlib.dumpb(entry, default=_default) + b"\n"
+
+        with self._lock:
+            if self._file is None or self._entries >= self.segment_size:
+                if self._file is not None:
+                    self._close_segment()
+                self._open_segment()
+            self._stream.write(line)
+            self._entries += 1
+
+    def close(self):
+        """Finalize current segment. Archive can be used again after closing."""
+        with self._lock:
+            if self._file is not None:
+                self._close_segment()
+
+
+def _read_lines(path: str) -> Iterator[bytes]:
+    if path.endswith(EXTENSIONS["zstd"]):
+        if zstandard is None:
+            raise ValueError(f"Cannot read {path} without 'zstandard' package")
+        with open(path, "rb") as fh:
+            tail = b""
+            for chunk in zstandard.ZstdDecompressor().read_to_iter(fh):
+                lines = (tail + chunk).split(b"\n")
+                tail = lines.pop()
+                yield from lines
+            if tail:
+                yield tail
+    elif path.endswith(EXTENSIONS["gzip"]):
+        with gzip.open(path, "rb") as fh:
+            yield from fh
+    else:
+        with open(path, "rb") as fh:
+            yield from fh
+
+
+def read_archive(directory: str) -> Iterator[dict]:
+    """Iterate over all entries of archive in recording order
+
+    :param str directory: Directory with archive segments
+    """
+    segments = sorted(
+        name
+        for name in os.listdir(directory)
+        if any(name.endswith(extension) for extension in EXTENSIONS.values())
+    )
+    for name in segments:
+        for line in _read_lines(os.path.join(directory, name)):
+            if not line.strip():
+                continue
+            entry = jsonlib.loads(line)
+            if "payload_b64" in entry:
+                entry["payload"] = base64.b64decode(entry.pop("payload_b64"))
+            yield entry
+
+
+def replay(directory: str, **kwargs) -> Iterator:
+    """Rebuild results for all archived responses without network access
+
+    Each entry is parsed with current provider's implementation through
+    :func:`MultipleResultsQuery.from_raw`.
+
+    :param str directory: Directory with archive segments
+    :param kwargs: Any other keyword arguments, passed to provider on creation
+    """
+    from geocoder.api import options
+
+    for entry in read_archive(directory):
+        query_class = options[entry["provider"]][entry["method"]]
+        yield query_class.from_raw(
+            entry["payload"],
+            location=entry["location"],
+            status_code=entry["status_code"],
+            **kwargs,
+        )
@@ -2,20 +2,132 @@
 Base classes of provider definition responsible for minimum set of methods and
 properties, that should be implemented or overridden in all nested providers.
 """
-import json
+import codecs
 import logging
+import threading
+import time
 from abc import ABCMeta, abstractmethod
 from collections import OrderedDict
 from collections.abc import MutableSequence
-from typing import List, MutableMapping, Optional, Tuple, Union
+from email.message import Message
+from typing import (
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Union,
+)
 from urllib.parse import urlparse
 
 import requests
 
+from geocoder import hooks, jsonlib
 from geocoder.distance import Distance
+from geocoder.timings import QueryTimings
 
 logger = logging.getLogger(__name__)
 
+# streamed response bodies are read with chunks of this size
+_CHUNK_SIZE = 64 * 1024
+
+# marker of result in LazyResults, that is not built yet
+_UNBUILT = object()
+
+# default of parameters, for which None is meaningful value
+_DEFAULT = object()
+
+
+def _json_content(content: bytes, headers) -> Union[bytes, str]:
+    """Body decoded with declared charset, when it is not UTF-8 compatible
+
+    JSON libraries read UTF-8 bytes directly, other encodings are decoded to
+    :class:`str` first.
+    """
+    message = Message()
+    message["Content-Type"] = headers.get("Content-Type", "")
+    charset = message.get_content_charset()
+    if charset is None:
+        return content
+    try:
+        codec = codecs.lookup(charset).name
+    except LookupError:
+        return content
+    if codec in ("utf-8", "ascii"):
+        return content
+    return content.decode(codec)
+
+
+def _normalized_location(location) -> Union[str, tuple]:
+    """Comparison key of batch location: case and whitespace insensitive string,
+    or tuple of numbers for coordinates"""
+    if isinstance(location, str):
+        return " ".join(location.split()).casefold()
+    if isinstance(location, (list, tuple)):
+        try:
+            return tuple(float(value) for value in location)
+        except (TypeError, ValueError):
+            return tuple(_normalized_location(str(value)) for value in location)
+    return _normalized_location(str(location))
+
+
+def deduplicate_locations(locations: Iterable) -> Tuple[list, List[int]]:
+    """Unique batch locations and position of unique location for every input row
+
+    Locations are equal, when same after normalization, first occurrence is kept:
+
+        >>> deduplicate_locations(["Ottawa", "Toronto", " ottawa"])
+        (['Ottawa', 'Toronto'], [0, 1, 0])
+
+    :param Iterable locations: Batch locations, strings or coordinates
+    """
+    unique: list = []
+    positions: List[int] = []
+    seen: dict = {}
+    for location in locations:
+        key = _normalized_location(location)
+        position = seen.get(key)
+        if position is None:
+            position = seen[key] = len(unique)
+            unique.append(location)
+        positions.append(position)
+    return unique, positions
+
+
+class memoized_property(object):
+    """Read-only property, that is computed once per instance
+
+    Computed value is stored in instance ``__dict__`` under property name, so next
+    access does not call descriptor at all. Used for derived properties, that are
+    read many times during serialization. Values are not stored for results in lean
+    mode (see :func:`OneResult.make_lean`). Returned containers are shared between
+    callers and should be treated as read-only.
+
+    :param Callable fget: Property getter
+    """
+
+    def __init__(self, fget: Callable):
+        self.fget = fget
+        self.name = fget.__name__
+        self.__doc__ = fget.__doc__
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = self.fget(instance)
+        if not getattr(instance, "_lean", False):
+            instance.__dict__[self.name] = value
+        return value
+
+
+# OneResult properties, that describe result itself, not location
+_STATE_PROPERTIES = ("object_json", "fieldnames", "frozen", "lean")
+
 
 class OneResult(metaclass=ABCMeta):
     """Container for one (JSON) object returned by provider
@@ -35,9 +147,28 @@ class OneResult(metaclass=ABCMeta):
 
     :ivar self.object_raw_json: Raw json for object, passed by
         :func:`MultipleResultsQuery._parse_results`
-    :ivar self.object_json: Result of :func:`OneResult._parse_json_with_fieldnames`
+    :ivar self.object_json: Result of :func:`OneResult._parse_json_with_fieldnames`,
+        computed on first access
     :ivar self.fieldnames: Fieldnames list generated in
-        :func:`OneResult._parse_json_with_fieldnames`
+        :func:`OneResult._parse_json_with_fieldnames`, computed on first access
+
+    **Lean mode:**
+
+    After :func:`OneResult.make_lean` call :attr:`object_json` and
+    :attr:`fieldnames` are not kept in memory, but computed from
+    :attr:`object_raw_json` on each access. Only raw provider JSON, needed by
+    properties, is held by instance.
+
+    **Fields projection:**
+
+    After :func:`OneResult.project` call :attr:`object_json` and :attr:`fieldnames`
+    contain only requested fields, other properties are not evaluated.
+
+    **Immutable mode:**
+
+    After :func:`OneResult.freeze` call instance attributes cannot be changed, so
+    same instance can be shared between any number of callers and threads. Containers
+    returned by properties are shared as well, and should be treated as read-only.
 
     **Init parameters:**
 
@@ -46,6 +177,9 @@ class OneResult(metaclass=ABCMeta):
     """
 
     _GEOCODER3_READY = False
+    _frozen = False
+    _lean = False
+    _fields = None
     _TO_EXCLUDE = [
         "parse",
         "object_raw_json",
@@ -93,6 +227,11 @@ class OneResult(metaclass=ABCMeta):
         "method",
         "geometry",
         "session",
+        "freeze",
+        "frozen",
+        "make_lean",
+        "lean",
+        "project",
     ]
 
     def __init__(self, json_content):
@@ -102,10 +241,80 @@ class OneResult(metaclass=ABCMeta):
             :func:`MultipleResultsQuery.__call__`
         """
         self.object_raw_json = json_content
-        # attributes returned in JSON format
-        self.fieldnames = []
-        self.object_json = {}
-        self._parse_json_with_fieldnames()
+        # attributes returned in JSON format, parsed on first access
+        self._fieldnames = None
+        self._object_json = None
+
+    def __setattr__(self, name, value):
+        if self._frozen:
+            raise AttributeError(f"Cannot set '{name}' of frozen {type(self).__name__}")
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name):
+        if self._frozen:
+            raise AttributeError(
+                f"Cannot delete '{name}' of frozen {type(self).__name__}"
+            )
+        super().__delattr__(name)
+
+    def freeze(self):
+        """Switch instance to immutable mode and return it"""
+        if not self._lean:
+            # parse once before sharing, instead of in concurrent readers
+            self._parse_json_with_fieldnames()
+        object.__setattr__(self, "_frozen", True)
+        return self
+
+    @property
+    def frozen(self) -> bool:
+        """Status of immutable mode, see :func:`freeze`"""
+        return self._frozen
+
+    def make_lean(self):
+        """Switch instance to lean mode and return it, see class documentation"""
+        if self._frozen:
+            raise AttributeError(f"Cannot make frozen {type(self).__name__} lean")
+        object.__setattr__(self, "_lean", True)
+        object.__setattr__(self, "_fieldnames", None)
+        object.__setattr__(self, "_object_json", None)
+        # drop values of already computed memoized properties
+        for cls in type(self).__mro__:
+            for name, value in vars(cls).items():
+                if isinstance(value, memoized_property):
+                    self.__dict__.pop(name, None)
+        return self
+
+    @property
+    def lean(self) -> bool:
+        """Status of lean mode, see :func:`make_lean`"""
+        return self._lean
+
+    def project(self, fields: Iterable[str]):
+        """Limit :attr:`object_json` and :attr:`fieldnames` to fields and return
+        instance
+
+        :param Iterable[str] fields: Names of result properties
+        """
+        if self._frozen:
+            raise AttributeError(f"Cannot project frozen {type(self).__name__}")
+        object.__setattr__(self, "_fields", tuple(fields))
+        object.__setattr__(self, "_fieldnames", None)
+        object.__setattr__(self, "_object_json", None)
+        return self
+
+    @property
+    def object_json(self) -> dict:
+        """Cleaned json with all non-empty result fields and ``ok`` status"""
+        if self._object_json is None:
+            return self._parse_json_with_fieldnames()[1]
+        return self._object_json
+
+    @property
+    def fieldnames(self) -> List[str]:
+        """Names of all result fields, see :func:`_parse_json_with_fieldnames`"""
+        if self._fieldnames is None:
+            return self._parse_json_with_fieldnames()[0]
+        return self._fieldnames
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
@@ -150,12 +359,12 @@ class OneResult(metaclass=ABCMeta):
         """Return optional north coordinate of bbox, if available."""
         return self.bbox[3] if self.bbox else None
 
-    @property
+    @memoized_property
     def northeast(self) -> List[float]:
         """Return north-east list of coordinates for bounds, if available."""
         return [self.north, self.east] if self.bbox else []
 
-    @property
+    @memoized_property
     def southwest(self) -> List[float]:
         """Return south-west list of coordinates for bounds, if available."""
         return [self.south, self.west] if self.bbox else []
@@ -165,7 +374,7 @@ class OneResult(metaclass=ABCMeta):
         """Output answer as GeoJSON bbox if it can be calculated/retrieved."""
         return []
 
-    @property
+    @memoized_property
     def bounds(self) -> dict:
         """Output answer as Google Maps API bounds if it can be calculated/retrieved."""
         return (
@@ -187,19 +396,42 @@ class OneResult(metaclass=ABCMeta):
     def _parse_json_with_fieldnames(self):
         """Parse the instance object with all attributes/methods defined in the class,
         except for the ones defined starting with '_' or flagged in
-        :attr:`cls._TO_EXCLUDE`.
+        :attr:`cls._TO_EXCLUDE`. Projected instance parses only requested fields.
+
+        Properties, that provider does not support and that raise
+        :class:`NotImplementedError`, are left out.
 
         The final result is stored in :attr:`self.object_json` and
-        :attr:`self.fieldnames`
+        :attr:`self.fieldnames`, unless instance is in lean mode, and returned.
         """
-        for key in dir(self):
-            if not key.startswith("_") and key not in self._TO_EXCLUDE:
-                self.fieldnames.append(key)
+        if self._fields is None:
+            fieldnames = [
+                key
+                for key in dir(self)
+                if not key.startswith("_") and key not in self._TO_EXCLUDE
+            ]
+        else:
+            fieldnames = list(self._fields)
+
+        object_json = {}
+        unsupported = []
+        for key in fieldnames:
+            try:
                 value = getattr(self, key)
-                if value:
-                    self.object_json[key] = value
+            except NotImplementedError:
+                unsupported.append(key)
+                continue
+            if value:
+                object_json[key] = value
+        if unsupported:
+            fieldnames = [key for key in fieldnames if key not in unsupported]
         # Add OK attribute even if value is "False"
-        self.object_json["ok"] = self.ok
+        object_json["ok"] = self.ok
+
+        if not self._lean:
+            object.__setattr__(self, "_fieldnames", fieldnames)
+            object.__setattr__(self, "_object_json", object_json)
+        return fieldnames, object_json
 
     @property
     def ok(self) -> bool:
@@ -222,12 +454,12 @@ class OneResult(metaclass=ABCMeta):
         """Display debug information for instance of :class:`OneResult`"""
         logger.debug("From provider")
         logger.debug("-------------")
-        logger.debug(json.dumps(self.object_raw_json, indent=4))
+        logger.debug(jsonlib.dumps(self.object_raw_json, indent=4))
         logger.debug("Cleaned json")
         logger.debug("------------")
-        logger.debug(json.dumps(self.object_json, indent=4))
+        logger.debug(jsonlib.dumps(self.object_json, indent=4))
 
-    @property
+    @memoized_property
     def confidence(self) -> int:
         """Is as a measure of how confident we are that centre point coordinates
         returned for the result precisely reflect the result.
@@ -261,10 +493,13 @@ class OneResult(metaclass=ABCMeta):
 
     @property
     def geojson(self) -> dict:
-        """Output answer as GeoJSON Feature"""
+        """Output answer as GeoJSON Feature
+
+        Properties are copied from :attr:`object_json`, which is never changed.
+        """
         feature = {
             "type": "Feature",
-            "properties": self.object_json,
+            "properties": dict(self.object_json),
         }
         if self.bbox:
             feature["bbox"] = self.bbox
@@ -273,7 +508,7 @@ class OneResult(metaclass=ABCMeta):
             feature["geometry"] = self.geometry
         return feature
 
-    @property
+    @memoized_property
     def wkt(self) -> Optional[str]:
         """Output coordinates in well-known text format, no SRID data."""
         return f"POINT({self.x} {self.y})" if self.ok else None
@@ -299,6 +534,93 @@ class OneResult(metaclass=ABCMeta):
         return self.lng
 
 
+class LazyResults(MutableSequence):
+    """Results list, that builds :class:`OneResult` objects on first access
+
+    Holds adapted raw items from :func:`MultipleResultsQuery._adapt_results` and
+    creates result from item on first index or iteration access. Length is known
+    without any result creation. Results can be added, replaced and removed as in
+    usual list, until :func:`freeze` call.
+
+    :param Iterable items: Adapted raw items, one per result
+    :param Callable factory: Function, that creates result from raw item
+    """
+
+    def __init__(self, items: Iterable, factory: Callable[..., "OneResult"]):
+        self._items = list(items)
+        self._results = [_UNBUILT] * len(self._items)
+        self._factory = factory
+        self._frozen = False
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<LazyResults {self.built_count} of {len(self)} built>"
+
+    def _build(self, index: int) -> "OneResult":
+        with self._lock:
+            result = self._results[index]
+            if result is _UNBUILT:
+                result = self._factory(self._items[index])
+                self._results[index] = result
+                # raw item is held by result from now
+                self._items[index] = None
+        return result
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        result = self._results[index]
+        if result is _UNBUILT:
+            result = self._build(index)
+        return result
+
+    def __iter__(self) -> Iterator["OneResult"]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def _check_not_frozen(self):
+        if self._frozen:
+            raise TypeError("Frozen LazyResults does not support changes")
+
+    def __setitem__(self, index, value):
+        self._check_not_frozen()
+        if isinstance(index, slice):
+            value = list(value)
+            self._items[index] = [None] * len(value)
+        self._results[index] = value
+
+    def __delitem__(self, index):
+        self._check_not_frozen()
+        del self._results[index]
+        del self._items[index]
+
+    def insert(self, index: int, value):
+        self._check_not_frozen()
+        self._results.insert(index, value)
+        self._items.insert(index, None)
+
+    def freeze(self):
+        """Forbid results list changes and return it"""
+        self._frozen = True
+        return self
+
+    @property
+    def built_count(self) -> int:
+        """Number of already created results"""
+        return len(self._results) - self._results.count(_UNBUILT)
+
+    def built(self) -> List["OneResult"]:
+        """Already created results, without creation of others"""
+        return [result for result in self._results if result is not _UNBUILT]
+
+
+class ResponseTooLarge(requests.exceptions.RequestException):
+    """Provider answer body exceeds allowed ``max_body_size``"""
+
+
 class MultipleResultsQuery(MutableSequence):
     """Base results and query manager container
 
@@ -324,9 +646,18 @@ class MultipleResultsQuery(MutableSequence):
         :attr:`options` definition.
     :cvar float cls._TIMEOUT: Default timeout for :func:`requests.request`
         configuration, can be overwritten on instance creation or instance calling
+    :cvar bool cls._LEAN: Default of ``lean`` parameter for all instances.
+    :cvar tuple cls._LEAN_DROP: Instance attributes, that are dropped in lean mode
+        after results parsing.
+    :cvar Optional[int] cls._MAX_BODY_SIZE: Max size of decoded provider answer in
+        bytes, larger answers are aborted with :class:`ResponseTooLarge` error. Can be
+        overwritten with ``max_body_size`` parameter. `None` disables the check.
     :cvar bool cls._GEOCODER3_READY: Temporary value, representing is provider tested
         and finished migration to geocoder3. On default value will generate warning on
         any provider call.
+    :cvar frozenset cls._SECRET_PARAMS: Lowercase names of query parameters and headers,
+        that carry credentials and should never leave the process in clear text. Used
+        by :attr:`redacted_params`.
 
     **Instance variables:**
 
@@ -335,7 +666,8 @@ class MultipleResultsQuery(MutableSequence):
     implementation.
 
     :ivar list[OneResult] self.results_list: Hold all answers from provider in parsed
-        state
+        state. Filled by :func:`_parse_results` with :class:`LazyResults`, where
+        each result is created on first access.
     :ivar str self.url: Final request url that will be/was used during request
     :ivar str self.location: Object to geocode/reverse geocode
     :ivar float self.timeout: Final request timeout that was used during request
@@ -352,10 +684,34 @@ class MultipleResultsQuery(MutableSequence):
     :ivar Union[dict, list] self.raw_json: Contain raw :func:`requests.Response.json`
         from provider
     :ivar str self.error: :mod:`requests` detailed error, if was raised during request
+    :ivar Optional[Exception] self.exception: Exception, caught during request
+    :ivar int self.response_size: Size of all read response bodies in bytes
     :ivar bool self.is_called: `False` on instance initialization, become `True` after
         calling of :func:`__call__` method(i.e. instance call)
     :ivar OneResult self.current_result: Mapping to result, that are used for direct
         attributes retrieval in :func:`__getattr__`
+    :ivar Optional[ResponseArchive] self.archive: Archive, where raw provider payload
+        is stored after each request, if configured
+    :ivar Optional[int] self.max_body_size: Final max size of provider answer in bytes
+    :ivar Optional[tuple] self.fields: Requested result fields, see
+        :func:`_build_field_params`
+    :ivar QueryTimings self.timings: Timing breakdown of last call, see
+        :class:`geocoder.timings.QueryTimings`
+
+    **Immutable mode:**
+
+    When created with ``frozen=True`` instance and all its results are switched to
+    immutable mode right after results parsing (see :func:`freeze`). Such instance
+    can be cached and shared between any number of callers and threads without
+    copying.
+
+    **Lean mode:**
+
+    When created with ``lean=True`` instance drops :attr:`raw_response`,
+    :attr:`raw_json`, session reference and all other attributes from
+    :attr:`_LEAN_DROP` right after results parsing, and switches all results to lean
+    mode (see :func:`OneResult.make_lean`). Only raw JSON of each result, needed by
+    result properties, is kept. Useful for long-lived results collections.
 
     **Init parameters:**
 
@@ -370,7 +726,28 @@ class MultipleResultsQuery(MutableSequence):
     _METHOD = None
     _PROVIDER = None
     _TIMEOUT = 5.0
+    _MAX_BODY_SIZE = 16 * 1024 * 1024
+    _LEAN = False
+    _LEAN_DROP = ("raw_response", "raw_json", "session")
     _GEOCODER3_READY = False
+    _frozen = False
+    _SECRET_PARAMS = frozenset(
+        [
+            "access_token",
+            "ak",
+            "api_key",
+            "apikey",
+            "app_code",
+            "app_id",
+            "authorization",
+            "client",
+            "key",
+            "keystr",
+            "signature",
+            "sn",
+            "username",
+        ]
+    )
 
     @staticmethod
     def _is_valid_url(url: Optional[str]) -> bool:
@@ -461,6 +838,11 @@ class MultipleResultsQuery(MutableSequence):
         session: Optional[requests.Session] = None,
         headers: Optional[MutableMapping[str, str]] = None,
         params: Optional[dict] = None,
+        archive=None,
+        frozen: bool = False,
+        max_body_size: Optional[int] = _DEFAULT,
+        lean: Optional[bool] = None,
+        fields: Optional[Iterable[str]] = None,
         **kwargs,
     ):
         """Initialize a :class:`MultipleResultsQuery` object.
@@ -477,21 +859,66 @@ class MultipleResultsQuery(MutableSequence):
             Max request answer wait time
         :param Optional[MutableMapping[str, str]] proxies:
             Proxies for :func:`requests.request`
-        :param Optional[requests.Session] session: Custom :class:`requests.Session` for
-            request
+        :param Optional[requests.Session] session: Custom :class:`requests.Session` or
+            any other transport from :mod:`geocoder.transport` for request
         :param Optional[MutableMapping[str, str]] headers: Additional headers for
             :func:`requests.request`
         :param Optional[dict] params: Additional query parameters
+        :param Optional[ResponseArchive] archive: Store raw provider payload of each
+            request in :class:`geocoder.archive.ResponseArchive` for offline re-parse
+        :param bool frozen: Switch instance to immutable mode after results parsing
+        :param Optional[int] max_body_size: Overwrite for provider's max answer size
+            in bytes, `None` disables the check
+        :param Optional[bool] lean: Drop raw response and duplicated payloads after
+            results parsing, :attr:`_LEAN` by default
+        :param Optional[Iterable[str]] fields: Names of result properties, that are
+            needed. Mapped to provider's parameters, that reduce answer size, and
+            limit :attr:`OneResult.object_json` of all results.
         :param kwargs: Any other keyword arguments, that will be passed to internal
             :func:`_build_headers`, :func:`_build_params`, :func:`_before_initialize` or
             other custom provider's implementation methods. Check exact provider docs
 
         :raises ValueError: When provided custom :attr:`url` is not well-formatted
         :raises ValueError: If api key was not provided, but mandatory for provider use
+        :raises ValueError: If requested field is not provider's result property
         """
         super(MultipleResultsQuery, self).__init__()
-        self.results_list = []
+        self._setup(
+            url=url,
+            key=key,
+            timeout=timeout,
+            proxies=proxies,
+            session=session,
+            headers=headers,
+            archive=archive,
+            frozen=frozen,
+            max_body_size=max_body_size,
+            lean=lean,
+            fields=fields,
+            **kwargs,
+        )
+        self._bind(location, params)
+
+    def _setup(
+        self,
+        url: Optional[str] = None,
+        key: Optional[str] = None,
+        timeout: Union[None, float, Tuple[float, float], Tuple[float, None]] = None,
+        proxies: Optional[MutableMapping[str, str]] = None,
+        session: Optional[requests.Session] = None,
+        headers: Optional[MutableMapping[str, str]] = None,
+        archive=None,
+        frozen: bool = False,
+        max_body_size: Optional[int] = _DEFAULT,
+        lean: Optional[bool] = None,
+        fields: Optional[Iterable[str]] = None,
+        **kwargs,
+    ):
+        """Location independent part of initialization
 
+        Done once per :class:`PreparedQuery`, or on each :func:`__init__` call.
+        Parameters are same as in :func:`__init__`.
+        """
         # Check url if it was changed on instance creation
         if url and not self._is_valid_url(url):
             raise ValueError(f"url not valid. Got {url}")
@@ -500,34 +927,132 @@ class MultipleResultsQuery(MutableSequence):
         # check validity of provider key
         provider_key = self._KEY = self._get_api_key(key=key)
 
-        # point to geocode, as a string or coordinates
-        self.location = location
-
         # set attributes to manage query. Can be overwritten in __call__
         self.timeout = timeout or self._TIMEOUT
         self.proxies = proxies
         self.session = session
+        self.archive = archive
+        self.max_body_size = (
+            self._MAX_BODY_SIZE if max_body_size is _DEFAULT else max_body_size
+        )
+        self._freeze_on_parse = frozen
+        self._lean_on_parse = self._LEAN if lean is None else lean
+
+        # requested result fields and provider params, that limit answer to them
+        self.fields = self._validate_fields(fields)
+        self._field_params = (
+            {} if self.fields is None else self._build_field_params(self.fields)
+        )
+        # provider related options for _build_params and _before_initialize
+        self._options = kwargs
 
         # headers can be overwritten in _build_headers,
         # headers can be extended with headers keyword argument
         self.headers = self._build_headers(provider_key, **kwargs).copy()
         self.headers.update(headers or {})
+
+    def _bind(self, location, params: Optional[dict] = None):
+        """Location dependent part of initialization
+
+        :param location: Query content for geocode or reverse geocoding
+        :param Optional[dict] params: Additional query parameters
+        """
+        self.results_list = []
+
+        # point to geocode, as a string or coordinates
+        self.location = location
+
         # params can be overwritten in _build_params
         # params can be extended with params keyword argument
         # OrderedDict in order to preserve the order of the url query parameters
-        self.params = OrderedDict(self._build_params(location, provider_key, **kwargs))
+        self.params = OrderedDict(
+            self._build_params(location, self._KEY, **self._options)
+        )
+        self.params.update(self._field_params)
         self.params.update(params or {})
 
         # results of query (set by __call__ and _connect)
+        self.timings = QueryTimings()
         self.status_code = None
         self.raw_response = None
         self.raw_json = None
         self.error = None
+        self.exception = None
+        self.response_size = 0
         self.is_called = False
 
         # pointer to result where to delegate calls
         self.current_result = None
-        self._before_initialize(location, **kwargs)
+        self._before_initialize(location, **self._options)
+
+    def __setattr__(self, name, value):
+        if self._frozen:
+            raise AttributeError(f"Cannot set '{name}' of frozen {type(self).__name__}")
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name):
+        if self._frozen:
+            raise AttributeError(
+                f"Cannot delete '{name}' of frozen {type(self).__name__}"
+            )
+        super().__delattr__(name)
+
+    def _check_not_frozen(self):
+        if self._frozen:
+            raise TypeError(f"Frozen {type(self).__name__} does not support changes")
+
+    def freeze(self):
+        """Switch instance and all its results to immutable mode and return it
+
+        Results of :class:`LazyResults`, that are not created yet, are frozen on
+        creation.
+        """
+        for result in self._built_results():
+            result.freeze()
+        if isinstance(self.results_list, LazyResults):
+            self.results_list.freeze()
+        else:
+            self.results_list = tuple(self.results_list)
+        object.__setattr__(self, "_frozen", True)
+        return self
+
+    @property
+    def frozen(self) -> bool:
+        """Status of immutable mode, see :func:`freeze`"""
+        return self._frozen
+
+    def make_lean(self):
+        """Drop :attr:`_LEAN_DROP` attributes, switch all results to lean mode and
+        return instance
+        """
+        self._check_not_frozen()
+        self._lean_on_parse = True
+        for result in self._built_results():
+            result.make_lean()
+        for name in self._LEAN_DROP:
+            object.__setattr__(self, name, None)
+        return self
+
+    def _built_results(self) -> List["OneResult"]:
+        """Results, that are already created, without creation of lazy ones"""
+        if isinstance(self.results_list, LazyResults):
+            return self.results_list.built()
+        return list(self.results_list)
+
+    def _build_result(self, json_dict) -> "OneResult":
+        """Create result from adapted raw item in current instance modes
+
+        Used as :class:`LazyResults` factory, so fields projection, lean and
+        immutable modes are applied to results created after parsing too.
+        """
+        result = self._RESULT_CLASS(json_dict)
+        if self.fields is not None:
+            result.project(self.fields)
+        if self._lean_on_parse:
+            result.make_lean()
+        if self._frozen:
+            result.freeze()
+        return result
 
     def __getitem__(self, key):
         """Special method implementation for custom :class:`MutableSequence` subclass
@@ -541,6 +1066,7 @@ class MultipleResultsQuery(MutableSequence):
 
         Not expected to be nested or changed in subclasses.
         """
+        self._check_not_frozen()
         self.results_list[key] = value
 
     def __delitem__(self, key):
@@ -548,6 +1074,7 @@ class MultipleResultsQuery(MutableSequence):
 
         Not expected to be nested or changed in subclasses.
         """
+        self._check_not_frozen()
         del self.results_list[key]
 
     def __len__(self):
@@ -562,6 +1089,7 @@ class MultipleResultsQuery(MutableSequence):
 
         Not expected to be nested or changed in subclasses.
         """
+        self._check_not_frozen()
         self.results_list.insert(index, value)
 
     def add(self, value):
@@ -569,6 +1097,7 @@ class MultipleResultsQuery(MutableSequence):
 
         Not expected to be nested or changed in subclasses.
         """
+        self._check_not_frozen()
         self.results_list.append(value)
 
     def __repr__(self) -> str:
@@ -600,6 +1129,66 @@ class MultipleResultsQuery(MutableSequence):
         """
         return {}
 
+    @classmethod
+    def _validate_fields(cls, fields: Optional[Iterable[str]]) -> Optional[tuple]:
+        """Check that all requested fields are public properties of result class
+
+        Methods, like :func:`OneResult.freeze`, and result state properties, like
+        :attr:`OneResult.object_json`, are not fields.
+
+        :raises ValueError: On unknown field
+        """
+        if fields is None:
+            return None
+        fields = (fields,) if isinstance(fields, str) else tuple(fields)
+        unknown = [
+            name
+            for name in fields
+            if name.startswith("_")
+            or name in _STATE_PROPERTIES
+            or not isinstance(
+                getattr(cls._RESULT_CLASS, name, None), (property, memoized_property)
+            )
+        ]
+        if unknown:
+            raise ValueError(
+                f"Unknown {cls._RESULT_CLASS.__name__} fields. Got {unknown}"
+            )
+        return fields
+
+    def _build_field_params(self, fields: tuple) -> dict:
+        """Generate provider query parameters, that limit answer to requested fields
+
+        Called once on instance setup, when ``fields`` parameter is set. Result
+        overwrites :func:`_build_params` output.
+
+        :param tuple fields: Validated names of requested result properties
+        """
+        return {}
+
+    def _deduplicate_batch(self, locations, enabled: bool = True) -> list:
+        """Collapse duplicated batch locations before upload
+
+        Sets :attr:`locations_length` to number of input rows and
+        :attr:`batch_positions` to uploaded row index for every input row, that
+        is used to fan results out back to all input rows.
+
+        :param locations: Batch locations
+        :param bool enabled: Upload all rows as is, when disabled
+        """
+        self.locations_length = len(locations)
+        if not enabled:
+            self.batch_positions = list(range(len(locations)))
+            return locations
+        unique, self.batch_positions = deduplicate_locations(locations)
+        if len(unique) < len(locations):
+            logger.debug(
+                "Batch of %s locations deduplicated to %s",
+                len(locations),
+                len(unique),
+            )
+        return unique
+
     def _before_initialize(self, location, **kwargs):
         """Hook for children class to finalize their setup before the query
 
@@ -623,8 +1212,8 @@ class MultipleResultsQuery(MutableSequence):
             Max request answer wait time
         :param Optional[MutableMapping[str, str]] proxies:
             Proxies for :func:`requests.request`
-        :param Optional[requests.Session] session: Custom :class:`requests.Session` for
-            request
+        :param Optional[requests.Session] session: Custom :class:`requests.Session` or
+            any other transport from :mod:`geocoder.transport` for request
         """
         self.is_called = True
         if self._GEOCODER3_READY is False:
@@ -636,15 +1225,29 @@ class MultipleResultsQuery(MutableSequence):
         self.timeout = timeout or self.timeout
         self.proxies = proxies or self.proxies
         self.session = session or self.session or requests.Session()
+        self.timings = QueryTimings()
+        self.response_size = 0
 
         # query URL and get valid JSON (also stored in self.raw_json)
+        if hooks.has_subscribers("before_request"):
+            # redacted params are built only for subscribers
+            params = self.redacted_params
+            hooks.emit("before_request", self, url=self.url, params=params)
+        started = time.perf_counter()
         json_response = self._connect()
+        elapsed = time.perf_counter() - started
+        if isinstance(self.status_code, int):
+            hooks.emit(
+                "after_response",
+                self,
+                status_code=self.status_code,
+                response=self.raw_response,
+            )
 
-        # catch errors and debug warnings
-        has_error = (
-            self._catch_errors(json_response) if json_response is not None else True
-        )
-        if self.url not in self.raw_response.url:
+        if self.archive is not None and json_response not in (None, False):
+            self.archive.record(self, json_response, elapsed)
+
+        if self.raw_response is not None and self.url not in self.raw_response.url:
             logger.warning(
                 "Expected request url (%s) and final request url (%s) do not match. "
                 "Probably redirects was made.",
@@ -652,33 +1255,103 @@ class MultipleResultsQuery(MutableSequence):
                 self.raw_response.url,
             )
 
-        # creates instance for results
-        if not has_error:
-            self._parse_results(json_response)
-
+        self._process_response(json_response)
+        self.timings.total = time.perf_counter() - started
+        if self.error:
+            hooks.emit("on_error", self, error=self.error, exception=self.exception)
+        hooks.emit("after_call", self)
         return self
 
+    @classmethod
+    def from_raw(
+        cls,
+        payload,
+        location=None,
+        status_code: Optional[int] = 200,
+        **kwargs,
+    ):
+        """Rebuild query results from previously retrieved provider payload
+
+        No external request is made. Payload passed through :func:`_catch_errors`,
+        :func:`_adapt_results` and :func:`_parse_results` exactly as after
+        :func:`_connect`, so results always reflect current result class parsing.
+
+        :param payload: Raw provider answer, as stored in :attr:`raw_json` (or raw
+            bytes for batch providers)
+        :param location: Original query content. Required by providers, that build
+            url or params from location (reverse, batch)
+        :param Optional[int] status_code: HTTP status code of original answer
+        :param kwargs: Any other keyword arguments of :func:`__init__`. When api key
+            is not provided, placeholder used, as key is never sent anywhere.
+        """
+        kwargs.setdefault("key", cls._KEY or "offline")
+        instance = cls(location, **kwargs)
+        instance.is_called = True
+        instance.status_code = status_code
+        instance.raw_json = payload
+        instance._process_response(payload)
+        return instance
+
+    def _process_response(self, json_response):
+        """Check provider answer for errors and parse it to results
+
+        :param json_response: Payload returned by :func:`_connect`, or `None`/`False`
+            when request failed
+        """
+        # catch errors and debug warnings
+        timings = self.timings
+        with timings.measure("catch_errors"):
+            has_error = (
+                self._catch_errors(json_response) if json_response is not None else True
+            )
+
+        # creates instance for results, adapt time is measured separately
+        if not has_error:
+            adapt = timings.adapt or 0.0
+            with timings.measure("parse"):
+                self._parse_results(json_response)
+            timings.parse -= (timings.adapt or 0.0) - adapt
+            hooks.emit("on_parse_complete", self, count=len(self))
+
+        if self.fields is not None:
+            for result in self._built_results():
+                result.project(self.fields)
+        if self._lean_on_parse:
+            self.make_lean()
+        if self._freeze_on_parse:
+            self.freeze()
+
     def _connect(self) -> Union[list, dict, None]:
         """Responsible for handling external request and connection errors"""
         try:
             # make request and get response
+            started = time.perf_counter()
             self.raw_response = self.rate_limited_get(
                 self.url,
                 params=self.params,
                 headers=self.headers,
                 timeout=self.timeout,
                 proxies=self.proxies,
+                stream=True,
+            )
+            self.timings.record_response(
+                self.raw_response, time.perf_counter() - started
             )
             logger.info("Requested %s", self.raw_response.url)
 
-            # check that response is ok
+            # check that response is ok, body is read first to keep connection
             self.status_code = self.raw_response.status_code
+            content = self._read_body(self.raw_response)
             self.raw_response.raise_for_status()
 
-            # rely on json method to get non-empty well formatted JSON
-            self.raw_json = self.raw_response.json()
-        except requests.exceptions.RequestException as err:
+            # decode non-empty well formatted JSON directly from response bytes
+            with self.timings.measure("decode"):
+                self.raw_json = jsonlib.loads(
+                    _json_content(content, self.raw_response.headers)
+                )
+        except (requests.exceptions.RequestException, ValueError) as err:
             # store real status code and error
+            self.exception = err
             self.error = f"ERROR - {str(err)}"
             logger.error(
                 "Status code %s from %s: %s", self.status_code, self.url, self.error
@@ -688,6 +1361,53 @@ class MultipleResultsQuery(MutableSequence):
         # return response within its JSON format
         return self.raw_json
 
+    def _read_body(self, response) -> bytes:
+        """Read streamed response body, aborting on :attr:`max_body_size` excess
+
+        Declared ``Content-Length`` is checked before download. Body of declared
+        size without content encoding is read with one chunk, that is kept without
+        copy. Other bodies are read with chunks and counted after content decoding,
+        so compressed bombs are stopped too. Read body is kept as response content.
+
+        :param requests.Response response: Response, requested with ``stream=True``
+        :raises ResponseTooLarge: When body exceeds :attr:`max_body_size`
+        """
+        limit = self.max_body_size
+        started = time.perf_counter()
+        try:
+            if limit is None:
+                self.response_size += len(response.content)
+                return response.content
+
+            declared = response.headers.get("Content-Length", "")
+            if declared.isdigit() and int(declared) > limit:
+                raise ResponseTooLarge(
+                    f"Declared response size {declared} bytes exceeds "
+                    f"max_body_size of {limit} bytes",
+                    response=response,
+                )
+
+            chunk_size = _CHUNK_SIZE
+            if declared.isdigit() and "Content-Encoding" not in response.headers:
+                chunk_size = max(int(declared), 1)
+            chunks = []
+            size = 0
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                chunks.append(chunk)
+                size += len(chunk)
+                if size > limit:
+                    raise ResponseTooLarge(
+                        f"Response body exceeds max_body_size of {limit} bytes",
+                        response=response,
+                    )
+            response._content = chunks[0] if len(chunks) == 1 else b"".join(chunks)
+            self.response_size += size
+            return response._content
+        finally:
+            # release connection to pool, or drop it on aborted download
+            response.close()
+            self.timings.add("download", time.perf_counter() - started)
+
     def rate_limited_get(self, url, **kwargs):
         """By default, simply wraps a :func:`requests.get` request"""
         return self.session.get(url, **kwargs)
@@ -706,9 +1426,12 @@ class MultipleResultsQuery(MutableSequence):
     def _parse_results(self, json_response: Union[dict, List[dict]]):
         """Responsible for parsing original json and separating it to
         :class:`OneResult` objects
+
+        Results are stored in :class:`LazyResults` and created on first access.
         """
-        for json_dict in self._adapt_results(json_response):
-            self.add(self._RESULT_CLASS(json_dict))
+        with self.timings.measure("adapt"):
+            items = self._adapt_results(json_response)
+        self.results_list = LazyResults(items, self._build_result)
 
         # set default result to use for delegation
         self.current_result = len(self) > 0 and self[0]
@@ -753,6 +1476,48 @@ class MultipleResultsQuery(MutableSequence):
         else:
             return "ERROR - Unhandled Exception"
 
+    @property
+    def outcome(self) -> str:
+        """Short machine-readable status of last call, used as metrics label
+
+        **Possible outcomes:**
+
+        - "not_called" - when request was not made yet
+        - "ok" - when any result retrieved
+        - "timeout" - when connect or read timeout happened
+        - "http_error" - when provider answered with 4xx or 5xx HTTP status
+        - "error" - on any other connection, decoding or provider error
+        - "no_results" - when request succeeded without results
+        """
+        if not self.is_called:
+            return "not_called"
+        elif len(self) > 0:
+            return "ok"
+        elif isinstance(self.exception, requests.exceptions.Timeout):
+            return "timeout"
+        elif isinstance(self.status_code, int) and self.status_code >= 400:
+            return "http_error"
+        elif self.error:
+            return "error"
+        return "no_results"
+
+    @property
+    def redacted_params(self) -> dict:
+        """Final request query params with credentials masked
+
+        Suitable for logging, archiving or any other data, leaving the process.
+        """
+        secrets = {self._KEY} if isinstance(self._KEY, str) else set()
+        return {
+            name: (
+                "<redacted>"
+                if str(name).lower() in self._SECRET_PARAMS
+                or (isinstance(value, str) and value in secrets)
+                else value
+            )
+            for name, value in self.params.items()
+        }
+
     @property
     def geojson(self) -> dict:
         """Output all answers as GeoJSON FeatureCollection"""
@@ -794,3 +1559,72 @@ class MultipleResultsQuery(MutableSequence):
             :attr:`current_result` is still empty. (From :func:`has_data`)
         """
         return None if not self.has_data else getattr(self.current_result, name)
+
+
+class PreparedQuery(object):
+    """Reusable query of one provider method
+
+    All location independent work (url validation, api key resolution, headers and
+    provider options setup) is done once on creation. Each call only binds location
+    to new :class:`MultipleResultsQuery` instance and makes the request, so prepared
+    query can be shared between threads.
+
+    Usually created with :func:`geocoder.prepare`.
+
+        >>> import geocoder
+        >>> osm = geocoder.prepare("osm", max_results=3)
+        >>> g = osm("Ottawa, Ontario")
+
+    :param query_class: Provider's :class:`MultipleResultsQuery` subclass
+    :param Optional[dict] params: Additional query parameters for each request
+    :param kwargs: Any other keyword arguments of :func:`MultipleResultsQuery.__init__`
+    """
+
+    # dictionaries of prepared state, that can be changed by bound query
+    _MUTABLE_STATE = ("headers", "proxies", "_options", "_field_params")
+
+    def __init__(self, query_class, params: Optional[dict] = None, **kwargs):
+        self.query_class = query_class
+        self.params = params
+
+        template = query_class.__new__(query_class)
+        template._setup(**kwargs)
+        self._state = dict(template.__dict__)
+
+    def __repr__(self) -> str:
+        return "<PreparedQuery {0} - {1}>".format(
+            self.query_class._PROVIDER.title(), self.query_class._METHOD.title()
+        )
+
+    def bind(self, location) -> MultipleResultsQuery:
+        """Create query for location without making external request
+
+        :param location: Query content for geocode or reverse geocoding
+        """
+        if self.query_class._METHOD == "geocode" and not isinstance(location, str):
+            raise ValueError("Query should be a string")
+
+        query = self.query_class.__new__(self.query_class)
+        query.__dict__.update(self._state)
+        # each query gets own copies, so changes do not leak to other queries
+        for name in self._MUTABLE_STATE:
+            if query.__dict__.get(name) is not None:
+                query.__dict__[name] = dict(query.__dict__[name])
+        query._bind(location, self.params)
+        return query
+
+    def __call__(
+        self,
+        location,
+        timeout: Union[None, float, Tuple[float, float], Tuple[float, None]] = None,
+        proxies: Optional[MutableMapping[str, str]] = None,
+        session: Optional[requests.Session] = None,
+    ) -> MultipleResultsQuery:
+        """Query remote server for location and parse results
+
+        Connection settings have precedence over same settings of prepared query.
+        See :func:`MultipleResultsQuery.__call__`.
+
+        :param location: Query content for geocode or reverse geocoding
+        """
+        return self.bind(location)(timeout=timeout, proxies=proxies, session=session)
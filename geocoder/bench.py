@@ -0,0 +1,204 @@
+"""
+Latency and throughput probing of providers.
+
+:func:`run_benchmark` fires query set at provider with given concurrency, or at
+fixed request rate, through :class:`GeocoderClient` connection pools, and collects
+latency percentiles, throughput, outcomes and rate limit wait time:
+
+    >>> from geocoder.bench import run_benchmark
+    >>> report = run_benchmark(
+    ...     ["Ottawa, Ontario"], requests=100, concurrency=8,
+    ...     url="http://localhost:8080/search",
+    ... )
+    >>> print(report.format())
+
+Same is available from command line with ``geocode bench`` command.
+"""
+__all__ = ["BenchReport", "run_benchmark"]
+
+import itertools
+import math
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+from geocoder.client import GeocoderClient
+
+
+def percentile(values: Sequence[float], share: float) -> Optional[float]:
+    """Nearest-rank percentile of sorted values
+
+    :param Sequence[float] values: Sorted values
+    :param float share: Percentile from 0 to 1
+    """
+    if not values:
+        return None
+    rank = math.ceil(share * len(values))
+    return values[min(max(rank, 1), len(values)) - 1]
+
+
+class BenchReport(object):
+    """Collected measurements of benchmark run
+
+    :ivar int requests: Number of made requests
+    :ivar float duration: Wall time of whole run in seconds
+    :ivar List[float] latencies: Sorted call durations in seconds
+    :ivar List[float] ratelimit_waits: Sorted rate limit wait times in seconds
+    :ivar Counter outcomes: Number of calls per outcome, see
+        :attr:`MultipleResultsQuery.outcome`
+    :ivar Counter status_codes: Number of calls per HTTP status code
+    :ivar Counter errors: Number of calls per error text
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.duration = 0.0
+        self.latencies: List[float] = []
+        self.ratelimit_waits: List[float] = []
+        self.outcomes: Counter = Counter()
+        self.status_codes: Counter = Counter()
+        self.errors: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<BenchReport {self.requests} requests, {self.throughput:.1f} req/s>"
+
+    @property
+    def throughput(self) -> float:
+        """Requests per second"""
+        return self.requests / self.duration if self.duration else 0.0
+
+    def add(self, query=None, error: Optional[str] = None):
+        """Add measurements of called query, or of raised exception text
+
+        :param Optional[MultipleResultsQuery] query: Called query
+        :param Optional[str] error: Text of exception, raised by the call
+        """
+        with self._lock:
+            self.requests += 1
+            if query is None:
+                self.outcomes["exception"] += 1
+                self.errors[error] += 1
+                return
+            self.outcomes[query.outcome] += 1
+            self.status_codes[str(query.status_code)] += 1
+            if query.error:
+                self.errors[query.error] += 1
+            if query.timings.total is not None:
+                self.latencies.append(query.timings.total)
+            if query.timings.ratelimit_wait is not None:
+                self.ratelimit_waits.append(query.timings.ratelimit_wait)
+
+    def finish(self, duration: float):
+        """Set run duration and sort collected values"""
+        self.duration = duration
+        self.latencies.sort()
+        self.ratelimit_waits.sort()
+
+    def as_dict(self) -> Dict:
+        """Summary of run, all times are in seconds"""
+        latencies, waits = self.latencies, self.ratelimit_waits
+        return {
+            "requests": self.requests,
+            "duration": self.duration,
+            "throughput": self.throughput,
+            "latency": {
+                "min": latencies[0] if latencies else None,
+                "mean": sum(latencies) / len(latencies) if latencies else None,
+                "p50": percentile(latencies, 0.50),
+                "p95": percentile(latencies, 0.95),
+                "p99": percentile(latencies, 0.99),
+                "max": latencies[-1] if latencies else None,
+            },
+            "ratelimit_wait": {
+                "total": sum(waits),
+                "p50": percentile(waits, 0.50),
+                "p95": percentile(waits, 0.95),
+            },
+            "outcomes": dict(self.outcomes),
+            "status_codes": dict(self.status_codes),
+            "errors": dict(self.errors.most_common(10)),
+        }
+
+    def format(self) -> str:
+        """Human readable summary of run"""
+
+        def ms(value: Optional[float]) -> str:
+            return "-" if value is None else f"{value * 1000:.1f}ms"
+
+        summary = self.as_dict()
+        latency, wait = summary["latency"], summary["ratelimit_wait"]
+        lines = [
+            f"Requests:    {self.requests} in {self.duration:.2f}s",
+            f"Throughput:  {self.throughput:.1f} req/s",
+            "Latency:     "
+            + ", ".join(f"{name} {ms(latency[name])}" for name in latency),
+            f"Rate limit:  total {ms(wait['total'])}, p50 {ms(wait['p50'])}, "
+            f"p95 {ms(wait['p95'])}",
+            "Outcomes:    "
+            + ", ".join(f"{name} {count}" for name, count in self.outcomes.items()),
+            "Status:      "
+            + ", ".join(f"{code} {n}" for code, n in self.status_codes.items()),
+        ]
+        for error, count in summary["errors"].items():
+            lines.append(f"  {count} x {error}")
+        return "\n".join(lines)
+
+
+def run_benchmark(
+    queries: Sequence,
+    provider: str = "osm",
+    method: str = "geocode",
+    requests: int = 100,
+    concurrency: int = 4,
+    rate: Optional[float] = None,
+    **options,
+) -> BenchReport:
+    """Call provider ``requests`` times with queries in round robin
+
+    :param Sequence queries: Query contents, reused in round robin
+    :param str provider: Provider name
+    :param str method: Provider's method
+    :param int requests: Total number of calls
+    :param int concurrency: Number of concurrent workers and pooled connections
+    :param Optional[float] rate: Target number of call starts per second. Calls are
+        started as fast as workers allow, when not set.
+    :param options: :class:`GeocoderClient` options, like ``url``, ``key``,
+        ``timeout`` or ``transport``
+    """
+    if not queries:
+        raise ValueError("At least one query is required")
+    if concurrency < 1 or requests < 1:
+        raise ValueError("requests and concurrency should be positive")
+
+    report = BenchReport()
+    lock = threading.Lock()
+    jobs = enumerate(itertools.islice(itertools.cycle(queries), requests))
+    client = GeocoderClient(provider=provider, pool_maxsize=concurrency, **options)
+
+    def worker():
+        while True:
+            with lock:
+                index, location = next(jobs, (None, None))
+            if index is None:
+                return
+            if rate:
+                # fixed schedule, so slow calls do not lower target rate
+                delay = started + index / rate - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            try:
+                query = client.query(location, method=method)
+            except Exception as err:  # any failure is a measurement too
+                report.add(error=f"{type(err).__name__}: {err}")
+            else:
+                report.add(query)
+
+    started = time.perf_counter()
+    with client, ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for future in [executor.submit(worker) for _ in range(concurrency)]:
+            future.result()
+    report.finish(time.perf_counter() - started)
+    return report
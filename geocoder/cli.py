@@ -1,19 +1,54 @@
-import fileinput
-import json
 import os
+import sys
 
 import click
 
 import geocoder
+from geocoder import jsonlib
 from geocoder.api import options
 
 providers = sorted(options.keys())
 methods = ["geocode", "reverse", "elevation", "timezone", "places"]
 outputs = ["json", "geojson", "wkt"]
+# --output choice to query attribute
+output_attributes = {"json": "object_json", "geojson": "geojson", "wkt": "wkt"}
 units = ["kilometers", "miles", "feet", "meters"]
+# same as geocoder.streaming, geocoder.jobs and geocoder.transport constants, that
+# are not imported here to keep command line start fast
+input_formats = ["text", "csv", "ndjson"]
+output_formats = ["ndjson", "csv", "geojson"]
+job_output_formats = ["ndjson", "csv"]
+transports = ["requests", "urllib3", "httpx", "http2"]
 
 
-@click.command()
+class DefaultCommandGroup(click.Group):
+    """Group, that runs default command, when no command name is given
+
+    Keeps ``geocode "Ottawa, Ontario"`` working next to ``geocode bench ...``.
+    Location, that equals command name, is given after ``--`` or default command
+    name: ``geocode -- bench`` or ``geocode geocode bench``.
+    """
+
+    default_command = "geocode"
+
+    def parse_args(self, ctx, args):
+        if not args or (
+            args[0] not in self.commands and args[0] not in ctx.help_option_names
+        ):
+            args.insert(0, self.default_command)
+        return super().parse_args(ctx, args)
+
+
+@click.group(cls=DefaultCommandGroup)
+def cli():
+    """Geocode from Command Line, run without command name to geocode locations.
+
+    Locations, that equal command names, like "job", go after "--":
+    geocode -- job
+    """
+
+
+@cli.command()
 @click.argument("location", nargs=-1)
 @click.option("--provider", "-p", default="osm", type=click.Choice(providers))
 @click.option("--method", "-m", default="geocode", type=click.Choice(methods))
@@ -29,41 +64,195 @@ units = ["kilometers", "miles", "feet", "meters"]
 @click.option("--city", "-c", default="")
 @click.option("--state", "-s", default="")
 @click.option("--zipcode", "-z", default="")
-def cli(location, **kwargs):
-    """Geocode an arbitrary number of strings from Command Line."""
-
-    locations = []
-
-    # Read Standard Input
-    # $ cat foo.txt | geocode
-    try:
-        for line in fileinput.input():
-            locations.append(line.strip())
-    except Exception:
-        pass
-
-    # Read multiple files & user input location
-    for item in location:
-        if os.path.exists(item):
-            with open(item, "rb") as f:
-                locations += f.read().splitlines()
-        else:
-            locations.append(item)
+@click.option("--workers", "-w", default=1, help="Number of concurrent requests")
+@click.option(
+    "--input-format",
+    default="auto",
+    type=click.Choice(["auto"] + input_formats),
+    help="Format of input files, by extension by default",
+)
+@click.option("--column", help="CSV column name or index, NDJSON key")
+@click.option("--output-format", default="ndjson", type=click.Choice(output_formats))
+@click.option(
+    "--manifest",
+    type=click.Path(dir_okay=False),
+    help="SQLite manifest, geocode only rows changed since previous run",
+)
+@click.option("--profile", is_flag=True, help="Run under cProfile, print summary")
+@click.option(
+    "--profile-output",
+    default="geocoder.prof",
+    type=click.Path(dir_okay=False),
+    help="File for pstats data of --profile",
+)
+def geocode(
+    location,
+    profile,
+    profile_output,
+    workers,
+    input_format,
+    column,
+    output_format,
+    manifest,
+    **kwargs,
+):
+    """Geocode an arbitrary number of strings from Command Line.
 
+    LOCATION is location string or file path, "-" reads standard input. Standard
+    input is read also when no LOCATION given. Input is read and results are
+    written lazily, in input order.
+    """
     # Distance calculation
     if kwargs["distance"]:
-        d = geocoder.distance(locations, **kwargs)
+        d = geocoder.distance(
+            list(_read_input(location, input_format, column)), **kwargs
+        )
         click.echo(d)
         return
 
-    # Geocode results from user input
-    for location in locations:
-        g = geocoder.get_results(location.strip(), **kwargs)
-        try:
-            click.echo(json.dumps(getattr(g, kwargs["output"])))
-        except IOError:
-            # When invalid command is entered a broken pipe error occurs
-            return
+    locations = _read_input(location, input_format, column)
+    if not profile:
+        _geocode_all(locations, workers, output_format, manifest, **kwargs)
+        return
+
+    if workers > 1:
+        # cProfile sees only calling thread, not requests made by workers
+        raise click.UsageError("--profile cannot be used with --workers above 1")
+
+    from geocoder.profiling import profile_calls
+
+    with profile_calls(profile_output) as summary:
+        _geocode_all(locations, workers, output_format, manifest, **kwargs)
+    # summary goes to stderr, so stdout stays valid output
+    click.echo(summary.format(), err=True)
+    click.echo(f"Profile data written to {profile_output}", err=True)
+
+
+def _read_input(items, input_format: str, column):
+    """Lazily yield locations from arguments, files and standard input"""
+    from geocoder.streaming import read_locations
+
+    if not items and not sys.stdin.isatty():
+        items = ["-"]
+
+    for item in items:
+        if item == "-":
+            yield from read_locations(sys.stdin, _format(input_format, ""), column)
+        elif os.path.exists(item):
+            with open(item, newline="", encoding="utf-8") as stream:
+                yield from read_locations(stream, _format(input_format, item), column)
+        else:
+            yield item
+
+
+def _format(input_format: str, path: str) -> str:
+    from geocoder.streaming import detect_format
+
+    return detect_format(path) if input_format == "auto" else input_format
+
+
+def _geocode_all(locations, workers: int, output_format: str, manifest, **kwargs):
+    from geocoder.streaming import geocode_stream, get_writer
+
+    attribute = output_attributes[kwargs["output"]]
+    try:
+        with get_writer(output_format, sys.stdout, attribute) as writer:
+            if manifest:
+                _geocode_changed(locations, writer, manifest, workers, **kwargs)
+                return
+            for location, g in geocode_stream(locations, workers, **kwargs):
+                writer.write(location, g)
+    except BrokenPipeError:
+        # output is closed early, like by "| head"
+        return
+
+
+def _geocode_changed(locations, writer, manifest: str, workers: int, **kwargs):
+    from geocoder.manifest import ManifestPipeline
+
+    with ManifestPipeline(manifest, workers, **kwargs) as pipeline:
+        pipeline.run(locations, writer)
+        click.echo(
+            f"Rows: {pipeline.total}, reused {pipeline.reused}, "
+            f"requested {pipeline.requested}, failed {pipeline.failed}, "
+            f"removed from manifest {pipeline.removed}",
+            err=True,
+        )
+
+
+@cli.command()
+@click.argument("source", nargs=-1)
+@click.option("--output-file", "-f", required=True, type=click.Path(dir_okay=False))
+@click.option("--checkpoint", type=click.Path(dir_okay=False), help="SQLite file")
+@click.option("--retry-failed", is_flag=True, help="Geocode only failed rows again")
+@click.option("--checkpoint-every", default=100, help="Rows between checkpoints")
+@click.option("--provider", "-p", default="osm", type=click.Choice(providers))
+@click.option("--method", "-m", default="geocode", type=click.Choice(methods))
+@click.option("--output", "-o", default="json", type=click.Choice(outputs))
+@click.option("--timeout", "-t", default=5.0)
+@click.option("--url", default=None)
+@click.option("--key", default=None)
+@click.option("--workers", "-w", default=1, help="Number of concurrent requests")
+@click.option(
+    "--input-format",
+    default="auto",
+    type=click.Choice(["auto"] + input_formats),
+    help="Format of input files, by extension by default",
+)
+@click.option("--column", help="CSV column name or index, NDJSON key")
+@click.option(
+    "--output-format", default="ndjson", type=click.Choice(job_output_formats)
+)
+def job(source, output, retry_failed, input_format, column, **kwargs):
+    """Resumable geocoding of large input with SQLite checkpoint.
+
+    Run same command again to continue interrupted job from last checkpoint.
+    """
+    from geocoder.jobs import GeocodeJob
+
+    options = {name: value for name, value in kwargs.items() if value is not None}
+    with GeocodeJob(
+        options.pop("output_file"), attribute=output_attributes[output], **options
+    ) as geocode_job:
+        if retry_failed:
+            geocode_job.retry_failed()
+        else:
+            geocode_job.run(_read_input(source, input_format, column))
+        click.echo(
+            f"Processed {geocode_job.processed} rows: {geocode_job.succeeded} "
+            f"succeeded, {geocode_job.failed} failed, "
+            f"{len(geocode_job.failed_rows)} failed rows in checkpoint",
+            err=True,
+        )
+
+
+@cli.command()
+@click.argument("query", nargs=-1)
+@click.option("--queries-file", "-f", type=click.File("r"), help="Query per line")
+@click.option("--provider", "-p", default="osm", type=click.Choice(providers))
+@click.option("--method", "-m", default="geocode", type=click.Choice(methods))
+@click.option("--url", default=None, help="Provider url override, like local mock")
+@click.option("--key", default=None)
+@click.option("--timeout", "-t", default=5.0)
+@click.option("--transport", default="requests", type=click.Choice(transports))
+@click.option("--requests", "-n", default=100, help="Total number of requests")
+@click.option("--concurrency", "-c", default=4, help="Number of concurrent workers")
+@click.option("--rate", "-r", type=float, default=None, help="Target requests/s")
+@click.option("--json", "as_json", is_flag=True, help="Print report as JSON")
+def bench(query, queries_file, as_json, **kwargs):
+    """Probe provider latency and throughput with query set."""
+    from geocoder.bench import run_benchmark
+
+    queries = list(query)
+    if queries_file is not None:
+        queries += [line.strip() for line in queries_file if line.strip()]
+    if not queries:
+        raise click.UsageError("At least one query or --queries-file is required")
+
+    # provider defaults are used for not set options
+    options = {name: value for name, value in kwargs.items() if value is not None}
+    report = run_benchmark(queries, **options)
+    click.echo(jsonlib.dumps(report.as_dict()) if as_json else report.format())
 
 
 if __name__ == "__main__":
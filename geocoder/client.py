@@ -0,0 +1,200 @@
+"""
+Long-lived geocoding client.
+
+:class:`GeocoderClient` owns connection pools, provider credentials and default
+connection settings, so all per-provider setup is done only once, and each call only
+makes the request.
+
+    >>> import geocoder
+    >>> client = geocoder.GeocoderClient(credentials={"bing": "BING_KEY"})
+    >>> client.geocode("Ottawa, Ontario").latlng
+    >>> client.reverse([45.42, -75.69], provider="bing").address
+"""
+__all__ = ["GeocoderClient"]
+
+import logging
+import threading
+from typing import Callable, Dict, MutableMapping, Optional, Tuple, Union
+from urllib.parse import urlparse
+
+from geocoder.api import get_query_class
+from geocoder.base import MultipleResultsQuery, PreparedQuery
+from geocoder.keys import environment_credentials
+from geocoder.transport import Transport, get_transport
+
+logger = logging.getLogger(__name__)
+
+
+class GeocoderClient(object):
+    """Thread-safe facade, that owns sessions, credentials and defaults
+
+    One session-like transport with connection pool (:class:`requests.Session` by
+    default) is created per provider host and reused by all calls. Prepared queries
+    (see :class:`PreparedQuery`) are cached per provider method. Provider credentials
+    are read from environment variables on first provider usage and can be
+    overwritten with ``credentials`` parameter.
+
+    :param str provider: Default provider for all calls
+    :param credentials: Mapping of provider name to api key string, or to mapping of
+        provider's credential options (like ``app_id`` and ``app_code`` for HERE)
+    :param timeout: Default request timeout
+    :param proxies: Default proxies for all requests
+    :param headers: Additional headers for all requests
+    :param int pool_maxsize: Max number of kept connections per provider host.
+        Should be not less than number of threads, using the client.
+    :param int max_retries: Number of retries on connection errors
+    :param transport: Transport name from :data:`geocoder.transport.TRANSPORTS`
+        (``requests``, ``urllib3``, ``httpx`` or ``http2``) or factory, called with
+        ``pool_maxsize`` and ``max_retries`` keyword arguments
+    :param options: Any other provider related options, used in all calls
+    """
+
+    def __init__(
+        self,
+        provider: str = "osm",
+        credentials: Optional[Dict[str, Union[str, dict]]] = None,
+        timeout: Union[None, float, Tuple[float, float], Tuple[float, None]] = None,
+        proxies: Optional[MutableMapping[str, str]] = None,
+        headers: Optional[MutableMapping[str, str]] = None,
+        pool_maxsize: int = 10,
+        max_retries: int = 0,
+        transport: Union[str, Callable[..., Transport]] = "requests",
+        **options,
+    ):
+        self.provider = provider
+        self.credentials = credentials or {}
+        self.timeout = timeout
+        self.proxies = proxies
+        self.headers = headers
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self.transport = get_transport(transport)
+        self.options = options
+
+        self._lock = threading.Lock()
+        self._sessions: Dict[str, Transport] = {}
+        self._prepared: Dict[Tuple[str, str], PreparedQuery] = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<GeocoderClient {self.provider} - {len(self._sessions)} sessions>"
+
+    def _new_session(self) -> Transport:
+        """Create transport with connection pool, sized for concurrent usage"""
+        return self.transport(
+            pool_maxsize=self.pool_maxsize, max_retries=self.max_retries
+        )
+
+    def session_for(self, url: str) -> Transport:
+        """Return pooled session for url's host, created on first use
+
+        :param str url: Any url of provider's host
+        """
+        host = urlparse(url).netloc
+        try:
+            return self._sessions[host]
+        except KeyError:
+            with self._lock:
+                if host not in self._sessions:
+                    logger.debug("Creating session for %s", host)
+                    self._sessions[host] = self._new_session()
+                return self._sessions[host]
+
+    def provider_credentials(self, provider: str) -> dict:
+        """Credentials options for provider from environment and client settings
+
+        :param str provider: Provider name
+        """
+        resolved = environment_credentials(provider)
+        credentials = self.credentials.get(provider)
+        if isinstance(credentials, str):
+            resolved["key"] = credentials
+        elif credentials:
+            resolved.update(credentials)
+        return resolved
+
+    def _build_options(self, provider: str, **kwargs) -> dict:
+        options = {
+            "timeout": self.timeout,
+            "proxies": self.proxies,
+            "headers": self.headers,
+            **self.provider_credentials(provider),
+            **self.options,
+        }
+        options.update(kwargs)
+        return options
+
+    def prepared(self, provider: Optional[str] = None, method: str = "geocode"):
+        """Return cached :class:`PreparedQuery` for provider method
+
+        :param Optional[str] provider: Provider name, client's default if not set
+        :param str method: Provider's method
+        """
+        provider = (provider or self.provider).lower().strip()
+        method = method.lower().strip()
+        try:
+            return self._prepared[provider, method]
+        except KeyError:
+            query_class = get_query_class(provider, method)
+            with self._lock:
+                if (provider, method) not in self._prepared:
+                    self._prepared[provider, method] = PreparedQuery(
+                        query_class, **self._build_options(provider)
+                    )
+                return self._prepared[provider, method]
+
+    def query(
+        self,
+        location,
+        provider: Optional[str] = None,
+        method: str = "geocode",
+        **kwargs,
+    ) -> MultipleResultsQuery:
+        """Make request to provider with client's sessions, credentials and defaults
+
+        Calls without additional options use cached prepared query. Any additional
+        option requires full provider setup for this call.
+
+        :param location: Query content for geocode, reverse geocoding or batch
+        :param Optional[str] provider: Provider name, client's default if not set
+        :param str method: Provider's method
+        :param kwargs: Any other provider related options for this call only. Given
+            ``session`` is used instead of client's pooled session.
+        """
+        session = kwargs.pop("session", None) or self.options.get("session")
+        if kwargs:
+            provider = (provider or self.provider).lower().strip()
+            query_class = get_query_class(provider, method)
+            query = query_class(location, **self._build_options(provider, **kwargs))
+        else:
+            query = self.prepared(provider, method).bind(location)
+        return query(session=session or self.session_for(query.url))
+
+    def geocode(self, location: str, provider: Optional[str] = None, **kwargs):
+        """Geocode location, see :func:`query` for parameters description"""
+        if not isinstance(location, str):
+            raise ValueError("Query should be a string")
+        return self.query(location, provider, "geocode", **kwargs)
+
+    def reverse(self, location, provider: Optional[str] = None, **kwargs):
+        """Reverse geocode location, see :func:`query` for parameters description"""
+        return self.query(location, provider, "reverse", **kwargs)
+
+    def batch(self, locations: list, provider: Optional[str] = None, **kwargs):
+        """Geocode list of locations with provider's batch method
+
+        See :func:`query` for parameters description.
+        """
+        return self.query(locations, provider, "batch", **kwargs)
+
+    def close(self):
+        """Close all pooled connections. Client can be used again after closing."""
+        with self._lock:
+            sessions, self._sessions = self._sessions, {}
+        for session in sessions.values():
+            session.close()
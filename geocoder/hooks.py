@@ -0,0 +1,132 @@
+"""
+Query lifecycle hooks.
+
+Callbacks can be subscribed to any event from :data:`EVENTS`. Each callback is
+called with query instance as first argument and event details as keyword
+arguments. Query gives access to provider (``query._PROVIDER``), method
+(``query._METHOD``), redacted params (``query.redacted_params``) and timings
+(``query.timings``).
+
+    >>> from geocoder import hooks
+    >>> @hooks.subscribe("after_response")
+    ... def trace(query, status_code, **details):
+    ...     print(query._PROVIDER, status_code, query.timings.ttfb)
+
+Callbacks are called synchronously in the thread of the query. Exceptions of
+``before_request`` callbacks are propagated to the caller, so they can be used for
+custom throttling or request cancellation. Exceptions of callbacks of other,
+observation only, events are logged and do not affect the query. Events without
+subscribers cost a single dict lookup, details, that are costly to build, are built
+only after :func:`has_subscribers` check.
+
+**Events:**
+
+- ``before_request`` - before provider request, with ``url`` and redacted ``params``
+- ``after_response`` - after provider request, when any response was received, with
+  ``status_code`` and ``response`` (`None` for batch providers)
+- ``on_error`` - after call, that failed with connection or provider error, with
+  ``error`` text and ``exception`` (`None` for provider reported errors)
+- ``on_parse_complete`` - after results parsing, also for offline parsing with
+  :func:`MultipleResultsQuery.from_raw`, with ``count`` of results
+- ``on_batch_poll`` - after each job status request of batch providers, with
+  ``job_id``, ``attempt`` number, ``done`` flag and request ``elapsed`` seconds
+- ``after_call`` - at the end of each query call, successful or not, when all
+  timings, status and results are final
+"""
+
+__all__ = ["EVENTS", "clear", "emit", "has_subscribers", "subscribe", "unsubscribe"]
+
+import logging
+import threading
+from typing import Callable, Dict, Optional, Tuple
+
+EVENTS = (
+    "before_request",
+    "after_response",
+    "on_error",
+    "on_parse_complete",
+    "on_batch_poll",
+    "after_call",
+)
+
+# events, which callbacks exceptions are propagated to the caller
+PROPAGATED_EVENTS = ("before_request",)
+
+logger = logging.getLogger(__name__)
+
+# event name -> tuple of callbacks, replaced on each change to keep emit lock-free
+_subscribers: Dict[str, Tuple[Callable, ...]] = {event: () for event in EVENTS}
+_lock = threading.Lock()
+
+
+def _check_event(event: str):
+    if event not in _subscribers:
+        raise ValueError(f"Unknown event {event}, expected one of {EVENTS}")
+
+
+def subscribe(event: str, callback: Optional[Callable] = None):
+    """Subscribe callback to event, can be used as decorator
+
+    :param str event: Event name from :data:`EVENTS`
+    :param Optional[Callable] callback: Callable, accepting query and event details
+        keyword arguments
+    :raises ValueError: On unknown event name
+    """
+    _check_event(event)
+    if callback is None:
+        return lambda func: subscribe(event, func)
+
+    with _lock:
+        _subscribers[event] += (callback,)
+    return callback
+
+
+def unsubscribe(event: str, callback: Callable):
+    """Remove callback from event subscribers, if subscribed
+
+    :param str event: Event name from :data:`EVENTS`
+    :param Callable callback: Previously subscribed callback
+    :raises ValueError: On unknown event name
+    """
+    _check_event(event)
+    with _lock:
+        _subscribers[event] = tuple(
+            subscriber for subscriber in _subscribers[event] if subscriber != callback
+        )
+
+
+def clear(event: Optional[str] = None):
+    """Remove all subscribers of event, or of all events
+
+    :param Optional[str] event: Event name from :data:`EVENTS`
+    """
+    events = EVENTS if event is None else (event,)
+    with _lock:
+        for name in events:
+            _check_event(name)
+            _subscribers[name] = ()
+
+
+def has_subscribers(event: str) -> bool:
+    """Check, that event has any subscribers, before building its details
+
+    :param str event: Event name from :data:`EVENTS`
+    """
+    return bool(_subscribers[event])
+
+
+def emit(event: str, query, **details):
+    """Call all subscribers of event
+
+    :param str event: Event name from :data:`EVENTS`
+    :param MultipleResultsQuery query: Query, where event happened
+    :param details: Event details, passed to callbacks as keyword arguments
+    """
+    for callback in _subscribers[event]:
+        if event in PROPAGATED_EVENTS:
+            callback(query, **details)
+            continue
+        try:
+            callback(query, **details)
+        except Exception:  # broken instrumentation must not fail the query
+            logger.exception("Callback %r of %s event failed", callback, event)
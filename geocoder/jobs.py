@@ -0,0 +1,209 @@
+"""
+Checkpointed, resumable batch geocoding jobs.
+
+:class:`GeocodeJob` geocodes long input into output file and periodically saves
+progress to SQLite checkpoint file: number of processed input rows, output file
+size at that moment and failed rows. When job is killed and started again with same
+input, it truncates output to last checkpoint and continues from next row, so every
+input row is written exactly once:
+
+    >>> from geocoder.jobs import GeocodeJob
+    >>> from geocoder.streaming import read_locations
+    >>> job = GeocodeJob("out.ndjson", workers=8, provider="osm")
+    >>> with open("addresses.txt") as addresses:
+    ...     job.run(read_locations(addresses))
+    >>> job.retry_failed()
+
+Rows, that failed with timeout, HTTP or connection error, are not written to output,
+but kept in checkpoint. :func:`GeocodeJob.retry_failed` geocodes only them again and
+appends succeeded ones to output.
+"""
+__all__ = ["GeocodeJob"]
+
+import os
+import sqlite3
+import time
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from geocoder.api import get_results
+from geocoder.streaming import CSVWriter, NDJSONWriter, ordered_map
+from geocoder.transport import requests_session
+
+# outcomes of query, that are worth to retry
+FAILED_OUTCOMES = ("timeout", "http_error", "error")
+JOB_OUTPUT_FORMATS = ("ndjson", "csv")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS state (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS failed (
+    row INTEGER PRIMARY KEY, location TEXT NOT NULL, error TEXT NOT NULL
+);
+"""
+
+
+class GeocodeJob(object):
+    """Batch geocoding into output file with SQLite checkpoint
+
+    :param str output: Output file path, NDJSON or CSV
+    :param Optional[str] checkpoint: Checkpoint file path, ``output`` with
+        ``.checkpoint`` suffix by default
+    :param str output_format: One of :data:`JOB_OUTPUT_FORMATS`
+    :param str attribute: Query attribute for NDJSON output
+    :param int workers: Number of concurrent requests
+    :param int checkpoint_every: Save checkpoint after this number of rows
+    :param float checkpoint_interval: Save checkpoint after this number of seconds
+    :param kwargs: :func:`geocoder.get_results` options, like ``provider``. Given
+        ``session`` is used for all rows and is not closed.
+
+    :ivar int processed: Number of rows processed by last run
+    :ivar int succeeded: Number of rows written to output by last run
+    :ivar int failed: Number of rows failed in last run
+    """
+
+    def __init__(
+        self,
+        output: str,
+        checkpoint: Optional[str] = None,
+        output_format: str = "ndjson",
+        attribute: str = "geojson",
+        workers: int = 1,
+        checkpoint_every: int = 100,
+        checkpoint_interval: float = 10.0,
+        **kwargs,
+    ):
+        if output_format not in JOB_OUTPUT_FORMATS:
+            raise ValueError(f"Output format {output_format} cannot be resumed")
+        self.output = output
+        self.checkpoint = checkpoint or f"{output}.checkpoint"
+        self.output_format = output_format
+        self.attribute = attribute
+        self.workers = workers
+        self.checkpoint_every = checkpoint_every
+        self.checkpoint_interval = checkpoint_interval
+        self.session = kwargs.pop("session", None)
+        self.options = kwargs
+        self.processed = self.succeeded = self.failed = 0
+
+        self._db = sqlite3.connect(self.checkpoint)
+        self._db.executescript(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<GeocodeJob {self.output} offset {self.offset}>"
+
+    def close(self):
+        """Close checkpoint database"""
+        self._db.close()
+
+    def _state(self, name: str) -> Optional[int]:
+        row = self._db.execute(
+            "SELECT value FROM state WHERE name = ?", (name,)
+        ).fetchone()
+        return None if row is None else row[0]
+
+    @property
+    def offset(self) -> int:
+        """Number of input rows, processed before last checkpoint"""
+        return self._state("offset") or 0
+
+    @property
+    def failed_rows(self) -> List[Tuple[int, str, str]]:
+        """``(row, location, error)`` of failed rows, saved in checkpoint"""
+        return self._db.execute(
+            "SELECT row, location, error FROM failed ORDER BY row"
+        ).fetchall()
+
+    def run(self, locations: Iterable[str]):
+        """Geocode locations, skipping rows processed by previous runs
+
+        :param Iterable[str] locations: Same input on every run, consumed lazily
+        """
+        rows = enumerate(locations)
+        for _ in range(self.offset):
+            if next(rows, None) is None:
+                break
+        self._process(rows, advance=True)
+
+    def retry_failed(self):
+        """Geocode again only failed rows, saved in checkpoint"""
+        rows = [(row, location) for row, location, _ in self.failed_rows]
+        self._process(iter(rows), advance=False)
+
+    def _open_output(self):
+        position = self._state("output_position")
+        if position is None or not os.path.exists(self.output):
+            stream = open(self.output, "w", newline="", encoding="utf-8")
+            resumed = False
+        else:
+            # rows written after last checkpoint are processed again
+            os.truncate(self.output, position)
+            stream = open(self.output, "a", newline="", encoding="utf-8")
+            resumed = True
+        if self.output_format == "csv":
+            return CSVWriter(stream, header=not resumed)
+        return NDJSONWriter(stream, self.attribute)
+
+    def _geocode(self, session, location: str):
+        try:
+            return get_results(location, session=session, **self.options)
+        except Exception as err:  # failed row must not stop whole job
+            return err
+
+    def _save(self, writer, offset: Optional[int]):
+        writer.stream.flush()
+        state = [("output_position", writer.stream.tell())]
+        if offset is not None:
+            state.append(("offset", offset))
+        self._db.executemany("INSERT OR REPLACE INTO state VALUES (?, ?)", state)
+        self._db.commit()
+
+    def _record(self, writer, row: int, location: str, query):
+        self.processed += 1
+        if isinstance(query, Exception):
+            error = f"{type(query).__name__}: {query}"
+        elif query.outcome in FAILED_OUTCOMES:
+            error = query.error or query.outcome
+        else:
+            writer.write(location, query)
+            self.succeeded += 1
+            self._db.execute("DELETE FROM failed WHERE row = ?", (row,))
+            return
+        self.failed += 1
+        self._db.execute(
+            "INSERT OR REPLACE INTO failed VALUES (?, ?, ?)", (row, location, error)
+        )
+
+    def _process(self, rows: Iterator[Tuple[int, str]], advance: bool):
+        self.processed = self.succeeded = self.failed = 0
+        offset = self.offset if advance else None
+        session = self.session or requests_session(pool_maxsize=self.workers)
+        writer = self._open_output()
+        saved = time.monotonic()
+        try:
+            with writer:
+                try:
+                    for (row, location), query in ordered_map(
+                        lambda item: self._geocode(session, item[1]),
+                        rows,
+                        self.workers,
+                    ):
+                        self._record(writer, row, location, query)
+                        if advance:
+                            offset = row + 1
+                        if (
+                            self.processed % self.checkpoint_every == 0
+                            or time.monotonic() - saved >= self.checkpoint_interval
+                        ):
+                            self._save(writer, offset)
+                            saved = time.monotonic()
+                finally:
+                    # progress is kept on interruption too
+                    self._save(writer, offset)
+        finally:
+            if session is not self.session:
+                session.close()
@@ -0,0 +1,141 @@
+"""
+Pluggable JSON backend, used for provider responses decoding and output encoding.
+
+Fastest installed library is selected on import: :mod:`orjson`, :mod:`ujson` or
+standard :mod:`json` module. Backend can be changed with ``GEOCODER_JSON``
+environment variable or :func:`set_backend` call.
+
+    >>> from geocoder import jsonlib
+    >>> jsonlib.set_backend("json")
+    >>> jsonlib.loads(b'{"lat": 45.42}')
+    {'lat': 45.42}
+
+.. note:: :mod:`orjson` supports only 2 spaces indentation, any ``indent`` value
+    is rendered with 2 spaces by this backend.
+"""
+__all__ = ["BACKENDS", "backend", "dumpb", "dumps", "loads", "set_backend"]
+
+import json
+import os
+from typing import Any, Callable, Optional, Union
+
+BACKENDS = ("orjson", "ujson", "json")
+
+backend = None
+_loads = _dumps = _dumpb = None
+
+
+def _orjson_functions():
+    import orjson
+
+    def orjson_dumpb(obj, indent=None, sort_keys=False, default=None) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=default, option=option)
+
+    def orjson_dumps(obj, indent=None, sort_keys=False, default=None) -> str:
+        return orjson_dumpb(obj, indent, sort_keys, default).decode("utf-8")
+
+    return orjson.loads, orjson_dumps, orjson_dumpb
+
+
+def _ujson_functions():
+    import ujson
+
+    def ujson_dumps(obj, indent=None, sort_keys=False, default=None) -> str:
+        options = {"ensure_ascii": False, "escape_forward_slashes": False}
+        if default is not None:
+            options["default"] = default
+        return ujson.dumps(obj, indent=indent or 0, sort_keys=sort_keys, **options)
+
+    def ujson_dumpb(obj, indent=None, sort_keys=False, default=None) -> bytes:
+        return ujson_dumps(obj, indent, sort_keys, default).encode("utf-8")
+
+    return ujson.loads, ujson_dumps, ujson_dumpb
+
+
+def _json_functions():
+    def json_dumps(obj, indent=None, sort_keys=False, default=None) -> str:
+        return json.dumps(obj, indent=indent, sort_keys=sort_keys, default=default)
+
+    def json_dumpb(obj, indent=None, sort_keys=False, default=None) -> bytes:
+        return json_dumps(obj, indent, sort_keys, default).encode("utf-8")
+
+    return json.loads, json_dumps, json_dumpb
+
+
+_FACTORIES = {
+    "orjson": _orjson_functions,
+    "ujson": _ujson_functions,
+    "json": _json_functions,
+}
+
+
+def set_backend(name: str):
+    """Switch JSON backend for whole package
+
+    :param str name: One of :attr:`BACKENDS`
+    :raises ValueError: When backend is unknown or its package is not installed
+    """
+    global backend, _loads, _dumps, _dumpb
+
+    if name not in _FACTORIES:
+        raise ValueError(f"Unknown JSON backend. Got {name}")
+    try:
+        _loads, _dumps, _dumpb = _FACTORIES[name]()
+    except ImportError as error:
+        raise ValueError(f"JSON backend {name} is not installed") from error
+    backend = name
+
+
+def loads(content: Union[bytes, str]) -> Any:
+    """Decode JSON document. Bytes are decoded directly, without :class:`str` copy
+
+    :raises ValueError: On malformed JSON document
+    """
+    return _loads(content)
+
+
+def dumps(
+    obj,
+    indent: Optional[int] = None,
+    sort_keys: bool = False,
+    default: Optional[Callable] = None,
+) -> str:
+    """Encode object to JSON string
+
+    :param obj: Any JSON serializable object
+    :param Optional[int] indent: Pretty print with indentation
+    :param bool sort_keys: Output dictionaries with sorted keys
+    :param Optional[Callable] default: Function, that converts unsupported objects
+    """
+    return _dumps(obj, indent, sort_keys, default)
+
+
+def dumpb(
+    obj,
+    indent: Optional[int] = None,
+    sort_keys: bool = False,
+    default: Optional[Callable] = None,
+) -> bytes:
+    """Encode object to UTF-8 JSON bytes, parameters are same as in :func:`dumps`"""
+    return _dumpb(obj, indent, sort_keys, default)
+
+
+def _select_default_backend():
+    requested = os.environ.get("GEOCODER_JSON")
+    if requested:
+        set_backend(requested)
+        return
+    for name in BACKENDS:
+        try:
+            set_backend(name)
+            return
+        except ValueError:
+            continue
+
+
+_select_default_backend()
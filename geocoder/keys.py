@@ -27,6 +27,47 @@ locationiq_key = os.environ.get("LOCATIONIQ_API_KEY")
 ipinfo_key = os.environ.get("IPINFO_API_KEY")
 yandex_key = os.environ.get("YANDEX_API_KEY")
 
+# Provider options, that can be resolved from environment variables at any time,
+# not only on import. Used by :class:`geocoder.client.GeocoderClient`.
+ENVIRONMENT_CREDENTIALS = {
+    "baidu": {"key": "BAIDU_API_KEY", "sk": "BAIDU_SECURITY_KEY"},
+    "bing": {"key": "BING_API_KEY"},
+    "canadapost": {"key": "CANADAPOST_API_KEY"},
+    "gaode": {"key": "GAODE_API_KEY"},
+    "geocodefarm": {"key": "GEOCODEFARM_API_KEY"},
+    "geocodexyz": {"key": "GEOCODEXYZ_API_KEY"},
+    "geonames": {"key": "GEONAMES_USERNAME"},
+    "google": {
+        "key": "GOOGLE_API_KEY",
+        "client": "GOOGLE_CLIENT",
+        "client_secret": "GOOGLE_CLIENT_SECRET",
+    },
+    "here": {"app_id": "HERE_APP_ID", "app_code": "HERE_APP_CODE"},
+    "ipinfo": {"key": "IPINFO_API_KEY"},
+    "locationiq": {"key": "LOCATIONIQ_API_KEY"},
+    "mapbox": {"key": "MAPBOX_ACCESS_TOKEN"},
+    "mapquest": {"key": "MAPQUEST_API_KEY"},
+    "mapzen": {"key": "MAPZEN_API_KEY"},
+    "opencage": {"key": "OPENCAGE_API_KEY"},
+    "tamu": {"key": "TAMU_API_KEY"},
+    "tgos": {"key": "TGOS_API_KEY"},
+    "tomtom": {"key": "TOMTOM_API_KEY"},
+    "w3w": {"key": "W3W_API_KEY"},
+    "yandex": {"key": "YANDEX_API_KEY"},
+}
+
+
+def environment_credentials(provider: str) -> dict:
+    """Read provider credentials from current environment variables
+
+    :param str provider: Provider name, as in :attr:`geocoder.api.options`
+    """
+    return {
+        option: os.environ[variable]
+        for option, variable in ENVIRONMENT_CREDENTIALS.get(provider, {}).items()
+        if os.environ.get(variable)
+    }
+
 
 class CanadapostKeyLazySingleton(object):
 
@@ -0,0 +1,171 @@
+"""
+Incremental re-geocoding of slightly changed inputs.
+
+:class:`ManifestPipeline` keeps SQLite manifest of input row content hash to
+serialized output of that row. On next run of changed input only new and changed
+rows are sent to provider, outputs of unchanged rows are taken from manifest, and
+whole output is written in input order:
+
+    >>> import sys
+    >>> from geocoder.manifest import ManifestPipeline
+    >>> from geocoder.streaming import NDJSONWriter, read_locations
+    >>> with open("addresses.txt") as addresses, NDJSONWriter(sys.stdout) as writer:
+    ...     with ManifestPipeline("addresses.manifest", provider="osm") as pipeline:
+    ...         pipeline.run(read_locations(addresses), writer)
+
+Row hash covers location, all :func:`geocoder.get_results` options, like provider,
+method, key or language, and output format, so changing any of them geocodes rows
+again. Failed rows are written, but not kept in manifest, and
+are retried on every run. Rows, that raised exception, are logged and skipped. Rows,
+that disappeared from input, are removed from manifest after complete run.
+"""
+__all__ = ["ManifestPipeline"]
+
+import hashlib
+import json
+import logging
+import sqlite3
+from typing import Iterable, Iterator, Optional, Tuple
+
+from geocoder.api import get_results
+from geocoder.jobs import FAILED_OUTCOMES
+from geocoder.streaming import ordered_map
+from geocoder.transport import requests_session
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rows (
+    hash TEXT PRIMARY KEY, chunk TEXT NOT NULL, run INTEGER NOT NULL
+);
+"""
+
+
+class ManifestPipeline(object):
+    """Geocode only new and changed rows, reuse manifest outputs for others
+
+    :param str manifest: Manifest SQLite file path
+    :param int workers: Number of concurrent requests
+    :param int commit_every: Save manifest after this number of geocoded rows
+    :param kwargs: :func:`geocoder.get_results` options, like ``provider``. Given
+        ``session`` is used for all rows and is not closed.
+
+    :ivar int total: Number of rows in last run
+    :ivar int reused: Number of rows taken from manifest in last run
+    :ivar int requested: Number of rows sent to provider in last run
+    :ivar int failed: Number of rows failed in last run
+    :ivar int removed: Number of manifest rows, not found in last run input
+    """
+
+    def __init__(
+        self, manifest: str, workers: int = 1, commit_every: int = 1000, **kwargs
+    ):
+        self.manifest = manifest
+        self.workers = workers
+        self.commit_every = commit_every
+        # session does not change results, other options may
+        self.session = kwargs.pop("session", None)
+        self.options = kwargs
+        self._options_key = json.dumps(kwargs, sort_keys=True, default=str)
+        self.total = self.reused = self.requested = self.failed = self.removed = 0
+
+        self._db = sqlite3.connect(manifest)
+        self._db.executescript(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<ManifestPipeline {self.manifest} {len(self)} rows>"
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT count(*) FROM rows").fetchone()[0]
+
+    def close(self):
+        """Close manifest database"""
+        self._db.close()
+
+    def row_hash(self, location: str, signature: str) -> str:
+        """Content hash of input row in scope of query options and output format
+
+        :param str location: Input row location
+        :param str signature: Writer signature, see :attr:`_Writer.signature`
+        """
+        scope = (
+            self.options.get("provider", "osm"),
+            self.options.get("method", "geocode"),
+            self._options_key,
+            signature,
+            location,
+        )
+        return hashlib.sha256("\0".join(scope).encode("utf-8")).hexdigest()
+
+    def _lookup(
+        self, locations: Iterable[str], signature: str, run: int
+    ) -> Iterator[Tuple[str, str, Optional[str]]]:
+        """Yield ``(location, hash, chunk)``, chunk is set for unchanged rows"""
+        for location in locations:
+            key = self.row_hash(location, signature)
+            row = self._db.execute(
+                "SELECT chunk FROM rows WHERE hash = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                self._db.execute("UPDATE rows SET run = ? WHERE hash = ?", (run, key))
+            yield location, key, None if row is None else row[0]
+
+    def _geocode(self, session, location: str, chunk: Optional[str]):
+        if chunk is not None:
+            return None
+        try:
+            return get_results(location, session=session, **self.options)
+        except Exception as err:  # failed row must not stop whole run
+            return err
+
+    def run(self, locations: Iterable[str], writer):
+        """Write outputs of all locations in input order
+
+        :param Iterable[str] locations: Input locations, consumed lazily
+        :param writer: Output writer from :mod:`geocoder.streaming`
+        """
+        self.total = self.reused = self.requested = self.failed = self.removed = 0
+        run = (self._db.execute("SELECT max(run) FROM rows").fetchone()[0] or 0) + 1
+        rows = self._lookup(locations, writer.signature, run)
+        session = self.session or requests_session(pool_maxsize=self.workers)
+        try:
+            for (location, key, chunk), query in ordered_map(
+                lambda row: self._geocode(session, row[0], row[2]),
+                rows,
+                self.workers,
+            ):
+                self.total += 1
+                if chunk is not None:
+                    self.reused += 1
+                    writer.write_serialized(chunk)
+                    continue
+
+                self.requested += 1
+                if isinstance(query, Exception):
+                    self.failed += 1
+                    logger.error("Row %r is skipped: %r", location, query)
+                    continue
+                chunk = writer.serialize(location, query)
+                writer.write_serialized(chunk)
+                if query.outcome in FAILED_OUTCOMES:
+                    self.failed += 1
+                    continue
+                self._db.execute(
+                    "INSERT OR REPLACE INTO rows VALUES (?, ?, ?)", (key, chunk, run)
+                )
+                if self.requested % self.commit_every == 0:
+                    self._db.commit()
+            # only complete run knows all rows of input
+            self.removed = self._db.execute(
+                "DELETE FROM rows WHERE run < ?", (run,)
+            ).rowcount
+        finally:
+            self._db.commit()
+            if session is not self.session:
+                session.close()
@@ -0,0 +1,311 @@
+"""
+In-process metrics of provider requests.
+
+Recording is disabled by default. After :func:`enable` call each query call is
+recorded to :data:`registry` with ``after_call`` hook (see :mod:`geocoder.hooks`):
+requests counter, latency, :mod:`ratelim` wait time and response size histograms,
+labelled by provider, method, status code and outcome.
+
+    >>> import geocoder
+    >>> from geocoder import metrics
+    >>> metrics.enable()
+    >>> geocoder.osm("Ottawa, Ontario")
+    >>> print(metrics.export_text())
+    >>> server = metrics.start_http_server(9100)  # Prometheus scrape endpoint
+
+**Outcomes:**
+
+- ``ok`` - any result received
+- ``no_results`` - request succeeded, but provider returned no results
+- ``http_error`` - provider answered with 4xx or 5xx HTTP status
+- ``timeout`` - connect or read timeout
+- ``error`` - any other connection, decoding or provider error
+"""
+__all__ = [
+    "Counter",
+    "Histogram",
+    "MetricsRegistry",
+    "disable",
+    "enable",
+    "export_text",
+    "registry",
+    "start_http_server",
+]
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, Optional, Sequence, Tuple
+
+from geocoder import hooks
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence, **extra) -> str:
+    pairs = list(zip(names, values)) + list(extra.items())
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter(object):
+    """Thread-safe counter with labels
+
+    :param str name: Metric name
+    :param str documentation: Metric help text
+    :param Sequence[str] labels: Label names
+    """
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._values: Dict[Tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values, amount: float = 1):
+        """Increase counter for label values, given in :attr:`labels` order"""
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def value(self, *label_values) -> float:
+        return self._values.get(label_values, 0)
+
+    def samples(self) -> Iterator[Tuple[str, str, float]]:
+        with self._lock:
+            values = sorted(self._values.items())
+        for label_values, value in values:
+            yield self.name, _format_labels(self.labels, label_values), value
+
+    def reset(self):
+        with self._lock:
+            self._values.clear()
+
+
+class Histogram(object):
+    """Thread-safe histogram with labels and cumulative buckets
+
+    :param str name: Metric name
+    :param str documentation: Metric help text
+    :param Sequence[str] labels: Label names
+    :param Sequence[float] buckets: Sorted upper bounds of buckets
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DURATION_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        # label values: [per bucket counts, sum, count]
+        self._values: Dict[Tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values):
+        """Add observation for label values, given in :attr:`labels` order"""
+        with self._lock:
+            state = self._values.get(label_values)
+            if state is None:
+                state = self._values[label_values] = [[0] * len(self.buckets), 0, 0]
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[0][index] += 1
+                    break
+            state[1] += value
+            state[2] += 1
+
+    def count(self, *label_values) -> int:
+        state = self._values.get(label_values)
+        return state[2] if state else 0
+
+    def sum(self, *label_values) -> float:
+        state = self._values.get(label_values)
+        return state[1] if state else 0
+
+    def samples(self) -> Iterator[Tuple[str, str, float]]:
+        with self._lock:
+            values = sorted(
+                (labels, (list(state[0]), state[1], state[2]))
+                for labels, state in self._values.items()
+            )
+        for label_values, (counts, total, count) in values:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                labels = _format_labels(
+                    self.labels, label_values, le=_format_value(bound)
+                )
+                yield f"{self.name}_bucket", labels, cumulative
+            labels = _format_labels(self.labels, label_values)
+            yield f"{self.name}_sum", labels, total
+            yield f"{self.name}_count", labels, count
+
+    def reset(self):
+        with self._lock:
+            self._values.clear()
+
+
+class MetricsRegistry(object):
+    """Set of geocoder metrics, filled from finished queries
+
+    :param Sequence[float] duration_buckets: Latency histograms buckets in seconds
+    :param Sequence[float] size_buckets: Response size histogram buckets in bytes
+    """
+
+    def __init__(
+        self,
+        duration_buckets: Sequence[float] = DURATION_BUCKETS,
+        size_buckets: Sequence[float] = SIZE_BUCKETS,
+    ):
+        self.requests = Counter(
+            "geocoder_requests_total",
+            "Provider requests by status code and outcome",
+            ("provider", "method", "status_code", "outcome"),
+        )
+        self.duration = Histogram(
+            "geocoder_request_duration_seconds",
+            "Whole query call duration, including rate limit wait and parsing",
+            ("provider", "method", "outcome"),
+            duration_buckets,
+        )
+        self.ratelimit_wait = Histogram(
+            "geocoder_ratelimit_wait_seconds",
+            "Time spent waiting in rate limits before request",
+            ("provider", "method"),
+            duration_buckets,
+        )
+        self.response_size = Histogram(
+            "geocoder_response_size_bytes",
+            "Decoded provider response body size",
+            ("provider", "method"),
+            size_buckets,
+        )
+
+    @property
+    def metrics(self) -> tuple:
+        return self.requests, self.duration, self.ratelimit_wait, self.response_size
+
+    def observe(self, query):
+        """Record finished query call
+
+        :param MultipleResultsQuery query: Called query
+        """
+        provider, method = query._PROVIDER, query._METHOD
+        outcome = query.outcome
+        self.requests.inc(provider, method, str(query.status_code), outcome)
+
+        timings = query.timings
+        if timings.total is not None:
+            self.duration.observe(timings.total, provider, method, outcome)
+        if timings.ratelimit_wait is not None:
+            self.ratelimit_wait.observe(timings.ratelimit_wait, provider, method)
+        if query.response_size:
+            self.response_size.observe(query.response_size, provider, method)
+
+    def export_text(self) -> str:
+        """All metrics in Prometheus text exposition format"""
+        lines = []
+        for metric in self.metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{labels} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        """Clear all recorded values"""
+        for metric in self.metrics:
+            metric.reset()
+
+
+registry = MetricsRegistry()
+enabled = False
+
+
+def enable(custom_registry: Optional[MetricsRegistry] = None):
+    """Start recording of all query calls
+
+    :param Optional[MetricsRegistry] custom_registry: Registry to use instead of
+        default :data:`registry`
+    """
+    global enabled, registry
+    if custom_registry is not None:
+        registry = custom_registry
+    if not enabled:
+        hooks.subscribe("after_call", record)
+    enabled = True
+
+
+def disable():
+    """Stop recording of query calls, recorded values are kept"""
+    global enabled
+    hooks.unsubscribe("after_call", record)
+    enabled = False
+
+
+def record(query, **details):
+    """Record finished query call to :data:`registry`, ``after_call`` hook callback"""
+    registry.observe(query)
+
+
+def export_text() -> str:
+    """Metrics of default :data:`registry` in Prometheus text format"""
+    return registry.export_text()
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    """HTTP handler, that serves registry metrics on any GET request"""
+
+    registry: Optional[MetricsRegistry] = None
+
+    def do_GET(self):
+        body = (self.registry or registry).export_text().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_http_server(
+    port: int,
+    addr: str = "127.0.0.1",
+    custom_registry: Optional[MetricsRegistry] = None,
+) -> ThreadingHTTPServer:
+    """Serve metrics in background thread, call ``shutdown()`` on result to stop
+
+    :param int port: Port to listen, 0 to choose free one
+    :param str addr: Address to listen
+    :param Optional[MetricsRegistry] custom_registry: Registry to serve instead of
+        default :data:`registry`
+    """
+    handler = type("Handler", (MetricsHandler,), {"registry": custom_registry})
+    server = ThreadingHTTPServer((addr, port), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
@@ -0,0 +1,145 @@
+"""
+Profiling of query calls.
+
+:func:`profile_calls` runs block under :mod:`cProfile`, writes :mod:`pstats` file,
+that can be opened with ``python -m pstats``, ``snakeviz`` or converted to flame
+graph with ``flameprof``, and collects :class:`ProfileSummary` of all query calls
+made in the block:
+
+    >>> import geocoder
+    >>> from geocoder.profiling import profile_calls
+    >>> with profile_calls("geocoder.prof") as summary:
+    ...     geocoder.osm("Ottawa, Ontario").geojson
+    >>> print(summary.format())
+"""
+__all__ = ["ProfileSummary", "profile_calls"]
+
+import cProfile
+import io
+import pstats
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from geocoder import hooks
+
+# summary phase -> query timings phases
+PHASES = {
+    "network": ("ttfb", "download"),
+    "ratelimit_wait": ("ratelimit_wait",),
+    "json_decode": ("decode",),
+    "result_parsing": ("catch_errors", "adapt", "parse"),
+}
+
+
+class ProfileSummary(object):
+    """Time of query calls, split by phases
+
+    Phase times are summed over all recorded calls. Results are built lazily, after
+    the call, so all results of recorded calls and their ``object_json`` are built
+    right after call and counted in ``result_parsing``. Everything else, that is not
+    spent inside query calls, like output serialization and command line processing,
+    is reported as ``other``. Calls, made concurrently from several
+    threads, overlap, so their summed phases can exceed wall time. Then ``other`` is
+    not known, and shares are reported of summed phase time instead of wall time.
+
+    :ivar int queries: Number of recorded query calls
+    :ivar float wall: Whole profiled block duration in seconds
+    :ivar Dict[str, float] phases: Summed seconds per phase from :data:`PHASES`
+    :ivar str top: Top functions by cumulative time, filled by :func:`profile_calls`
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.wall = 0.0
+        self.phases: Dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        self.top = ""
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<ProfileSummary {self.queries} queries, {self.wall * 1000:.1f}ms>"
+
+    def add(self, query, **details):
+        """Add timings of called query, ``after_call`` hook callback
+
+        :param MultipleResultsQuery query: Called query
+        """
+        timings = query.timings
+        started = time.perf_counter()
+        for result in query:
+            result.object_json
+        built = time.perf_counter() - started
+        with self._lock:
+            self.queries += 1
+            for phase, names in PHASES.items():
+                for name in names:
+                    self.phases[phase] += getattr(timings, name) or 0.0
+            self.phases["result_parsing"] += built
+
+    @property
+    def overlapped(self) -> bool:
+        """Summed phases exceed wall time, as calls were concurrent"""
+        return sum(self.phases.values()) > self.wall
+
+    def as_dict(self) -> Dict[str, Optional[float]]:
+        """Summed seconds per phase, with ``other`` and ``total`` wall time
+
+        ``other`` is ``None`` for :attr:`overlapped` calls.
+        """
+        summary: Dict[str, Optional[float]] = dict(self.phases)
+        summed = sum(self.phases.values())
+        summary["other"] = None if self.overlapped else self.wall - summed
+        summary["total"] = self.wall
+        return summary
+
+    def format(self) -> str:
+        """Human readable phases table, followed by top functions"""
+        summed = sum(self.phases.values())
+        if self.overlapped:
+            base, base_name = summed, "summed phase time, calls overlapped"
+        else:
+            base, base_name = self.wall, "wall time"
+        lines = [f"Queries: {self.queries}, phase time summed over calls"]
+        lines.append(f"  {'phase':<16} {'time':>12} {'share of ' + base_name}")
+        for phase, seconds in self.as_dict().items():
+            if seconds is None:
+                continue
+            share = seconds / base * 100 if base else 0.0
+            lines.append(f"  {phase:<16} {seconds * 1000:>10.1f}ms {share:>6.1f}%")
+        if self.top:
+            lines.append(self.top)
+        return "\n".join(lines)
+
+
+@contextmanager
+def profile_calls(
+    path: Optional[str] = None, top: int = 15
+) -> Iterator[ProfileSummary]:
+    """Profile block with :mod:`cProfile` and summarize query calls made in it
+
+    Only calling thread is profiled by :mod:`cProfile`, calls made in other threads
+    are included in summary phases, but not in ``path`` data and top functions.
+
+    :param Optional[str] path: File to write :mod:`pstats` data to
+    :param int top: Number of functions by cumulative time to add to summary
+    """
+    summary = ProfileSummary()
+    profiler = cProfile.Profile()
+    hooks.subscribe("after_call", summary.add)
+    started = time.perf_counter()
+    profiler.enable()
+    try:
+        yield summary
+    finally:
+        profiler.disable()
+        summary.wall = time.perf_counter() - started
+        hooks.unsubscribe("after_call", summary.add)
+
+        if path:
+            profiler.dump_stats(path)
+        if top:
+            stream = io.StringIO()
+            stats = pstats.Stats(profiler, stream=stream)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+            summary.top = stream.getvalue().strip()
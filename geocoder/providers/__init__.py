@@ -1,140 +1,144 @@
-# flake8: noqa
-from geocoder.providers.arcgis import (
-    ArcgisQuery,
-    ArcgisResult,
-    ArcgisReverse,
-    ArcgisReverseResult,
-)
-from geocoder.providers.baidu import (
-    BaiduQuery,
-    BaiduResult,
-    BaiduReverse,
-    BaiduReverseResult,
-)
-from geocoder.providers.bing import (
-    BingBatch,
-    BingBatchForward,
-    BingBatchForwardResult,
-    BingBatchResult,
-    BingBatchReverse,
-    BingBatchReverseResult,
-    BingQuery,
-    BingQueryDetail,
-    BingResult,
-    BingReverse,
-    BingReverseResult,
-)
-from geocoder.providers.canadapost import (
-    CanadapostIdQuery,
-    CanadapostIdResult,
-    CanadapostQuery,
-    CanadapostResult,
-)
-from geocoder.providers.freegeoip import FreeGeoIPQuery, FreeGeoIPResult
-from geocoder.providers.gaode import (
-    GaodeQuery,
-    GaodeResult,
-    GaodeReverse,
-    GaodeReverseResult,
-)
-from geocoder.providers.geocodefarm import (
-    GeocodeFarmQuery,
-    GeocodeFarmResult,
-    GeocodeFarmReverse,
-)
-from geocoder.providers.geocodexyz import GeocodeXYZQuery, GeocodeXYZResult
-from geocoder.providers.geolytica import GeolyticaQuery, GeolyticaResult
-from geocoder.providers.geonames import (
-    GeonamesChildren,
-    GeonamesDetails,
-    GeonamesFullResult,
-    GeonamesHierarchy,
-    GeonamesQuery,
-    GeonamesResult,
-    GeonamesTimezone,
-    GeonamesTimezoneResult,
-)
-from geocoder.providers.gisgraphy import (
-    GisgraphyQuery,
-    GisgraphyResult,
-    GisgraphyReverse,
-    GisgraphyReverseResult,
-)
-from geocoder.providers.google import (
-    GoogleElevationQuery,
-    GoogleElevationResult,
-    GooglePlacesQuery,
-    GooglePlacesResult,
-    GoogleQuery,
-    GoogleResult,
-    GoogleReverse,
-    GoogleReverseResult,
-    GoogleTimezone,
-    GoogleTimezoneResult,
-)
-from geocoder.providers.here import (
-    HereQuery,
-    HereResult,
-    HereReverse,
-    HereReverseResult,
-)
-from geocoder.providers.ipfinder import IpfinderQuery, IpfinderResult
-from geocoder.providers.ipinfo import IpinfoQuery, IpinfoResult
-from geocoder.providers.komoot import (
-    KomootQuery,
-    KomootResult,
-    KomootReverse,
-    KomootReverseResult,
-)
-from geocoder.providers.locationiq import (
-    LocationIQQuery,
-    LocationIQResult,
-    LocationIQReverse,
-)
-from geocoder.providers.mapbox import (
-    MapboxQuery,
-    MapboxResult,
-    MapboxReverse,
-    MapboxReverseResult,
-)
-from geocoder.providers.mapquest import (
-    MapquestBatch,
-    MapQuestBatchResult,
-    MapquestQuery,
-    MapquestResult,
-    MapquestReverse,
-    MapQuestReverseResult,
-)
-from geocoder.providers.mapzen import (
-    MapzenQuery,
-    MapzenResult,
-    MapzenReverse,
-    MapzenReverseResult,
-)
-from geocoder.providers.maxmind import MaxmindQuery, MaxmindResults
-from geocoder.providers.opencage import (
-    OpenCageQuery,
-    OpenCageResult,
-    OpenCageReverse,
-    OpenCageReverseResult,
-)
-from geocoder.providers.osm import OsmQuery, OsmQueryDetail, OsmResult, OsmReverse
-from geocoder.providers.tamu import TamuQuery, TamuResult
-from geocoder.providers.tgos import TgosQuery, TgosResult
-from geocoder.providers.tomtom import TomtomQuery, TomtomResult
-from geocoder.providers.uscensus import (
-    USCensusBatch,
-    USCensusBatchResult,
-    USCensusQuery,
-    USCensusResult,
-    USCensusReverse,
-    USCensusReverseResult,
-)
-from geocoder.providers.w3w import W3WQuery, W3WResult, W3WReverse, W3WReverseResult
-from geocoder.providers.yahoo import YahooQuery, YahooResult
-from geocoder.providers.yandex import (
-    YandexQuery,
-    YandexResult,
-    YandexReverse,
-    YandexReverseResult,
-)
+"""
+Implementations of all supported providers.
+
+Provider modules are imported on first access of any of their classes, so usage of
+one provider does not require import of all others.
+"""
+import importlib
+
+_CLASSES_MODULES = {
+    "ArcgisQuery": "arcgis",
+    "ArcgisResult": "arcgis",
+    "ArcgisReverse": "arcgis",
+    "ArcgisReverseResult": "arcgis",
+    "BaiduQuery": "baidu",
+    "BaiduResult": "baidu",
+    "BaiduReverse": "baidu",
+    "BaiduReverseResult": "baidu",
+    "BingBatch": "bing",
+    "BingBatchForward": "bing",
+    "BingBatchForwardResult": "bing",
+    "BingBatchResult": "bing",
+    "BingBatchReverse": "bing",
+    "BingBatchReverseResult": "bing",
+    "BingQuery": "bing",
+    "BingQueryDetail": "bing",
+    "BingResult": "bing",
+    "BingReverse": "bing",
+    "BingReverseResult": "bing",
+    "CanadapostIdQuery": "canadapost",
+    "CanadapostIdResult": "canadapost",
+    "CanadapostQuery": "canadapost",
+    "CanadapostResult": "canadapost",
+    "FreeGeoIPQuery": "freegeoip",
+    "FreeGeoIPResult": "freegeoip",
+    "GaodeQuery": "gaode",
+    "GaodeResult": "gaode",
+    "GaodeReverse": "gaode",
+    "GaodeReverseResult": "gaode",
+    "GeocodeFarmQuery": "geocodefarm",
+    "GeocodeFarmResult": "geocodefarm",
+    "GeocodeFarmReverse": "geocodefarm",
+    "GeocodeXYZQuery": "geocodexyz",
+    "GeocodeXYZResult": "geocodexyz",
+    "GeolyticaQuery": "geolytica",
+    "GeolyticaResult": "geolytica",
+    "GeonamesChildren": "geonames",
+    "GeonamesDetails": "geonames",
+    "GeonamesFullResult": "geonames",
+    "GeonamesHierarchy": "geonames",
+    "GeonamesQuery": "geonames",
+    "GeonamesResult": "geonames",
+    "GeonamesTimezone": "geonames",
+    "GeonamesTimezoneResult": "geonames",
+    "GisgraphyQuery": "gisgraphy",
+    "GisgraphyResult": "gisgraphy",
+    "GisgraphyReverse": "gisgraphy",
+    "GisgraphyReverseResult": "gisgraphy",
+    "GoogleElevationQuery": "google",
+    "GoogleElevationResult": "google",
+    "GooglePlacesQuery": "google",
+    "GooglePlacesResult": "google",
+    "GoogleQuery": "google",
+    "GoogleResult": "google",
+    "GoogleReverse": "google",
+    "GoogleReverseResult": "google",
+    "GoogleTimezone": "google",
+    "GoogleTimezoneResult": "google",
+    "HereQuery": "here",
+    "HereResult": "here",
+    "HereReverse": "here",
+    "HereReverseResult": "here",
+    "IpfinderQuery": "ipfinder",
+    "IpfinderResult": "ipfinder",
+    "IpinfoQuery": "ipinfo",
+    "IpinfoResult": "ipinfo",
+    "KomootQuery": "komoot",
+    "KomootResult": "komoot",
+    "KomootReverse": "komoot",
+    "KomootReverseResult": "komoot",
+    "LocationIQQuery": "locationiq",
+    "LocationIQResult": "locationiq",
+    "LocationIQReverse": "locationiq",
+    "MapboxQuery": "mapbox",
+    "MapboxResult": "mapbox",
+    "MapboxReverse": "mapbox",
+    "MapboxReverseResult": "mapbox",
+    "MapquestBatch": "mapquest",
+    "MapQuestBatchResult": "mapquest",
+    "MapquestQuery": "mapquest",
+    "MapquestResult": "mapquest",
+    "MapquestReverse": "mapquest",
+    "MapQuestReverseResult": "mapquest",
+    "MapzenQuery": "mapzen",
+    "MapzenResult": "mapzen",
+    "MapzenReverse": "mapzen",
+    "MapzenReverseResult": "mapzen",
+    "MaxmindQuery": "maxmind",
+    "MaxmindResults": "maxmind",
+    "OpenCageQuery": "opencage",
+    "OpenCageResult": "opencage",
+    "OpenCageReverse": "opencage",
+    "OpenCageReverseResult": "opencage",
+    "OsmQuery": "osm",
+    "OsmQueryDetail": "osm",
+    "OsmResult": "osm",
+    "OsmReverse": "osm",
+    "TamuQuery": "tamu",
+    "TamuResult": "tamu",
+    "TgosQuery": "tgos",
+    "TgosResult": "tgos",
+    "TomtomQuery": "tomtom",
+    "TomtomResult": "tomtom",
+    "USCensusBatch": "uscensus",
+    "USCensusBatchResult": "uscensus",
+    "USCensusQuery": "uscensus",
+    "USCensusResult": "uscensus",
+    "USCensusReverse": "uscensus",
+    "USCensusReverseResult": "uscensus",
+    "W3WQuery": "w3w",
+    "W3WResult": "w3w",
+    "W3WReverse": "w3w",
+    "W3WReverseResult": "w3w",
+    "YahooQuery": "yahoo",
+    "YahooResult": "yahoo",
+    "YandexQuery": "yandex",
+    "YandexResult": "yandex",
+    "YandexReverse": "yandex",
+    "YandexReverseResult": "yandex",
+}
+
+__all__ = list(_CLASSES_MODULES)
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _CLASSES_MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(f"{__name__}.{module_name}")
+    return getattr(module, name)
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
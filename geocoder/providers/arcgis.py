@@ -1,7 +1,7 @@
 __all__ = ["ArcgisQuery", "ArcgisResult", "ArcgisReverseResult", "ArcgisReverse"]
 from typing import List
 
-from geocoder.base import MultipleResultsQuery, OneResult
+from geocoder.base import MultipleResultsQuery, OneResult, memoized_property
 from geocoder.location import Location
 
 
@@ -33,7 +33,7 @@ class ArcgisResult(OneResult):
     def quality(self):
         return self._feature.get("attributes", {}).get("Addr_Type", "")
 
-    @property
+    @memoized_property
     def bbox(self) -> List[float]:
         """Output answer as GeoJSON bbox if it can be calculated/retrieved."""
         _extent = self.object_raw_json.get("extent")
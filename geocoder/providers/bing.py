@@ -20,7 +20,14 @@ from typing import List, Optional
 
 import requests
 
-from geocoder.base import MultipleResultsQuery, OneResult
+from geocoder import hooks, jsonlib
+from geocoder.base import (
+    LazyResults,
+    MultipleResultsQuery,
+    OneResult,
+    _json_content,
+    memoized_property,
+)
 from geocoder.keys import bing_key
 from geocoder.location import Location
 
@@ -93,7 +100,7 @@ class BingResult(OneResult):
     def postal(self):
         return self._address.get("postalCode")
 
-    @property
+    @memoized_property
     def bbox(self) -> List[float]:
         """Output answer as GeoJSON bbox if it can be calculated/retrieved."""
         _bbox = self.object_raw_json.get("bbox")
@@ -241,8 +248,8 @@ class BingQueryDetail(MultipleResultsQuery):
 
 
 class BingBatchResult(OneResult):
-    # noinspection PyMissingConstructor
     def __init__(self, content):
+        super().__init__(content)
         self._content = content
 
     @property
@@ -295,6 +302,8 @@ class BingBatch(MultipleResultsQuery):
     _URL = "http://spatial.virtualearth.net/REST/v1/Dataflows/Geocode"
     _BATCH_TIMEOUT = 60
     _BATCH_WAIT = 5
+    _MAX_BODY_SIZE = 128 * 1024 * 1024
+    _LEAN_DROP = MultipleResultsQuery._LEAN_DROP + ("response", "batch")
 
     _RESULT_CLASS = BingBatchResult
     _KEY = bing_key
@@ -307,16 +316,22 @@ class BingBatch(MultipleResultsQuery):
 
         raise LookupError("No job ID returned from Bing batch call")
 
+    def job_url(self, job_id) -> str:
+        """Job status url, built from dataflow url, so it follows ``url`` option"""
+        return f"{self.url.split('?', 1)[0]}/{job_id}"
+
     def is_job_done(self, job_id):
-        url = f"http://spatial.virtualearth.net/REST/v1/Dataflows/Geocode/{job_id}"
+        url = self.job_url(job_id)
         response = self.session.get(
             url,
             params={"key": self.provider_key},
             timeout=self.timeout,
             proxies=self.proxies,
+            stream=True,
         )
 
-        for rs in response.json()["resourceSets"]:
+        content = _json_content(self._read_body(response), response.headers)
+        for rs in jsonlib.loads(content)["resourceSets"]:
             for resource in rs["resources"]:
                 if resource["id"] == job_id:
                     if resource["status"] == "Aborted":
@@ -326,20 +341,21 @@ class BingBatch(MultipleResultsQuery):
         raise LookupError("Job ID not found in Bing answer - something is wrong")
 
     def get_job_result(self, job_id):
-        url = f"http://spatial.virtualearth.net/REST/v1/Dataflows/Geocode/{job_id}/output/succeeded"  # noqa
+        url = f"{self.job_url(job_id)}/output/succeeded"
 
         response = self.session.get(
             url,
             params={"key": self.provider_key},
             timeout=self.timeout,
             proxies=self.proxies,
+            stream=True,
         )
 
-        return response.content
+        return self._read_body(response)
 
     def _build_params(self, locations, provider_key, **kwargs):
+        locations = self._deduplicate_batch(locations, kwargs.get("deduplicate", True))
         self.batch = self.generate_batch(locations)
-        self.locations_length = len(locations)
         self.provider_key = provider_key
         self._BATCH_TIMEOUT = kwargs.get("timeout", 60)
 
@@ -352,6 +368,7 @@ class BingBatch(MultipleResultsQuery):
         self.status_code = "Unknown"
 
         try:
+            started = time.perf_counter()
             self.response = response = self.session.post(
                 self.url,
                 data=self.batch,
@@ -359,14 +376,18 @@ class BingBatch(MultipleResultsQuery):
                 headers=self.headers,
                 timeout=self.timeout,
                 proxies=self.proxies,
+                stream=True,
             )
+            self.timings.record_response(response, time.perf_counter() - started)
 
             # check that response is ok
             self.status_code = response.status_code
+            content = self._read_body(response)
             response.raise_for_status()
 
-            # rely on json method to get non-empty well formatted JSON
-            json_response = response.json()
+            # decode non-empty well formatted JSON directly from response bytes
+            with self.timings.measure("decode"):
+                json_response = jsonlib.loads(_json_content(content, response.headers))
             self.url = response.url
             logger.info("Requested %s", self.url)
 
@@ -376,7 +397,18 @@ class BingBatch(MultipleResultsQuery):
 
             # try for _BATCH_TIMEOUT seconds to retrieve the results of that job
             while elapsed < self._BATCH_TIMEOUT:
-                if self.is_job_done(resource_id):
+                poll_started = time.perf_counter()
+                done = self.is_job_done(resource_id)
+                self.timings.polls.append(time.perf_counter() - poll_started)
+                hooks.emit(
+                    "on_batch_poll",
+                    self,
+                    job_id=resource_id,
+                    attempt=len(self.timings.polls),
+                    done=done,
+                    elapsed=self.timings.polls[-1],
+                )
+                if done:
                     return self.get_job_result(resource_id)
 
                 elapsed += self._BATCH_WAIT
@@ -384,7 +416,8 @@ class BingBatch(MultipleResultsQuery):
 
             logger.error("Job was not finished in time.")
 
-        except (requests.exceptions.RequestException, LookupError) as err:
+        except (requests.exceptions.RequestException, LookupError, ValueError) as err:
+            self.exception = err
             self.error = f"ERROR - {str(err)}"
             logger.error(
                 "Status code %s from %s: %s", self.status_code, self.url, self.error
@@ -393,11 +426,14 @@ class BingBatch(MultipleResultsQuery):
         return False
 
     def _parse_results(self, response):
-        rows = self._adapt_results(response)
+        with self.timings.measure("adapt"):
+            rows = self._adapt_results(response)
 
-        # re looping through the results to give them back in their original order
-        for idx in range(self.locations_length):
-            self.add(self._RESULT_CLASS(rows.get(str(idx), None)))
+        # results are given back in original order, duplicated rows share result
+        self.results_list = LazyResults(
+            (rows.get(str(position)) for position in self.batch_positions),
+            self._build_result,
+        )
 
         self.current_result = len(self) > 0 and self[0]
 
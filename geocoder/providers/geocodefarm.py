@@ -1,7 +1,7 @@
 __all__ = ["GeocodeFarmResult", "GeocodeFarmQuery", "GeocodeFarmReverse"]
 from typing import List
 
-from geocoder.base import MultipleResultsQuery, OneResult
+from geocoder.base import MultipleResultsQuery, OneResult, memoized_property
 from geocoder.keys import geocodefarm_key
 from geocoder.location import Location
 
@@ -33,7 +33,7 @@ class GeocodeFarmResult(OneResult):
     def accuracy(self):
         return self.object_raw_json.get("accuracy")
 
-    @property
+    @memoized_property
     def bbox(self) -> List[float]:
         """Output answer as GeoJSON bbox if it can be calculated/retrieved."""
         south = self._boundaries.get("southwest_latitude")
@@ -125,9 +125,7 @@ class GeocodeFarmQuery(MultipleResultsQuery):
     _KEY = geocodefarm_key
     _KEY_MANDATORY = False
 
-    def __init__(self, location, **kwargs):
-        super(GeocodeFarmQuery, self).__init__(location, **kwargs)
-
+    def _before_initialize(self, location, **kwargs):
         self.api_status = {}
         self.api_account = {}
 
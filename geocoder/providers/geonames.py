@@ -11,7 +11,7 @@ __all__ = [
 import logging
 from typing import List
 
-from geocoder.base import MultipleResultsQuery, OneResult
+from geocoder.base import MultipleResultsQuery, OneResult, memoized_property
 from geocoder.keys import geonames_username
 from geocoder.location import BBox, Location
 
@@ -259,7 +259,7 @@ class GeonamesFullResult(GeonamesResult):
         if timezone:
             return timezone.get("dstOffset")
 
-    @property
+    @memoized_property
     def bbox(self) -> List[float]:
         """Output answer as GeoJSON bbox if it can be calculated/retrieved."""
         bbox = self.object_raw_json.get("bbox", {})
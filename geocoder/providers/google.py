@@ -15,16 +15,23 @@ import hashlib
 import hmac
 import time
 from collections import OrderedDict
+from functools import lru_cache
 from typing import List, Optional
 from urllib.parse import urlencode, urlparse
 
 import ratelim
 
-from geocoder.base import MultipleResultsQuery, OneResult
+from geocoder.base import MultipleResultsQuery, OneResult, memoized_property
 from geocoder.keys import google_client, google_client_secret, google_key
 from geocoder.location import BBox, Location
 
 
+@lru_cache(maxsize=16)
+def _decode_client_secret(client_secret: str) -> bytes:
+    """Decode URL-encoded private key into its binary format once per secret"""
+    return base64.urlsafe_b64decode(client_secret)
+
+
 class GoogleResult(OneResult):
     def __init__(self, json_content):
         # flatten geometry
@@ -65,7 +72,7 @@ class GoogleResult(OneResult):
     def accuracy(self):
         return self._location_type
 
-    @property
+    @memoized_property
     def bbox(self) -> List[float]:
         """Output answer as GeoJSON bbox if it can be calculated/retrieved."""
         south = self._viewport.get("southwest", {}).get("lat")
@@ -257,7 +264,7 @@ class GoogleQuery(MultipleResultsQuery):
 
         # Decode the private key into its binary format
         # We need to decode the URL-encoded private key
-        decoded_key = base64.urlsafe_b64decode(client_secret)
+        decoded_key = _decode_client_secret(client_secret)
 
         # Create a signature using the private key and the URL-encoded
         # string using HMAC SHA1. This signature will be binary.
@@ -507,9 +514,7 @@ class GooglePlacesQuery(MultipleResultsQuery):
     _RESULT_CLASS = GooglePlacesResult
     _KEY = google_key
 
-    def __init__(self, location, **kwargs):
-        super(GooglePlacesQuery, self).__init__(location, **kwargs)
-
+    def _before_initialize(self, location, **kwargs):
         self.next_page_token = None
 
     def _build_params(self, location, provider_key, **kwargs):
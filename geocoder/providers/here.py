@@ -6,7 +6,7 @@ __all__ = [
 ]
 from typing import List
 
-from geocoder.base import MultipleResultsQuery, OneResult
+from geocoder.base import MultipleResultsQuery, OneResult, memoized_property
 from geocoder.keys import here_app_code, here_app_id
 from geocoder.location import BBox, Location
 
@@ -78,7 +78,7 @@ class HereResult(OneResult):
     def accuracy(self):
         return self.object_raw_json.get("MatchType")
 
-    @property
+    @memoized_property
     def bbox(self) -> List[float]:
         """Output answer as GeoJSON bbox if it can be calculated/retrieved."""
         south = self._mapview["BottomRight"].get("Latitude")
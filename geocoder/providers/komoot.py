@@ -6,7 +6,7 @@ __all__ = [
 ]
 from typing import List
 
-from geocoder.base import MultipleResultsQuery, OneResult
+from geocoder.base import MultipleResultsQuery, OneResult, memoized_property
 from geocoder.location import Location
 
 
@@ -27,7 +27,7 @@ class KomootResult(OneResult):
     def lng(self):
         return self._geometry["coordinates"][0]
 
-    @property
+    @memoized_property
     def bbox(self) -> List[float]:
         """Output answer as GeoJSON bbox if it can be calculated/retrieved."""
         extent = self._properties.get("extent")
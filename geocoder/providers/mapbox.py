@@ -2,7 +2,7 @@ __all__ = ["MapboxResult", "MapboxQuery", "MapboxReverseResult", "MapboxReverse"
 
 from typing import List
 
-from geocoder.base import MultipleResultsQuery, OneResult
+from geocoder.base import MultipleResultsQuery, OneResult, memoized_property
 from geocoder.keys import mapbox_access_token
 from geocoder.location import BBox, Location
 
@@ -72,7 +72,7 @@ class MapboxResult(OneResult):
     def interpolated(self):
         return self._geometry.get("interpolated")
 
-    @property
+    @memoized_property
     def bbox(self) -> List[float]:
         """Output answer as GeoJSON bbox if it can be calculated/retrieved."""
         _bbox = self.object_raw_json.get("bbox")
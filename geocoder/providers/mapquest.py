@@ -7,10 +7,14 @@ __all__ = [
     "MapquestReverse",
 ]
 
+import logging
+
 from geocoder.base import MultipleResultsQuery, OneResult
 from geocoder.keys import mapquest_key
 from geocoder.location import BBox, Location
 
+logger = logging.getLogger(__name__)
+
 
 class MapquestResult(OneResult):
     @property
@@ -141,6 +145,7 @@ class MapquestBatch(MultipleResultsQuery):
     _RESULT_CLASS = MapQuestBatchResult
     _URL = "http://www.mapquestapi.com/geocoding/v1/batch"
     _TIMEOUT = 30
+    _MAX_BODY_SIZE = 128 * 1024 * 1024
     _KEY = mapquest_key
 
     def _build_params(
@@ -151,6 +156,11 @@ class MapquestBatch(MultipleResultsQuery):
         **kwargs,
     ):
         self._TIMEOUT = kwargs.get("timeout", 30)
+        self.batch_positions = None
+        if isinstance(location, (list, tuple)):
+            location = self._deduplicate_batch(
+                location, kwargs.get("deduplicate", True)
+            )
 
         return {
             "key": provider_key,
@@ -161,10 +171,23 @@ class MapquestBatch(MultipleResultsQuery):
 
     def _adapt_results(self, json_response):
         results = json_response.get("results", [])
-        if results:
-            return [result["locations"][0] for result in results]
-
-        return []
+        if not results:
+            return []
+
+        locations = [result["locations"][0] for result in results]
+        positions = self.batch_positions
+        if positions is None:
+            return locations
+        if len(locations) != max(positions, default=-1) + 1:
+            # results cannot be matched to input rows
+            self.error = (
+                f"ERROR - {len(locations)} results for "
+                f"{max(positions, default=-1) + 1} uploaded locations"
+            )
+            logger.error("Mapquest batch answer mismatch: %s", self.error)
+            return []
+        # duplicated rows share result of uploaded location
+        return [locations[position] for position in positions]
 
 
 class MapQuestReverseResult(MapquestResult):
@@ -6,12 +6,17 @@ __all__ = [
 ]
 from typing import List
 
-from geocoder.base import MultipleResultsQuery, OneResult
+from geocoder.base import MultipleResultsQuery, OneResult, memoized_property
 from geocoder.keys import opencage_key
 from geocoder.location import Location
 
 
 class OpenCageResult(OneResult):
+    # properties, that require annotations in provider answer
+    _ANNOTATION_FIELDS = frozenset(
+        ["DMS", "Maidenhead", "Mercator", "callingcode", "geohash", "mgrs", "w3w"]
+    )
+
     def __init__(self, json_content):
         # create safe shortcuts
         self._geometry = json_content.get("geometry", {})
@@ -297,7 +302,7 @@ class OpenCageResult(OneResult):
     def Mercator(self):
         return self._annotations.get("Mercator")
 
-    @property
+    @memoized_property
     def bbox(self) -> List[float]:
         """Output answer as GeoJSON bbox if it can be calculated/retrieved."""
         south = self._bounds.get("southwest", {}).get("lat")
@@ -331,6 +336,12 @@ class OpenCageQuery(MultipleResultsQuery):
     _RESULT_CLASS = OpenCageResult
     _KEY = opencage_key
 
+    def _build_field_params(self, fields: tuple) -> dict:
+        """Skip annotations, when no annotation field is requested"""
+        if self._RESULT_CLASS._ANNOTATION_FIELDS.isdisjoint(fields):
+            return {"no_annotations": 1}
+        return {}
+
     def _build_params(
         self,
         location,
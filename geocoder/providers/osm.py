@@ -1,11 +1,39 @@
 __all__ = ["OsmResult", "OsmQuery", "OsmQueryDetail", "OsmReverse"]
 from typing import List, Optional
 
-from geocoder.base import MultipleResultsQuery, OneResult
+from geocoder.base import MultipleResultsQuery, OneResult, memoized_property
 from geocoder.location import Location
 
 
 class OsmResult(OneResult):
+    # properties, that require addressdetails in provider answer
+    _ADDRESS_FIELDS = frozenset(
+        [
+            "allotments",
+            "city",
+            "country",
+            "country_code",
+            "county",
+            "district",
+            "farm",
+            "hamlet",
+            "house_number",
+            "island",
+            "isolated_dwelling",
+            "locality",
+            "municipality",
+            "neighborhood",
+            "postal",
+            "quarter",
+            "region",
+            "state",
+            "street",
+            "suburb",
+            "town",
+            "village",
+        ]
+    )
+
     def __init__(self, json_content):
         # create safe shortcuts
         self._address = json_content.get("address", {})
@@ -17,17 +45,17 @@ class OsmResult(OneResult):
     # Geometry - Points & Polygons #
     # ============================ #
 
-    @property
+    @memoized_property
     def lat(self) -> Optional[float]:
         lat = self.object_raw_json.get("lat")
         return float(lat) if lat else None
 
-    @property
+    @memoized_property
     def lng(self) -> Optional[float]:
         lng = self.object_raw_json.get("lon")
         return float(lng) if lng else None
 
-    @property
+    @memoized_property
     def bbox(self) -> List[float]:
         """Output answer as GeoJSON bbox if it can be calculated/retrieved."""
         _boundingbox = self.object_raw_json.get("boundingbox")
@@ -325,10 +353,18 @@ class OsmQuery(MultipleResultsQuery):
             "limit": max_results,
         }
 
+    def _build_field_params(self, fields: tuple) -> dict:
+        """Skip address details, when no address field is requested"""
+        if self._RESULT_CLASS._ADDRESS_FIELDS.isdisjoint(fields):
+            return {"addressdetails": 0}
+        return {}
+
 
 class OsmQueryDetail(OsmQuery):
 
     _METHOD = "details"
+    # polygon outputs of large areas are heavy
+    _MAX_BODY_SIZE = 64 * 1024 * 1024
 
     def _build_params(
         self,
@@ -1,7 +1,7 @@
 __all__ = ["TomtomQuery", "TomtomResult"]
 from typing import List
 
-from geocoder.base import MultipleResultsQuery, OneResult
+from geocoder.base import MultipleResultsQuery, OneResult, memoized_property
 from geocoder.keys import tomtom_key
 
 
@@ -26,7 +26,7 @@ class TomtomResult(OneResult):
     def quality(self):
         return self.object_raw_json.get("type")
 
-    @property
+    @memoized_property
     def bbox(self) -> List[float]:
         """Output answer as GeoJSON bbox if it can be calculated/retrieved."""
         viewport = self.object_raw_json.get("viewport", {})
@@ -11,11 +11,12 @@ import csv
 import io
 import logging
 import re
+import time
 from typing import Optional
 
 import requests
 
-from geocoder.base import MultipleResultsQuery, OneResult
+from geocoder.base import LazyResults, MultipleResultsQuery, OneResult
 from geocoder.location import Location
 
 logger = logging.getLogger(__name__)
@@ -173,6 +174,8 @@ class USCensusBatch(MultipleResultsQuery):
     _URL = "https://geocoding.geo.census.gov/geocoder/locations/addressbatch"
     _RESULT_CLASS = USCensusBatchResult
     _KEY_MANDATORY = False
+    _MAX_BODY_SIZE = 128 * 1024 * 1024
+    _LEAN_DROP = MultipleResultsQuery._LEAN_DROP + ("response", "batch")
 
     def generate_batch(self, locations):
         out = io.StringIO()
@@ -184,8 +187,8 @@ class USCensusBatch(MultipleResultsQuery):
         return out.getvalue().encode("utf-8")
 
     def _build_params(self, locations, provider_key, **kwargs):
+        locations = self._deduplicate_batch(locations, kwargs.get("deduplicate", True))
         self.batch = self.generate_batch(locations)
-        self.locations_length = len(locations)
         self.timeout = int(
             kwargs.get("timeout", "1800")
         )  # 30mn timeout, us census can be really slow with big batches
@@ -200,21 +203,26 @@ class USCensusBatch(MultipleResultsQuery):
         self.status_code = "Unknown"
 
         try:
+            started = time.perf_counter()
             self.response = response = self.session.post(
                 self.url,
                 files=self.params,
                 headers=self.headers,
                 timeout=self.timeout,
                 proxies=self.proxies,
+                stream=True,
             )
+            self.timings.record_response(response, time.perf_counter() - started)
 
             # check that response is ok
             self.status_code = response.status_code
+            content = self._read_body(response)
             response.raise_for_status()
 
-            return response.content
+            return content
 
         except (requests.exceptions.RequestException, LookupError) as err:
+            self.exception = err
             self.error = f"ERROR - {str(err)}"
             logger.error(
                 "Status code %s from %s: %s", self.status_code, self.url, self.error
@@ -230,11 +238,14 @@ class USCensusBatch(MultipleResultsQuery):
         }
 
     def _parse_results(self, response):
-        rows = self._adapt_results(response)
+        with self.timings.measure("adapt"):
+            rows = self._adapt_results(response)
 
-        # re looping through the results to give them back in their original order
-        for idx in range(self.locations_length):
-            self.add(self._RESULT_CLASS(rows.get(str(idx), None)))
+        # results are given back in original order, duplicated rows share result
+        self.results_list = LazyResults(
+            (rows.get(str(position)) for position in self.batch_positions),
+            self._build_result,
+        )
 
         self.current_result = len(self) > 0 and self[0]
 
@@ -1,7 +1,7 @@
 __all__ = ["YandexResult", "YandexQuery", "YandexReverse", "YandexReverseResult"]
 from typing import List
 
-from geocoder.base import MultipleResultsQuery, OneResult
+from geocoder.base import MultipleResultsQuery, OneResult, memoized_property
 from geocoder.keys import yandex_key
 from geocoder.location import Location
 
@@ -23,7 +23,7 @@ class YandexResult(OneResult):
         if pos:
             return pos.split(" ")[0]
 
-    @property
+    @memoized_property
     def bbox(self) -> List[float]:
         """Output answer as GeoJSON bbox if it can be calculated/retrieved."""
         envelope = self._meta_data.get("boundedBy", {}).get("Envelope", {})
@@ -0,0 +1,300 @@
+"""
+Streaming geocoding of large inputs.
+
+Locations are read lazily from text, CSV or NDJSON streams, geocoded with bounded
+number of concurrent workers, and written incrementally in input order as NDJSON,
+CSV or GeoJSON, so memory usage does not depend on input size:
+
+    >>> import sys
+    >>> from geocoder.streaming import NDJSONWriter, geocode_stream, read_locations
+    >>> with open("addresses.csv") as addresses:
+    ...     locations = read_locations(addresses, "csv", column="address")
+    ...     with NDJSONWriter(sys.stdout) as writer:
+    ...         for location, g in geocode_stream(locations, workers=8):
+    ...             writer.write(location, g)
+"""
+__all__ = [
+    "CSVWriter",
+    "GeoJSONWriter",
+    "NDJSONWriter",
+    "geocode_stream",
+    "ordered_map",
+    "read_locations",
+]
+
+import csv
+import io
+import itertools
+import os
+from abc import ABCMeta, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Callable, Iterable, Iterator, Optional, Tuple
+
+from geocoder import jsonlib
+from geocoder.api import get_results
+from geocoder.transport import requests_session
+
+INPUT_FORMATS = ("text", "csv", "ndjson")
+OUTPUT_FORMATS = ("ndjson", "csv", "geojson")
+
+
+def detect_format(path: str) -> str:
+    """Input format by file extension, ``text`` for unknown extensions"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        return "csv"
+    if extension in (".ndjson", ".jsonl"):
+        return "ndjson"
+    return "text"
+
+
+def read_locations(
+    stream: IO, input_format: str = "text", column: Optional[str] = None
+) -> Iterator[str]:
+    """Lazily read non-empty locations from text stream
+
+    :param IO stream: Text stream, read line by line
+    :param str input_format: One of :data:`INPUT_FORMATS`
+    :param Optional[str] column: CSV column name, or zero-based index for CSV without
+        header. NDJSON object key, ``location`` by default. Not used for text.
+    :raises ValueError: On unknown format, missing column, or NDJSON record, that
+        is neither string nor object
+    """
+    if input_format == "text":
+        for line in stream:
+            line = line.strip()
+            if line:
+                yield line
+    elif input_format == "csv":
+        if column is None or column.isdigit():
+            index = int(column or 0)
+            for row in csv.reader(stream):
+                if len(row) > index and row[index].strip():
+                    yield row[index].strip()
+            return
+        reader = csv.DictReader(stream)
+        if reader.fieldnames is None or column not in reader.fieldnames:
+            raise ValueError(f"Column {column} not found in CSV header")
+        for row in reader:
+            if row[column] and row[column].strip():
+                yield row[column].strip()
+    elif input_format == "ndjson":
+        key = column or "location"
+        for number, line in enumerate(stream, 1):
+            if not line.strip():
+                continue
+            record = jsonlib.loads(line)
+            if isinstance(record, dict):
+                value = record.get(key)
+            elif isinstance(record, str):
+                value = record
+            else:
+                raise ValueError(
+                    f"NDJSON line {number} should be string or object, "
+                    f"got {type(record).__name__}"
+                )
+            if value:
+                yield value
+    else:
+        raise ValueError(f"Unknown input format {input_format}")
+
+
+def ordered_map(
+    func: Callable, items: Iterable, workers: int = 1
+) -> Iterator[Tuple[object, object]]:
+    """Apply function to items concurrently, yield ``(item, result)`` in input order
+
+    Only ``2 * workers`` items are read ahead, so any long input is processed with
+    constant memory.
+
+    :param Callable func: Function of one item
+    :param Iterable items: Items, consumed lazily
+    :param int workers: Number of concurrent threads
+    """
+    if workers <= 1:
+        for item in items:
+            yield item, func(item)
+        return
+
+    items = iter(items)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque(
+            (item, executor.submit(func, item))
+            for item in itertools.islice(items, 2 * workers)
+        )
+        while pending:
+            item, future = pending.popleft()
+            result = future.result()
+            for next_item in itertools.islice(items, 1):
+                pending.append((next_item, executor.submit(func, next_item)))
+            yield item, result
+
+
+def geocode_stream(
+    locations: Iterable[str], workers: int = 1, **kwargs
+) -> Iterator[Tuple[str, object]]:
+    """Geocode locations with shared connection pool, in input order
+
+    :param Iterable[str] locations: Locations, consumed lazily
+    :param int workers: Number of concurrent requests
+    :param kwargs: :func:`geocoder.get_results` options, like ``provider``
+    """
+    session = kwargs.pop("session", None) or requests_session(pool_maxsize=workers)
+    try:
+        yield from ordered_map(
+            lambda location: get_results(location, session=session, **kwargs),
+            locations,
+            workers,
+        )
+    finally:
+        session.close()
+
+
+class _Writer(metaclass=ABCMeta):
+    """Incremental output writer, used as context manager
+
+    Each location is written as serialized text chunk, so already serialized
+    chunks, like ones kept in :class:`geocoder.manifest.ManifestPipeline`, can be
+    written again without query.
+
+    :param IO stream: Text stream to write to
+    """
+
+    name = ""
+
+    def __init__(self, stream: IO):
+        self.stream = stream
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def signature(self) -> str:
+        """Output format description, chunks of same signature are compatible"""
+        return self.name
+
+    @abstractmethod
+    def serialize(self, location: str, query) -> str:
+        """Text chunk of one location"""
+
+    def write(self, location: str, query):
+        self.write_serialized(self.serialize(location, query))
+
+    def write_serialized(self, chunk: str):
+        """Write chunk, returned by :func:`serialize`"""
+        self.stream.write(chunk)
+
+    def close(self):
+        self.stream.flush()
+
+
+class NDJSONWriter(_Writer):
+    """One JSON document of query attribute per line
+
+    :param IO stream: Text stream to write to
+    :param str attribute: Query attribute to write, like ``geojson`` or ``wkt``
+    """
+
+    name = "ndjson"
+
+    def __init__(self, stream: IO, attribute: str = "geojson"):
+        super().__init__(stream)
+        self.attribute = attribute
+
+    @property
+    def signature(self) -> str:
+        return f"{self.name}:{self.attribute}"
+
+    def serialize(self, location: str, query) -> str:
+        return jsonlib.dumps(getattr(query, self.attribute)) + "\n"
+
+
+class CSVWriter(_Writer):
+    """CSV table with header and one row of main result per location
+
+    :param IO stream: Text stream to write to
+    :param bool header: Write header row, disabled when appending to existing table
+    """
+
+    name = "csv"
+    columns = ("location", "status", "lat", "lng", "address")
+
+    def __init__(self, stream: IO, header: bool = True):
+        super().__init__(stream)
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+        if header:
+            self.write_serialized(self._row(self.columns))
+
+    def _row(self, values) -> str:
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        self._writer.writerow(values)
+        return self._buffer.getvalue()
+
+    def serialize(self, location: str, query) -> str:
+        has_data = len(query) > 0
+        return self._row(
+            [
+                location,
+                query.status,
+                query.lat if has_data else "",
+                query.lng if has_data else "",
+                query.address if has_data else "",
+            ]
+        )
+
+
+class GeoJSONWriter(_Writer):
+    """Single FeatureCollection, features are written as soon as available
+
+    Each feature has ``query`` property with input location.
+    """
+
+    name = "geojson"
+
+    def __init__(self, stream: IO):
+        super().__init__(stream)
+        self.stream.write('{"type": "FeatureCollection", "features": [\n')
+        self._first = True
+
+    def serialize(self, location: str, query) -> str:
+        features = []
+        for feature in query.geojson["features"]:
+            feature = dict(feature, properties=dict(feature["properties"]))
+            feature["properties"]["query"] = location
+            features.append(jsonlib.dumps(feature))
+        return ",\n".join(features)
+
+    def write_serialized(self, chunk: str):
+        if not chunk:
+            return
+        if not self._first:
+            self.stream.write(",\n")
+        self.stream.write(chunk)
+        self._first = False
+
+    def close(self):
+        self.stream.write("\n]}\n")
+        super().close()
+
+
+def get_writer(output_format: str, stream: IO, attribute: str = "geojson"):
+    """Writer for one of :data:`OUTPUT_FORMATS`
+
+    :param str output_format: Output format
+    :param IO stream: Text stream to write to
+    :param str attribute: Query attribute for NDJSON output
+    :raises ValueError: On unknown format
+    """
+    if output_format == "ndjson":
+        return NDJSONWriter(stream, attribute)
+    if output_format == "csv":
+        return CSVWriter(stream)
+    if output_format == "geojson":
+        return GeoJSONWriter(stream)
+    raise ValueError(f"Unknown output format {output_format}")
@@ -0,0 +1,328 @@
+"""
+Local mock provider server for offline end-to-end and load testing.
+
+:class:`MockProviderServer` answers with recorded responses from :mod:`vcr`
+cassettes for any provider url, and can inject latency, errors, rate limiting and
+slow body streaming. Provider url is replaced with ``url`` argument:
+
+    >>> import geocoder
+    >>> from geocoder.providers import OsmQuery
+    >>> from geocoder.testing import MockProviderServer
+    >>> with MockProviderServer(["tests/cassettes/osm_geocode.json"]) as server:
+    ...     g = geocoder.osm("Ottawa, Ontario", url=server.url_for(OsmQuery._URL))
+
+Recorded interaction is matched by host, path and query parameters. When no exact
+match found, first interaction with same host and path (or only same path) is used.
+Custom answers, like batch job statuses, are added with :func:`add_route`.
+
+All random decisions use ``seed``, so failures and latencies are reproducible.
+"""
+__all__ = ["MockProviderServer", "MockRequest", "MockResponse"]
+
+import json
+import os
+import random
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlsplit
+
+# recorded headers, that describe original transfer, not decoded body
+_SKIPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+class MockRequest(object):
+    """Request, received by mock server
+
+    :ivar str method: HTTP method
+    :ivar str path: Request path without query string
+    :ivar dict query: Query parameters
+    :ivar dict headers: Request headers
+    :ivar bytes body: Request body
+    """
+
+    __slots__ = ("method", "path", "query", "headers", "body")
+
+    def __init__(self, method: str, path: str, query: dict, headers: dict, body: bytes):
+        self.method = method
+        self.path = path
+        self.query = query
+        self.headers = headers
+        self.body = body
+
+    def __repr__(self) -> str:
+        return f"<MockRequest {self.method} {self.path}>"
+
+
+class MockResponse(object):
+    """Response of mock server
+
+    :param body: Bytes or string body, any other object is encoded to JSON
+    :param int status: HTTP status code
+    :param Optional[dict] headers: Response headers
+    :param Optional[int] chunk_size: Stream body with chunked encoding by
+        ``chunk_size`` bytes, overrides server setting
+    """
+
+    __slots__ = ("body", "status", "headers", "chunk_size")
+
+    def __init__(
+        self,
+        body=b"",
+        status: int = 200,
+        headers: Optional[dict] = None,
+        chunk_size: Optional[int] = None,
+    ):
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        elif not isinstance(body, bytes):
+            body = json.dumps(body).encode("utf-8")
+        self.body = body
+        self.status = status
+        self.headers = {"Content-Type": "application/json; charset=UTF-8"}
+        self.headers.update(headers or {})
+        self.chunk_size = chunk_size
+
+    def __repr__(self) -> str:
+        return f"<MockResponse [{self.status}] {len(self.body)} bytes>"
+
+
+Route = Union[MockResponse, Callable[[MockRequest], MockResponse]]
+Latency = Union[None, float, Callable[[random.Random], float]]
+
+
+class _MockHandler(BaseHTTPRequestHandler):
+    """Keep-alive HTTP/1.1 handler, delegating all answers to mock server"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    mock: "MockProviderServer"
+
+    def log_message(self, *args):
+        pass
+
+    def _handle(self):
+        parts = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        request = MockRequest(
+            self.command,
+            parts.path,
+            dict(parse_qsl(parts.query, keep_blank_values=True)),
+            dict(self.headers),
+            self.rfile.read(length) if length else b"",
+        )
+        response = self.mock.answer(request)
+
+        chunk_size = response.chunk_size or self.mock.chunk_size
+        self.send_response(response.status)
+        for name, value in response.headers.items():
+            self.send_header(name, value)
+        if chunk_size is None:
+            self.send_header("Content-Length", str(len(response.body)))
+            self.end_headers()
+            self.wfile.write(response.body)
+            return
+
+        # slow body streaming, size is known only after download
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        body = response.body
+        for start in range(0, len(body), chunk_size):
+            chunk = body[start : start + chunk_size]
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+            self.wfile.flush()
+            if self.mock.chunk_delay:
+                time.sleep(self.mock.chunk_delay)
+        self.wfile.write(b"0\r\n\r\n")
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+
+class MockProviderServer(object):
+    """Threaded local HTTP server with recorded provider answers
+
+    :param Iterable cassettes: Paths of :mod:`vcr` JSON cassettes to serve
+    :param latency: Answer delay in seconds, or callable, that returns delay for
+        given :class:`random.Random`, like ``lambda rng: rng.expovariate(100)``
+    :param float error_rate: Share of requests answered with ``error_status``
+    :param int error_status: HTTP status of injected errors
+    :param float rate_limit_rate: Share of requests answered with 429 status
+    :param Optional[int] chunk_size: Stream bodies with chunked encoding by
+        ``chunk_size`` bytes
+    :param float chunk_delay: Delay in seconds after each streamed chunk
+    :param Optional[int] seed: Seed of random decisions
+    :param str host: Address to listen
+    :param int port: Port to listen, free one is chosen by default
+    :param int keep_requests: Number of last received requests to keep
+
+    :ivar Deque[MockRequest] requests: Last received requests
+    :ivar int request_count: Number of all received requests
+    """
+
+    def __init__(
+        self,
+        cassettes: Iterable[Union[str, os.PathLike]] = (),
+        latency: Latency = None,
+        error_rate: float = 0.0,
+        error_status: int = 500,
+        rate_limit_rate: float = 0.0,
+        chunk_size: Optional[int] = None,
+        chunk_delay: float = 0.0,
+        seed: Optional[int] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        keep_requests: int = 1000,
+    ):
+        if not 0 <= error_rate + rate_limit_rate <= 1:
+            raise ValueError("Sum of error_rate and rate_limit_rate should be 0..1")
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.rate_limit_rate = rate_limit_rate
+        self.chunk_size = chunk_size
+        self.chunk_delay = chunk_delay
+        self.host = host
+        self.port = port
+        self.requests: Deque[MockRequest] = deque(maxlen=keep_requests)
+        self.request_count = 0
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        # (method, path) -> route, (method, host + path) -> [(query, response)]
+        self._routes: Dict[Tuple[str, str], Route] = {}
+        self._recorded: Dict[Tuple[str, str], List[Tuple[dict, MockResponse]]] = {}
+        self._server: Optional[ThreadingHTTPServer] = None
+
+        for cassette in cassettes:
+            self.load_cassette(cassette)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def __repr__(self) -> str:
+        return f"<MockProviderServer {self.url if self._server else 'stopped'}>"
+
+    @property
+    def url(self) -> str:
+        """Base url of started server"""
+        if self._server is None:
+            raise RuntimeError("Mock server is not started")
+        return f"http://{self.host}:{self._server.server_address[1]}"
+
+    def url_for(self, provider_url: str) -> str:
+        """Mock server url, that answers instead of provider url
+
+        :param str provider_url: Original provider url, like ``OsmQuery._URL``
+        """
+        parts = urlsplit(provider_url)
+        return f"{self.url}/{parts.netloc}{parts.path}"
+
+    def load_cassette(self, path: Union[str, os.PathLike]):
+        """Add all recorded interactions of :mod:`vcr` JSON cassette
+
+        :param path: Cassette file path
+        """
+        with open(path) as cassette:
+            interactions = json.load(cassette)["interactions"]
+        for interaction in interactions:
+            request, answer = interaction["request"], interaction["response"]
+            parts = urlsplit(request["uri"])
+            headers = {
+                name: values[0] if isinstance(values, list) else values
+                for name, values in answer.get("headers", {}).items()
+                if name.lower() not in _SKIPPED_HEADERS
+            }
+            response = MockResponse(
+                answer["body"]["string"], answer["status"]["code"], headers
+            )
+            query = dict(parse_qsl(parts.query, keep_blank_values=True))
+            method = request["method"].upper()
+            for key in ((method, f"/{parts.netloc}{parts.path}"), (method, parts.path)):
+                self._recorded.setdefault(key, []).append((query, response))
+
+    def add_route(self, path: str, response: Route, method: str = "GET"):
+        """Answer all requests to path with response, has precedence over cassettes
+
+        :param str path: Request path without query string. Path ending with ``*``
+            matches all paths with same prefix.
+        :param response: :class:`MockResponse`, or callable, that builds it from
+            :class:`MockRequest`
+        :param str method: HTTP method
+        """
+        self._routes[method.upper(), path] = response
+
+    def _prefix_route(self, request: MockRequest) -> Optional[Route]:
+        for (method, path), route in self._routes.items():
+            if (
+                method == request.method
+                and path.endswith("*")
+                and request.path.startswith(path[:-1])
+            ):
+                return route
+        return None
+
+    def _random_value(self) -> float:
+        with self._lock:
+            return self._random.random()
+
+    def answer(self, request: MockRequest) -> MockResponse:
+        """Build response for request, with configured latency and failures
+
+        :param MockRequest request: Received request
+        """
+        with self._lock:
+            self.requests.append(request)
+            self.request_count += 1
+            latency = (
+                self.latency(self._random) if callable(self.latency) else self.latency
+            )
+        if latency:
+            time.sleep(latency)
+
+        if self.error_rate or self.rate_limit_rate:
+            chance = self._random_value()
+            if chance < self.rate_limit_rate:
+                return MockResponse(
+                    {"error": "Rate limit exceeded"}, 429, {"Retry-After": "1"}
+                )
+            if chance < self.rate_limit_rate + self.error_rate:
+                return MockResponse({"error": "Injected error"}, self.error_status)
+
+        key = (request.method, request.path)
+        route = self._routes.get(key) or self._prefix_route(request)
+        if route is not None:
+            return route(request) if callable(route) else route
+
+        recorded = self._recorded.get(key)
+        if not recorded:
+            return MockResponse({"error": f"No recorded answer for {key}"}, 404)
+        for query, response in recorded:
+            if query == request.query:
+                return response
+        return recorded[0][1]
+
+    def start(self):
+        """Start serving in background thread"""
+        if self._server is not None:
+            raise RuntimeError("Mock server is already started")
+        handler = type("Handler", (_MockHandler,), {"mock": self})
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self._server.daemon_threads = True
+        thread = threading.Thread(
+            target=self._server.serve_forever, args=(0.05,), daemon=True
+        )
+        thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and close listening socket"""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
@@ -0,0 +1,102 @@
+"""
+Per-query timing breakdown.
+
+Each :class:`MultipleResultsQuery` call records, where its time was spent, in
+:attr:`MultipleResultsQuery.timings`:
+
+    >>> import geocoder
+    >>> g = geocoder.osm("Ottawa, Ontario")
+    >>> g.timings.ttfb, g.timings.parse
+    (0.182, 0.0004)
+    >>> g.timings.as_dict()
+
+All values are in seconds. Phases, that were not reached, or cannot be reported by
+used transport, are `None`.
+"""
+__all__ = ["QueryTimings"]
+
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+_PHASES = (
+    "ratelimit_wait",
+    "connect",
+    "ttfb",
+    "download",
+    "decode",
+    "catch_errors",
+    "adapt",
+    "parse",
+    "total",
+)
+
+
+class QueryTimings(object):
+    """Timing breakdown of one query call
+
+    :ivar Optional[float] ratelimit_wait: Time between provider's request call and
+        request start, mostly waiting in :mod:`ratelim` limits
+    :ivar Optional[float] connect: DNS, TCP connect and TLS handshake time, when
+        transport reports it. Zero for reused connection.
+    :ivar Optional[float] ttfb: Time from request start till response headers
+    :ivar Optional[float] download: Response bodies download time
+    :ivar Optional[float] decode: JSON decoding time
+    :ivar Optional[float] catch_errors: :func:`_catch_errors` time
+    :ivar Optional[float] adapt: :func:`_adapt_results` time, when called by
+        default :func:`_parse_results`
+    :ivar Optional[float] parse: :func:`_parse_results` time, without ``adapt``
+    :ivar Optional[float] total: Whole call time
+    :ivar List[float] polls: Duration of each job status request of batch providers
+    """
+
+    __slots__ = _PHASES + ("polls",)
+
+    def __init__(self):
+        for name in _PHASES:
+            setattr(self, name, None)
+        self.polls: List[float] = []
+
+    def __repr__(self) -> str:
+        phases = ", ".join(
+            f"{name}={value * 1000:.2f}ms"
+            for name, value in self.as_dict().items()
+            if isinstance(value, float)
+        )
+        return f"<QueryTimings {phases}>"
+
+    def add(self, name: str, seconds: float):
+        """Add duration to phase, phases are summed for multiple requests"""
+        value = getattr(self, name)
+        setattr(self, name, seconds if value is None else value + seconds)
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """Context manager, that adds its block duration to phase"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - started)
+
+    def record_response(self, response, call_seconds: float):
+        """Split provider's request call time with response timing data
+
+        :param response: :class:`requests.Response` compatible response with
+            ``elapsed`` time till headers, and optional ``connect_elapsed`` time
+        :param float call_seconds: Duration of provider's request method call
+        """
+        elapsed = getattr(response, "elapsed", None)
+        ttfb = call_seconds if elapsed is None else elapsed.total_seconds()
+        self.add("ttfb", ttfb)
+        self.add("ratelimit_wait", max(0.0, call_seconds - ttfb))
+
+        connect = getattr(response, "connect_elapsed", None)
+        if connect is not None:
+            self.add("connect", connect.total_seconds())
+
+    def as_dict(self) -> Dict[str, Optional[float]]:
+        """All phases and polls as dictionary"""
+        timings = {name: getattr(self, name) for name in _PHASES}
+        timings["polls"] = list(self.polls)
+        return timings
@@ -0,0 +1,566 @@
+"""
+Pluggable HTTP transports.
+
+Providers make requests through session-like object, stored in ``session`` attribute
+of query. Any object with :class:`requests.Session` compatible ``get`` and ``post``
+methods can be used there, so transport can be changed without any provider
+modification:
+
+    >>> import geocoder
+    >>> from geocoder.transport import Urllib3Transport
+    >>> transport = Urllib3Transport(pool_maxsize=20)
+    >>> geocoder.osm("Ottawa, Ontario", session=transport).latlng
+
+Available transports:
+
+- :func:`requests_session` - default :class:`requests.Session` with sized pool.
+- :class:`Urllib3Transport` - thin :mod:`urllib3` pool, without :mod:`requests`
+  per-request overhead, for high request rate synchronous usage.
+- :class:`HTTPXTransport` - :mod:`httpx` client with HTTP/2 multiplexing, requires
+  ``httpx[http2]`` package.
+
+Transport errors are re-raised as :mod:`requests` exceptions, so providers error
+handling works with any transport.
+"""
+__all__ = [
+    "TRANSPORTS",
+    "HTTPXTransport",
+    "Transport",
+    "TransportResponse",
+    "Urllib3Transport",
+    "get_transport",
+    "requests_session",
+]
+
+import functools
+import time
+from abc import ABCMeta, abstractmethod
+from collections.abc import Mapping
+from datetime import timedelta
+from typing import Callable, Iterator, Optional, Union
+from urllib.parse import urlencode, urlparse
+
+import requests
+import urllib3
+
+from geocoder import jsonlib
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+_USER_AGENT = "geocoder3"
+_CHUNK_SIZE = 64 * 1024
+
+
+def _encode_url(url: str, params) -> str:
+    """Append query params to url, skipping ``None`` values like :mod:`requests`"""
+    if not params:
+        return url
+    items = params.items() if isinstance(params, Mapping) else params
+    query = urlencode([(k, v) for k, v in items if v is not None], doseq=True)
+    if not query:
+        return url
+    return f"{url}{'&' if '?' in url else '?'}{query}"
+
+
+def _split_files(files: Mapping):
+    """Split :mod:`requests` style ``files`` to plain form fields and files
+
+    Values like ``(None, "4")`` are sent by :mod:`requests` as plain form fields.
+    """
+    fields, uploads = {}, {}
+    for name, value in files.items():
+        if isinstance(value, tuple) and value[0] is None:
+            fields[name] = value[1]
+        else:
+            uploads[name] = value
+    return fields, uploads
+
+
+def _pick_proxy(proxies: Optional[Mapping], url: str) -> Optional[str]:
+    if not proxies:
+        return None
+    return proxies.get(urlparse(url).scheme) or proxies.get("all")
+
+
+class TransportResponse(object):
+    """Minimal :class:`requests.Response` compatible answer of transport
+
+    Body is either given as ``content``, or streamed once from ``chunks`` on first
+    :attr:`content` or :func:`iter_content` access.
+
+    :param int status_code: HTTP status code
+    :param str url: Final url of request, after redirects
+    :param headers: Case-insensitive response headers mapping
+    :param Optional[bytes] content: Decoded (not compressed) response body
+    :param str reason: HTTP reason phrase
+    :param timedelta elapsed: Time from request start till headers receive
+    :param chunks: Function, returning iterator over decoded body chunks of given
+        size, for streamed responses
+    :param close: Function, that releases connection of streamed response
+    :param Optional[timedelta] connect_elapsed: DNS, TCP connect and TLS handshake
+        time, if transport reports it. Zero for reused connection.
+    """
+
+    def __init__(
+        self,
+        status_code: int,
+        url: str,
+        headers: Mapping,
+        content: Optional[bytes] = None,
+        reason: str = "",
+        elapsed: timedelta = timedelta(0),
+        chunks: Optional[Callable[[int], Iterator[bytes]]] = None,
+        close: Optional[Callable[[], None]] = None,
+        connect_elapsed: Optional[timedelta] = None,
+    ):
+        self.status_code = status_code
+        self.url = url
+        self.headers = headers
+        self.reason = reason
+        self.elapsed = elapsed
+        self._content = content
+        self._chunks = chunks
+        self._close = close
+        self.connect_elapsed = connect_elapsed
+
+    def __repr__(self) -> str:
+        return f"<TransportResponse [{self.status_code}]>"
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def content(self) -> bytes:
+        if self._content is None:
+            self._content = b"".join(self.iter_content(_CHUNK_SIZE))
+        return self._content
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        return jsonlib.loads(self.content)
+
+    def iter_content(self, chunk_size: int = 1) -> Iterator[bytes]:
+        if self._content is None and self._chunks is not None:
+            chunks, self._chunks = self._chunks, None
+            yield from chunks(chunk_size)
+            return
+        content = self._content or b""
+        for start in range(0, len(content), chunk_size):
+            yield content[start : start + chunk_size]
+
+    def close(self):
+        """Release connection of streamed response, drop it when body is not read"""
+        if self._close is not None:
+            self._close()
+            self._close = None
+
+    def raise_for_status(self):
+        """Raise :class:`requests.HTTPError` for 4xx and 5xx status codes"""
+        if 400 <= self.status_code < 500:
+            kind = "Client"
+        elif 500 <= self.status_code < 600:
+            kind = "Server"
+        else:
+            return
+        raise requests.exceptions.HTTPError(
+            f"{self.status_code} {kind} Error: {self.reason} for url: {self.url}",
+            response=self,
+        )
+
+
+class Transport(metaclass=ABCMeta):
+    """Session-like interface, expected by providers in ``session`` attribute
+
+    Implementations should be thread-safe and keep connections between requests.
+    :class:`requests.Session` is registered as virtual subclass.
+    """
+
+    @abstractmethod
+    def request(
+        self,
+        method: str,
+        url: str,
+        params=None,
+        data=None,
+        files=None,
+        headers: Optional[Mapping] = None,
+        timeout=None,
+        proxies: Optional[Mapping] = None,
+        stream: bool = False,
+    ) -> TransportResponse:
+        """Make HTTP request, with same parameters as :func:`requests.request`
+
+        With ``stream=True`` only headers are read, body is downloaded on
+        :attr:`TransportResponse.content` or :func:`TransportResponse.iter_content`
+        access.
+
+        :raises requests.exceptions.RequestException: On any transport error
+        """
+
+    def get(self, url: str, **kwargs) -> TransportResponse:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> TransportResponse:
+        return self.request("POST", url, **kwargs)
+
+    def close(self):
+        """Close all pooled connections"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+Transport.register(requests.Session)
+
+
+def requests_session(pool_maxsize: int = 10, max_retries: int = 0) -> requests.Session:
+    """Create :class:`requests.Session` with connection pool sized for concurrency
+
+    :param int pool_maxsize: Max number of kept connections per host
+    :param int max_retries: Number of retries on connection errors
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=pool_maxsize,
+        max_retries=max_retries,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class Urllib3Transport(Transport):
+    """Transport over :class:`urllib3.PoolManager`
+
+    Skips :mod:`requests` hooks, cookies, environment proxies lookup and request
+    preparation, that dominate per-request overhead on fast local networks.
+
+    :param int pool_maxsize: Max number of kept connections per host
+    :param int max_retries: Number of retries on connection and read errors
+    :param int num_pools: Number of hosts with kept connection pools
+    :param pool_kwargs: Any other :class:`urllib3.PoolManager` options
+    """
+
+    def __init__(
+        self,
+        pool_maxsize: int = 10,
+        max_retries: int = 0,
+        num_pools: int = 10,
+        **pool_kwargs,
+    ):
+        self.retries = urllib3.Retry(
+            total=None,
+            connect=max_retries,
+            read=max_retries,
+            status=0,
+            other=0,
+            redirect=30,
+        )
+        self.pool_kwargs = dict(
+            num_pools=num_pools, maxsize=pool_maxsize, **pool_kwargs
+        )
+        self.manager = urllib3.PoolManager(**self.pool_kwargs)
+        self.default_headers = urllib3.make_headers(
+            keep_alive=True, accept_encoding=True, user_agent=_USER_AGENT
+        )
+        self.default_headers["Accept"] = "*/*"
+        self._proxy_managers = {}
+
+    def __repr__(self) -> str:
+        return f"<Urllib3Transport maxsize={self.pool_kwargs['maxsize']}>"
+
+    def _manager_for(self, proxy: Optional[str]):
+        if proxy is None:
+            return self.manager
+        try:
+            return self._proxy_managers[proxy]
+        except KeyError:
+            manager = urllib3.ProxyManager(proxy, **self.pool_kwargs)
+            return self._proxy_managers.setdefault(proxy, manager)
+
+    @staticmethod
+    def _timeout(timeout) -> urllib3.Timeout:
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return urllib3.Timeout(connect=connect, read=read)
+        return urllib3.Timeout(connect=timeout, read=timeout)
+
+    def _body(self, data, files, headers: dict):
+        if files:
+            fields, uploads = _split_files(files)
+            fields.update(uploads)
+            body, content_type = urllib3.encode_multipart_formdata(fields)
+            headers["Content-Type"] = content_type
+            return body
+        if isinstance(data, Mapping):
+            headers.setdefault("Content-Type", "application/x-www-form-urlencoded")
+            return urlencode(data, doseq=True)
+        if isinstance(data, str):
+            return data.encode("utf-8")
+        return data
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params=None,
+        data=None,
+        files=None,
+        headers: Optional[Mapping] = None,
+        timeout=None,
+        proxies: Optional[Mapping] = None,
+        stream: bool = False,
+    ) -> TransportResponse:
+        request_headers = dict(self.default_headers)
+        if headers:
+            request_headers.update(headers)
+        body = self._body(data, files, request_headers)
+        url = _encode_url(url, params)
+
+        started = time.perf_counter()
+        try:
+            response = self._manager_for(_pick_proxy(proxies, url)).request(
+                method,
+                url,
+                body=body,
+                headers=request_headers,
+                timeout=self._timeout(timeout),
+                retries=self.retries,
+                preload_content=not stream,
+            )
+        except urllib3.exceptions.HTTPError as err:
+            raise _requests_error(err) from err
+
+        def chunks(chunk_size: int) -> Iterator[bytes]:
+            try:
+                yield from response.stream(chunk_size)
+            except urllib3.exceptions.HTTPError as err:
+                raise _requests_error(err) from err
+
+        return TransportResponse(
+            status_code=response.status,
+            url=response.url or url,
+            headers=response.headers,
+            content=None if stream else response.data,
+            reason=response.reason or "",
+            elapsed=timedelta(seconds=time.perf_counter() - started),
+            chunks=chunks,
+            close=response.close,
+        )
+
+    def close(self):
+        self.manager.clear()
+        for manager in self._proxy_managers.values():
+            manager.clear()
+
+
+def _requests_error(err: Exception) -> requests.exceptions.RequestException:
+    """Translate :mod:`urllib3` exception to :mod:`requests` one"""
+    exceptions = urllib3.exceptions
+    if isinstance(err, exceptions.MaxRetryError):
+        if isinstance(err.reason, exceptions.ResponseError):
+            return requests.exceptions.TooManyRedirects(err)
+        err = err.reason or err
+    if isinstance(err, exceptions.ConnectTimeoutError):
+        return requests.exceptions.ConnectTimeout(err)
+    if isinstance(err, exceptions.ReadTimeoutError):
+        return requests.exceptions.ReadTimeout(err)
+    if isinstance(err, exceptions.TimeoutError):
+        return requests.exceptions.Timeout(err)
+    if isinstance(err, exceptions.ProxyError):
+        return requests.exceptions.ProxyError(err)
+    if isinstance(err, exceptions.SSLError):
+        return requests.exceptions.SSLError(err)
+    if isinstance(err, (exceptions.ProtocolError, exceptions.NewConnectionError)):
+        return requests.exceptions.ConnectionError(err)
+    return requests.exceptions.RequestException(err)
+
+
+class HTTPXTransport(Transport):
+    """Transport over :class:`httpx.Client` with optional HTTP/2 multiplexing
+
+    With HTTP/2 all concurrent requests to one provider host share single
+    connection. Proxy can be set only on transport creation, per-request
+    ``proxies`` are not supported by :mod:`httpx`.
+
+    :param int pool_maxsize: Max number of kept connections
+    :param int max_retries: Number of retries on connection errors
+    :param bool http2: Negotiate HTTP/2, when server supports it
+    :param Optional[str] proxy: Proxy url for all requests
+    :param client_kwargs: Any other :class:`httpx.Client` options
+    :raises ValueError: When :mod:`httpx` or HTTP/2 support is not installed
+    """
+
+    def __init__(
+        self,
+        pool_maxsize: int = 10,
+        max_retries: int = 0,
+        http2: bool = True,
+        proxy: Optional[str] = None,
+        **client_kwargs,
+    ):
+        if httpx is None:
+            raise ValueError("HTTPXTransport requires 'httpx' package")
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError as error:
+                raise ValueError(
+                    "HTTP/2 support requires 'httpx[http2]' package"
+                ) from error
+
+        self.http2 = http2
+        limits = httpx.Limits(
+            max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize
+        )
+        self.client = httpx.Client(
+            transport=httpx.HTTPTransport(
+                http2=http2, limits=limits, retries=max_retries, proxy=proxy
+            ),
+            headers={"User-Agent": _USER_AGENT},
+            follow_redirects=True,
+            **client_kwargs,
+        )
+
+    def __repr__(self) -> str:
+        return f"<HTTPXTransport http2={self.http2}>"
+
+    @staticmethod
+    def _timeout(timeout):
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return httpx.Timeout(read, connect=connect)
+        return httpx.Timeout(timeout)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params=None,
+        data=None,
+        files=None,
+        headers: Optional[Mapping] = None,
+        timeout=None,
+        proxies: Optional[Mapping] = None,
+        stream: bool = False,
+    ) -> TransportResponse:
+        if proxies:
+            raise ValueError("HTTPXTransport supports only 'proxy' on creation")
+
+        body = {}
+        if files:
+            body["data"], body["files"] = _split_files(files)
+        elif isinstance(data, Mapping):
+            body["data"] = data
+        elif data is not None:
+            body["content"] = data
+
+        request = self.client.build_request(
+            method,
+            _encode_url(url, params),
+            headers=headers,
+            timeout=self._timeout(timeout),
+            **body,
+        )
+        connect = _ConnectTrace()
+        request.extensions["trace"] = connect
+        started = time.perf_counter()
+        try:
+            response = self.client.send(request, stream=stream)
+        except httpx.HTTPError as err:
+            raise _requests_error_from_httpx(err) from err
+
+        def chunks(chunk_size: int) -> Iterator[bytes]:
+            try:
+                yield from response.iter_bytes(chunk_size)
+            except httpx.HTTPError as err:
+                raise _requests_error_from_httpx(err) from err
+
+        return TransportResponse(
+            status_code=response.status_code,
+            url=str(response.url),
+            headers=response.headers,
+            content=None if stream else response.content,
+            reason=response.reason_phrase,
+            elapsed=timedelta(seconds=time.perf_counter() - started),
+            chunks=chunks,
+            close=response.close,
+            connect_elapsed=timedelta(seconds=connect.seconds),
+        )
+
+    def close(self):
+        self.client.close()
+
+
+class _ConnectTrace(object):
+    """:mod:`httpcore` trace callback, that sums connection establishment time"""
+
+    _EVENTS = ("connection.connect_tcp.", "connection.start_tls.")
+
+    def __init__(self):
+        self.seconds = 0.0
+        self._started = None
+
+    def __call__(self, event: str, info: dict):
+        if not event.startswith(self._EVENTS):
+            return
+        if event.endswith(".started"):
+            self._started = time.perf_counter()
+        elif self._started is not None:
+            self.seconds += time.perf_counter() - self._started
+            self._started = None
+
+
+def _requests_error_from_httpx(
+    err: Exception,
+) -> requests.exceptions.RequestException:
+    """Translate :mod:`httpx` exception to :mod:`requests` one"""
+    if isinstance(err, httpx.ConnectTimeout):
+        return requests.exceptions.ConnectTimeout(err)
+    if isinstance(err, httpx.ReadTimeout):
+        return requests.exceptions.ReadTimeout(err)
+    if isinstance(err, httpx.TimeoutException):
+        return requests.exceptions.Timeout(err)
+    if isinstance(err, httpx.ProxyError):
+        return requests.exceptions.ProxyError(err)
+    if isinstance(err, httpx.TransportError):
+        return requests.exceptions.ConnectionError(err)
+    if isinstance(err, httpx.TooManyRedirects):
+        return requests.exceptions.TooManyRedirects(err)
+    return requests.exceptions.RequestException(err)
+
+
+TRANSPORTS = {
+    "requests": requests_session,
+    "urllib3": Urllib3Transport,
+    "httpx": functools.partial(HTTPXTransport, http2=False),
+    "http2": HTTPXTransport,
+}
+
+
+def get_transport(transport: Union[str, Callable]) -> Callable:
+    """Return transport factory by name from :data:`TRANSPORTS`
+
+    Factory is called with ``pool_maxsize`` and ``max_retries`` keyword arguments.
+    Callable values are returned as is.
+
+    :param transport: Transport name or factory
+    :raises ValueError: On unknown transport name
+    """
+    if callable(transport):
+        return transport
+    try:
+        return TRANSPORTS[transport.lower().strip()]
+    except KeyError:
+        raise ValueError(f"Unknown transport. Got {transport}") from None
@@ -43,6 +43,7 @@ setup(
     package_dir={"geocoder": "geocoder"},
     include_package_data=True,
     install_requires=requires,
+    extras_require={"speedups": ["orjson"], "http2": ["httpx[http2]"]},
     zip_safe=False,
     keywords=(
         "geocoder arcgis baidu bing canadapost freegeoip gaode geolytica "
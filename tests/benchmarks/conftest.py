@@ -0,0 +1,99 @@
+import json
+import os
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from geocoder.api import options
+
+CASSETTES = Path(__file__).parent.parent / "cassettes"
+BASELINES = Path(__file__).parent / "baselines"
+UPDATE_BASELINES = os.environ.get("GEOCODER_UPDATE_BASELINES", "") not in ("", "0")
+
+
+def _query_classes():
+    for methods in options.values():
+        yield from methods.values()
+
+
+def query_class_for(url: str, cassette: str):
+    """Provider's class, that requests url, for method in cassette name
+
+    Cassettes are named ``<provider>_<method>.json``. Geocode class, or any other
+    class of url, is used, when name has no known method.
+    """
+    endpoint = url.split("?", 1)[0]
+    matches = {cls._METHOD: cls for cls in _query_classes() if cls._URL == endpoint}
+    method = cassette.rsplit("_", 1)[-1]
+    return (
+        matches.get(method)
+        or matches.get("geocode")
+        or next(iter(matches.values()), None)
+    )
+
+
+def load_payloads():
+    """Unique recorded JSON answers as ``(id, query class, location, body)`` tuples
+
+    Location is recorded ``q`` parameter, reverse classes cannot be built without it.
+    """
+    seen = set()
+    for path in sorted(CASSETTES.glob("*.json")):
+        with open(path) as cassette:
+            interactions = json.load(cassette)["interactions"]
+        for index, interaction in enumerate(interactions):
+            body = interaction["response"]["body"]["string"]
+            url = interaction["request"]["uri"]
+            cls = query_class_for(url, path.stem)
+            if cls is None or body in seen:
+                continue
+            seen.add(body)
+            location = parse_qs(urlsplit(url).query).get("q", [None])[0]
+            name = f"{cls._PROVIDER}-{path.stem}-{index}"
+            yield name, cls, location, body
+
+
+class Baselines(object):
+    """Stored benchmark values, rewritten with ``GEOCODER_UPDATE_BASELINES=1``
+
+    :param str name: Baselines file name without extension
+    """
+
+    def __init__(self, name: str):
+        self.path = BASELINES / f"{name}.json"
+        self.values = {}
+        if self.path.exists():
+            with open(self.path) as baselines_file:
+                self.values = json.load(baselines_file)
+        self.measured = {}
+        self.updating = UPDATE_BASELINES
+
+    def get(self, key: str):
+        return self.values.get(key)
+
+    def record(self, key: str, value: dict):
+        self.measured[key] = value
+
+    def save(self):
+        self.values.update(self.measured)
+        with open(self.path, "w") as baselines_file:
+            json.dump(self.values, baselines_file, indent=2, sort_keys=True)
+            baselines_file.write("\n")
+
+
+@pytest.fixture(scope="module")
+def baselines(request):
+    stored = Baselines(request.module.BASELINES_NAME)
+    yield stored
+    if stored.updating and stored.measured:
+        stored.save()
+
+
+def pytest_generate_tests(metafunc):
+    # tests with "cassette_payload" argument are run for each recorded answer
+    if "cassette_payload" in metafunc.fixturenames:
+        payloads = list(load_payloads())
+        metafunc.parametrize(
+            "cassette_payload", payloads, ids=[payload[0] for payload in payloads]
+        )
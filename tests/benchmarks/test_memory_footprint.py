@@ -0,0 +1,193 @@
+"""Retained memory of called queries and their results
+
+Every recorded cassette answer, and synthetic batch answers of ``BATCH_SIZE`` rows,
+are requested from local mock server with shared session, like in
+:class:`GeocoderClient`. All results are built, with ``object_json`` and
+``fieldnames`` computed. Query retained bytes are measured with :mod:`tracemalloc`,
+and split to ``raw_response``, ``raw_json``, ``object_raw_json``, ``object_json``,
+``fieldnames`` and ``results`` (result objects itself) by deep object sizes. Each
+part is counted only once, in this order.
+
+Run with ``pytest tests/benchmarks -m benchmark``. Total, per result and per part
+values are checked with budgets from ``baselines/memory_budgets.json``, that are
+rewritten with 25% headroom with ``GEOCODER_UPDATE_BASELINES=1``.
+"""
+import gc
+import math
+import sys
+import tracemalloc
+
+import pytest
+import requests
+import urllib3
+
+from geocoder.providers import BingBatchForward, USCensusBatch
+from geocoder.testing import MockProviderServer, MockResponse
+
+BASELINES_NAME = "memory_budgets"
+BATCH_SIZE = 1000
+HEADROOM = 1.25
+PARTS = ("raw_response", "raw_json", "object_raw_json", "object_json", "fieldnames")
+STORED_ATTRIBUTES = ("object_raw_json", "_object_json", "_fieldnames")
+# shared objects, that are not owned by query
+SHARED_TYPES = (
+    type,
+    type(sys),
+    requests.Session,
+    requests.adapters.BaseAdapter,
+    urllib3.connectionpool.ConnectionPool,
+    urllib3.connection.HTTPConnection,
+)
+
+
+def deep_size(obj, seen: set) -> int:
+    """Size of object and all objects it references, that are not in ``seen``"""
+    if id(obj) in seen or isinstance(obj, SHARED_TYPES) or callable(obj):
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_size(k, seen) + deep_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_size(item, seen) for item in obj)
+    elif not isinstance(obj, (str, bytes, bytearray, int, float)):
+        size += deep_size(getattr(obj, "__dict__", {}), seen)
+        for name in getattr(type(obj), "__slots__", ()):
+            size += deep_size(getattr(obj, name, None), seen)
+    return size
+
+
+def breakdown(query) -> dict:
+    seen = {id(query.session)}
+    response = query.raw_response if query.raw_response is not None else None
+    results = list(query)
+    sizes = {
+        "raw_response": deep_size(response or getattr(query, "response", None), seen),
+        "raw_json": deep_size(query.raw_json, seen),
+    }
+    # stored values only, lazy properties are not computed here
+    for part, attribute in zip(PARTS[2:], STORED_ATTRIBUTES):
+        sizes[part] = sum(deep_size(getattr(r, attribute), seen) for r in results)
+    sizes["results"] = sum(deep_size(result, seen) for result in results)
+    return sizes
+
+
+def retained_bytes(call) -> tuple:
+    """Call and return its result with bytes it retains
+
+    Server keep-alive connection is opened before measurement, so server thread
+    allocates only transient objects during the call.
+    """
+    ignored = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot().filter_traces(ignored)
+        query = call()
+        gc.collect()
+        after = tracemalloc.take_snapshot().filter_traces(ignored)
+    finally:
+        tracemalloc.stop()
+    return query, sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+
+def build_results(query):
+    for result in query:
+        result.object_json
+        result.fieldnames
+    return query
+
+
+def _cassette_case(query_class, location, body):
+    def setup(server):
+        server.add_route("/case", MockResponse(body))
+        return lambda: query_class(location, url=f"{server.url}/case")
+
+    return setup
+
+
+def _uscensus_case(server):
+    rows = "".join(
+        f'"{idx}","{idx} Main St","Match","Exact","{idx} MAIN ST",'
+        f'"-75.{idx:04d},45.{idx:04d}","1","L"\n'
+        for idx in range(BATCH_SIZE)
+    )
+    url = server.url_for(USCensusBatch._URL)
+    server.add_route(url[len(server.url) :], MockResponse(rows), method="POST")
+    locations = [f"{idx} Main St" for idx in range(BATCH_SIZE)]
+    return lambda: USCensusBatch(locations, url=url)
+
+
+def _bing_case(server):
+    rows = "".join(
+        f"{idx},{idx} Main St,45.{idx:04d},-75.{idx:04d}\n" for idx in range(BATCH_SIZE)
+    )
+    url = server.url_for(BingBatchForward._URL)
+    path = url[len(server.url) :]
+    job = {"resourceSets": [{"resources": [{"id": "job", "status": "Completed"}]}]}
+    server.add_route(path, MockResponse(job, 201), method="POST")
+    server.add_route(f"{path}/job", MockResponse(job))
+    server.add_route(
+        f"{path}/job/output/succeeded",
+        MockResponse(
+            "Bing Spatial Data Services, 2.0\n"
+            "Id,GeocodeRequest/Query,GeocodeResponse/Point/Latitude,"
+            f"GeocodeResponse/Point/Longitude\n{rows}"
+        ),
+    )
+    locations = [f"{idx} Main St" for idx in range(BATCH_SIZE)]
+    return lambda: BingBatchForward(locations, key="key", url=url)
+
+
+def measure(name: str, setup, baselines, capsys):
+    with MockProviderServer(keep_requests=0) as server, requests.Session() as session:
+        create = setup(server)
+        # warm up imports, caches and connection
+        build_results(create()(session=session))
+        query, total = retained_bytes(lambda: build_results(create()(session=session)))
+
+    assert query.ok
+    count = len(query)
+    parts = breakdown(query)
+    # serialized parts are measured for every provider
+    assert parts["object_json"] > 0 and parts["fieldnames"] > 0, parts
+    measured = {"query_bytes": total, "result_bytes": total // count}
+    # parts have own budgets, so growth of one part is not hidden by others
+    measured.update((f"{part}_bytes", size) for part, size in parts.items())
+
+    with capsys.disabled():
+        print(
+            f"\n{name}: {total} bytes per query, {count} results, "
+            f"{measured['result_bytes']} bytes per result"
+        )
+        for part, size in parts.items():
+            print(f"  {part:<16} {size:>10} bytes")
+
+    if baselines.updating:
+        baselines.record(
+            name,
+            {key: math.ceil(value * HEADROOM) for key, value in measured.items()},
+        )
+        return
+    budget = baselines.get(name)
+    if budget is not None:
+        for key, value in measured.items():
+            assert value <= budget[key], f"{key} {value} exceeds budget {budget[key]}"
+
+
+@pytest.mark.benchmark
+def test__memory__cassette_answers(cassette_payload, baselines, capsys):
+    name, query_class, location, body = cassette_payload
+    measure(name, _cassette_case(query_class, location, body), baselines, capsys)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    "name,setup",
+    [
+        (f"uscensus-batch-{BATCH_SIZE}", _uscensus_case),
+        (f"bing-batch-{BATCH_SIZE}", _bing_case),
+    ],
+)
+def test__memory__batch_answers(name, setup, baselines, capsys):
+    measure(name, setup, baselines, capsys)
@@ -0,0 +1,75 @@
+"""Parsing throughput of recorded provider answers, without network
+
+Each unique cassette payload is parsed with provider's :func:`from_raw`, and every
+result is built and serialized with ``object_json`` and ``geojson``.
+
+Run with ``pytest tests/benchmarks -m benchmark``. Measured values are compared with
+``baselines/parser_throughput.json``: peak allocated bytes per result always, and
+results per second only when ``GEOCODER_BENCHMARK_TOLERANCE`` (allowed slowdown
+share, like ``0.3``) is set, as throughput depends on the machine. Baselines are
+rewritten with ``GEOCODER_UPDATE_BASELINES=1``. Number of parsing rounds can be
+changed with ``GEOCODER_BENCHMARK_ROUNDS`` environment variable.
+"""
+import json
+import os
+import time
+import tracemalloc
+
+import pytest
+
+BASELINES_NAME = "parser_throughput"
+ROUNDS = int(os.environ.get("GEOCODER_BENCHMARK_ROUNDS", 200))
+SPEED_TOLERANCE = os.environ.get("GEOCODER_BENCHMARK_TOLERANCE")
+ALLOCATION_TOLERANCE = 0.25
+
+
+def parse_all(query_class, location, payload) -> int:
+    query = query_class.from_raw(payload, location=location)
+    for result in query:
+        result.object_json
+        result.geojson
+    return len(query)
+
+
+def peak_bytes(query_class, location, payload) -> int:
+    tracemalloc.start()
+    try:
+        parse_all(query_class, location, payload)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.benchmark
+def test__parser__throughput(cassette_payload, baselines, capsys):
+    name, query_class, location, body = cassette_payload
+    payload = json.loads(body)
+    results = parse_all(query_class, location, payload)
+    assert results > 0
+
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        parse_all(query_class, location, payload)
+    elapsed = time.perf_counter() - started
+
+    measured = {
+        "results_per_second": round(ROUNDS * results / elapsed),
+        "bytes_per_result": peak_bytes(query_class, location, payload) // results,
+    }
+    baselines.record(name, measured)
+    with capsys.disabled():
+        print(
+            f"\n{name}: {measured['results_per_second']} results/s, "
+            f"{measured['bytes_per_result']} peak bytes/result"
+        )
+
+    baseline = baselines.get(name)
+    if baseline is None or baselines.updating:
+        return
+    assert measured["bytes_per_result"] <= baseline["bytes_per_result"] * (
+        1 + ALLOCATION_TOLERANCE
+    ), f"Allocations regression, baseline is {baseline['bytes_per_result']}"
+    if SPEED_TOLERANCE:
+        assert measured["results_per_second"] >= baseline["results_per_second"] * (
+            1 - float(SPEED_TOLERANCE)
+        ), f"Throughput regression, baseline is {baseline['results_per_second']}"
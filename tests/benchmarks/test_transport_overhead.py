@@ -0,0 +1,46 @@
+"""Per-request overhead of transports against local keep-alive server
+
+Run with ``pytest tests/benchmarks -m benchmark``. Number of requests per transport
+can be changed with ``GEOCODER_BENCHMARK_REQUESTS`` environment variable.
+"""
+import os
+import time
+
+import pytest
+
+from geocoder.transport import TRANSPORTS
+
+REQUESTS = int(os.environ.get("GEOCODER_BENCHMARK_REQUESTS", 200))
+params = {"q": "Ottawa, Ontario", "format": "jsonv2", "limit": 1}
+
+
+def _available_transports():
+    for name, factory in TRANSPORTS.items():
+        try:
+            factory().close()
+        except ValueError:
+            continue
+        yield name
+
+
+@pytest.mark.benchmark
+def test__transports__per_request_overhead(local_server, capsys):
+    url = f"{local_server}/search"
+    timings = {}
+    for name in _available_transports():
+        with TRANSPORTS[name]() as transport:
+            # warm up connection pool
+            transport.get(url, params=params, timeout=5).raise_for_status()
+
+            started = time.perf_counter()
+            for _ in range(REQUESTS):
+                response = transport.get(url, params=params, timeout=5)
+                assert response.status_code == 200
+            timings[name] = (time.perf_counter() - started) / REQUESTS
+
+    with capsys.disabled():
+        print(f"\nTransport overhead, {REQUESTS} sequential requests:")
+        for name, seconds in sorted(timings.items(), key=lambda item: item[1]):
+            print(f"  {name:<10} {seconds * 1e6:>9.1f} us/request")
+
+    assert "requests" in timings and "urllib3" in timings
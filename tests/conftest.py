@@ -0,0 +1,38 @@
+import json
+
+import pytest
+
+from geocoder.testing import MockProviderServer, MockResponse
+
+
+def _cassette_body(name: str) -> bytes:
+    with open(f"tests/cassettes/{name}") as cassette:
+        interaction = json.load(cassette)["interactions"][0]
+    return interaction["response"]["body"]["string"].encode("utf-8")
+
+
+def _echo(request):
+    return MockResponse(
+        {
+            "content_type": request.headers["Content-Type"],
+            "body": request.body.decode("utf-8"),
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def local_server():
+    """Url of local HTTP server, answering like OSM Nominatim search"""
+    body = _cassette_body("osm_geocode.json")
+    server = MockProviderServer()
+    server.add_route("/search", MockResponse(body))
+    server.add_route("/chunked", MockResponse(body, chunk_size=100))
+    server.add_route(
+        "/redirect", MockResponse(b"", 302, {"Location": "/search?q=redirected"})
+    )
+    server.add_route(
+        "/status/*", lambda request: MockResponse({}, int(request.path.split("/")[2]))
+    )
+    server.add_route("/echo", _echo, method="POST")
+    with server:
+        yield server.url
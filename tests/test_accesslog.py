@@ -0,0 +1,88 @@
+import io
+import json
+import threading
+
+import pytest
+
+import geocoder
+from geocoder import hooks
+from geocoder.accesslog import AccessLog
+
+location = "Ottawa, Ontario"
+
+
+def read_records(path):
+    with open(path, "rb") as log_file:
+        return [json.loads(line) for line in log_file]
+
+
+def test__accesslog__call__write_redacted_record(local_server, tmp_path):
+    path = tmp_path / "access.ndjson"
+    with AccessLog(path) as access_log:
+        g = geocoder.osm(location, url=f"{local_server}/search", key="secret")
+
+    assert access_log.written == 1
+    assert hooks._subscribers["after_call"] == ()
+    [record] = read_records(path)
+    assert record["provider"] == "osm"
+    assert record["method"] == "geocode"
+    assert record["url"] == f"{local_server}/search"
+    assert record["status"] == 200
+    assert record["outcome"] == "ok"
+    assert record["latency"] == g.timings.total
+    assert record["bytes"] == g.response_size
+    assert record["results"] == len(g)
+    assert record["error"] is None
+    assert "secret" not in json.dumps(record)
+
+
+def test__accesslog__sample_rate__keep_errors(local_server, tmp_path):
+    path = tmp_path / "access.ndjson"
+    with AccessLog(path, sample_rate=0) as access_log:
+        for _ in range(3):
+            geocoder.osm(location, url=f"{local_server}/search")
+        geocoder.osm(location, url=f"{local_server}/status/500")
+
+    assert access_log.written == 1
+    assert [record["status"] for record in read_records(path)] == [500]
+
+
+def test__accesslog__text_stream__append_lines(local_server):
+    stream = io.StringIO()
+    with AccessLog(stream, always_log_errors=False):
+        geocoder.osm(location, url=f"{local_server}/search")
+        geocoder.osm(location, url=f"{local_server}/search")
+
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[0])["outcome"] == "ok"
+
+
+def test__accesslog__full_queue__drop_records(local_server, tmp_path):
+    access_log = AccessLog(tmp_path / "access.ndjson", queue_size=1)
+    g = geocoder.osm(location, url=f"{local_server}/search")
+    # not started log is not consumed by writer thread
+    access_log.log(g)
+    access_log.log(g)
+
+    assert access_log.dropped == 1
+
+    # drops from concurrent query threads are all counted
+    threads = [
+        threading.Thread(target=lambda: [access_log.log(g) for _ in range(500)])
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert access_log.dropped == 1 + 8 * 500
+
+
+def test__accesslog__invalid_usage():
+    with pytest.raises(ValueError, match="sample_rate"):
+        AccessLog(io.StringIO(), sample_rate=2)
+
+    with AccessLog(io.StringIO()) as access_log:
+        with pytest.raises(RuntimeError, match="already started"):
+            access_log.start()
@@ -0,0 +1,73 @@
+import pytest
+import vcr
+
+import geocoder
+from geocoder.archive import ResponseArchive, read_archive, replay
+from geocoder.providers import OsmQuery
+
+requests_recorder_ro = vcr.VCR(
+    serializer="json",
+    cassette_library_dir="tests/cassettes/",
+    filter_headers=["Authorization"],
+    filter_query_parameters=["key"],
+    record_mode="none",
+    match_on=["method", "path", "query"],
+    decode_compressed_response=True,
+)
+location = "Ottawa, Ontario"
+
+
+@requests_recorder_ro.use_cassette("osm_geocode.json")
+@pytest.mark.parametrize("compression", ["gzip", "none"])
+def test__archive__replay_without_network__return_same_results(tmp_path, compression):
+    with ResponseArchive(str(tmp_path), compression=compression) as archive:
+        original = geocoder.osm(location, max_results=5, archive=archive)
+
+    entries = list(read_archive(str(tmp_path)))
+    assert len(entries) == 1
+    assert entries[0]["provider"] == "osm"
+    assert entries[0]["status_code"] == 200
+    assert entries[0]["params"]["q"] == location
+
+    replayed = list(replay(str(tmp_path)))
+    assert len(replayed) == 1
+    assert len(replayed[0]) == len(original) == 5
+    assert replayed[0].latlng == original.latlng
+    assert [r.address for r in replayed[0]] == [r.address for r in original]
+
+
+def test__archive__segment_size__rotate_segments(tmp_path):
+    query = OsmQuery.from_raw([], location=location)
+    with ResponseArchive(str(tmp_path), segment_size=2, compression="none") as archive:
+        for _ in range(5):
+            archive.record(query, [], 0.1)
+
+    assert len(list(tmp_path.iterdir())) == 3
+    assert len(list(read_archive(str(tmp_path)))) == 5
+
+
+def test__archive__same_second__keep_all_segments(tmp_path, monkeypatch):
+    monkeypatch.setattr("time.strftime", lambda fmt: "20240101T000000")
+    query = OsmQuery.from_raw([], location=location)
+    for _ in range(2):
+        with ResponseArchive(str(tmp_path), compression="none") as archive:
+            archive.record(query, [], 0.1)
+
+    assert len(list(tmp_path.iterdir())) == 2
+    assert len(list(read_archive(str(tmp_path)))) == 2
+
+
+def test__from_raw__on_provider_payload__parse_results():
+    payload = [{"lat": "45.4", "lon": "-75.7", "display_name": "Ottawa"}]
+    g = OsmQuery.from_raw(payload, location=location)
+    assert g.is_called
+    assert g.has_data
+    assert g.latlng == [45.4, -75.7]
+    assert g.address == "Ottawa"
+
+
+def test__redacted_params__hide_credentials():
+    g = OsmQuery(location, key="secret", params={"key": "secret", "email": "secret"})
+    assert g.redacted_params["key"] == "<redacted>"
+    assert g.redacted_params["email"] == "<redacted>"
+    assert g.redacted_params["q"] == location
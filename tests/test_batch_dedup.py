@@ -0,0 +1,161 @@
+import pytest
+
+from geocoder.base import deduplicate_locations
+from geocoder.providers import (
+    BingBatchForward,
+    BingBatchReverse,
+    MapquestBatch,
+    USCensusBatch,
+)
+from geocoder.testing import MockProviderServer, MockResponse
+
+locations = ["Ottawa", "Toronto", " ottawa ", "OTTAWA", "Nowhere", "Toronto"]
+
+
+def test__deduplicate_locations():
+    unique, positions = deduplicate_locations(locations)
+    assert unique == ["Ottawa", "Toronto", "Nowhere"]
+    assert positions == [0, 1, 0, 0, 2, 1]
+
+
+def test__deduplicate_locations__coordinates():
+    unique, positions = deduplicate_locations(
+        [(45.4, -75.7), ["45.40", "-75.7"], (43.7, -79.4)]
+    )
+    assert unique == [(45.4, -75.7), (43.7, -79.4)]
+    assert positions == [0, 0, 1]
+
+
+def test__uscensus_batch__fan_out():
+    answer = MockResponse(
+        '"0","Ottawa","Match","Exact","OTTAWA","-75.7,45.4"\n'
+        '"1","Toronto","Match","Exact","TORONTO","-79.4,43.7"\n'
+        '"2","Nowhere","No_Match"\n',
+        headers={"Content-Type": "text/csv"},
+    )
+    with MockProviderServer() as server:
+        url = server.url_for(USCensusBatch._URL)
+        server.add_route(url[len(server.url) :], answer, method="POST")
+        g = USCensusBatch(locations, url=url)()
+
+    assert g.batch.decode("utf-8").splitlines() == [
+        "0,Ottawa,,,",
+        "1,Toronto,,,",
+        "2,Nowhere,,,",
+    ]
+    assert g.locations_length == len(g) == len(locations)
+    assert [result.address for result in g] == [
+        "OTTAWA",
+        "TORONTO",
+        "OTTAWA",
+        "OTTAWA",
+        None,
+        "TORONTO",
+    ]
+    assert [result.ok for result in g] == [True, True, True, True, False, True]
+    # duplicated rows get own result objects
+    assert g[0] is not g[2]
+
+
+def test__uscensus_batch__deduplicate_disabled():
+    g = USCensusBatch(locations, deduplicate=False)
+    assert len(g.batch.decode("utf-8").splitlines()) == len(locations)
+    assert g.batch_positions == list(range(len(locations)))
+
+
+def _bing_server(server, query_class, rows: str):
+    url = server.url_for(query_class._URL)
+    path = url[len(server.url) :]
+    job = {"resourceSets": [{"resources": [{"id": "job", "status": "Completed"}]}]}
+    server.add_route(path, MockResponse(job, 201), method="POST")
+    server.add_route(f"{path}/job", MockResponse(job))
+    server.add_route(
+        f"{path}/job/output/succeeded",
+        MockResponse(
+            f"Bing Spatial Data Services, 2.0\n{rows}",
+            headers={"Content-Type": "text/plain"},
+        ),
+    )
+    return url
+
+
+def test__bing_batch_forward__fan_out():
+    with MockProviderServer() as server:
+        url = _bing_server(
+            server,
+            BingBatchForward,
+            "Id,GeocodeRequest/Query,GeocodeResponse/Point/Latitude,"
+            "GeocodeResponse/Point/Longitude\n"
+            "0,Ottawa,45.4,-75.7\n"
+            "1,Toronto,43.7,-79.4\n",
+        )
+        g = BingBatchForward(locations, key="key", url=url)()
+
+    # header lines and 3 unique rows
+    assert len(g.batch.decode("utf-8").splitlines()) == 2 + 3
+    assert len(g) == len(locations)
+    assert [result.latlng for result in g] == [
+        [45.4, -75.7],
+        [43.7, -79.4],
+        [45.4, -75.7],
+        [45.4, -75.7],
+        None,
+        [43.7, -79.4],
+    ]
+    assert [result.ok for result in g] == [True, True, True, True, False, True]
+
+
+def test__bing_batch_reverse__fan_out():
+    points = [(45.4, -75.7), (45.4, -75.7), (43.7, -79.4)]
+    with MockProviderServer() as server:
+        url = _bing_server(
+            server,
+            BingBatchReverse,
+            "Id,GeocodeResponse/Address/FormattedAddress,"
+            "GeocodeResponse/Address/Locality,GeocodeResponse/Address/PostalCode,"
+            "GeocodeResponse/Address/AdminDistrict,"
+            "GeocodeResponse/Address/CountryRegion\n"
+            "0,Ottawa ON,Ottawa,K1A,ON,Canada\n"
+            "1,Toronto ON,Toronto,M5H,ON,Canada\n",
+        )
+        g = BingBatchReverse(points, key="key", url=url)()
+
+    assert len(g.batch.decode("utf-8").splitlines()) == 2 + 2
+    assert [result.city for result in g] == ["Ottawa", "Ottawa", "Toronto"]
+
+
+@pytest.mark.parametrize("deduplicate,uploaded", [(True, 3), (False, 6)])
+def test__mapquest_batch__fan_out(deduplicate, uploaded):
+    def answer(request):
+        return MockResponse(
+            {
+                "results": [
+                    {"locations": [{"latLng": {"lat": idx, "lng": idx}}]}
+                    for idx in range(uploaded)
+                ]
+            }
+        )
+
+    with MockProviderServer() as server:
+        url = server.url_for(MapquestBatch._URL)
+        server.add_route(url[len(server.url) :], answer)
+        g = MapquestBatch(locations, key="key", url=url, deduplicate=deduplicate)()
+
+    assert len(g.params["location"]) == uploaded
+    expected = [0, 1, 0, 0, 2, 1] if deduplicate else list(range(6))
+    assert [result.lat for result in g] == expected
+
+
+def test__mapquest_batch__results_count_mismatch__failed_query():
+    answer = MockResponse(
+        {"results": [{"locations": [{"latLng": {"lat": 1, "lng": 1}}]}]}
+    )
+    with MockProviderServer() as server:
+        url = server.url_for(MapquestBatch._URL)
+        server.add_route(url[len(server.url) :], answer)
+        g = MapquestBatch(locations, key="key", url=url)()
+
+    assert len(g) == 0
+    assert not g.ok
+    assert g.outcome == "error"
+    assert "1 results for 3 uploaded locations" in g.error
@@ -0,0 +1,97 @@
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from geocoder.bench import BenchReport, percentile, run_benchmark
+from geocoder.cli import cli
+
+location = "Ottawa, Ontario"
+
+
+def test__bench__run_benchmark__collect_report(local_server):
+    report = run_benchmark(
+        [location], requests=20, concurrency=4, url=f"{local_server}/search"
+    )
+
+    assert report.requests == 20
+    assert report.outcomes == {"ok": 20}
+    assert report.status_codes == {"200": 20}
+    assert len(report.latencies) == len(report.ratelimit_waits) == 20
+    assert report.latencies == sorted(report.latencies)
+    assert report.throughput > 0
+    summary = report.as_dict()
+    assert summary["latency"]["p50"] <= summary["latency"]["p99"]
+
+
+def test__bench__rate__keep_schedule(local_server):
+    report = run_benchmark(
+        [location], requests=5, concurrency=2, rate=50, url=f"{local_server}/search"
+    )
+
+    # 5 starts at 50 req/s take at least 4 intervals
+    assert report.duration >= 4 / 50
+
+
+def test__bench__errors__breakdown(local_server):
+    report = run_benchmark(
+        [location], requests=4, concurrency=2, url=f"{local_server}/status/503"
+    )
+
+    assert report.outcomes == {"http_error": 4}
+    assert report.status_codes == {"503": 4}
+    [(error, count)] = report.errors.items()
+    assert "503" in error and count == 4
+    assert "http_error 4" in report.format()
+
+
+def test__bench__percentile__nearest_rank():
+    values = [float(value) for value in range(1, 101)]
+
+    assert percentile(values, 0.5) == 50
+    assert percentile(values, 0.95) == 95
+    assert percentile(values, 0.99) == 99
+    assert percentile([1.0], 0.99) == 1
+    assert percentile([], 0.5) is None
+    assert BenchReport().as_dict()["latency"]["p50"] is None
+
+
+def test__bench__cli__json_report(local_server, tmp_path):
+    queries = tmp_path / "queries.txt"
+    queries.write_text("Ottawa\n\nToronto\n")
+    result = CliRunner().invoke(
+        cli,
+        [
+            "bench",
+            "-f",
+            str(queries),
+            "--url",
+            f"{local_server}/search",
+            "-n",
+            "6",
+            "-c",
+            "2",
+            "--json",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    report = json.loads(result.output)
+    assert report["requests"] == 6
+    assert report["outcomes"] == {"ok": 6}
+
+
+def test__bench__cli__without_queries__usage_error():
+    result = CliRunner().invoke(cli, ["bench"])
+
+    assert result.exit_code == 2
+    assert "At least one query" in result.output
+
+
+@pytest.mark.parametrize("command", [[], ["geocode"]])
+def test__cli__geocode__default_command(command, local_server):
+    args = ["-o", "geojson", "--url", f"{local_server}/search", "Ottawa"]
+    result = CliRunner().invoke(cli, command + args)
+
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output)["type"] == "FeatureCollection"
@@ -0,0 +1,73 @@
+import pytest
+import vcr
+
+import geocoder
+from geocoder.client import GeocoderClient
+from geocoder.transport import requests_session
+
+requests_recorder_ro = vcr.VCR(
+    serializer="json",
+    cassette_library_dir="tests/cassettes/",
+    filter_headers=["Authorization"],
+    filter_query_parameters=["key"],
+    record_mode="none",
+    match_on=["method", "path", "query"],
+    decode_compressed_response=True,
+)
+location = "Ottawa, Ontario"
+
+
+@requests_recorder_ro.use_cassette("osm_geocode.json", allow_playback_repeats=True)
+def test__client__geocode__reuse_session_and_prepared_query():
+    with geocoder.GeocoderClient(max_results=5) as client:
+        first = client.geocode(location)
+        second = client.geocode(location)
+
+        assert first.latlng == second.latlng
+        assert len(first) == 5
+        assert first.session is second.session
+        assert first.session is client.session_for(first.url)
+        assert client.prepared("osm") is client.prepared(" OSM ", "geocode")
+
+
+@requests_recorder_ro.use_cassette("osm_reverse.json")
+def test__client__reverse__return_correct_result():
+    client = GeocoderClient()
+    g = client.reverse((45.4215296, -75.6971930))
+    assert g.has_data
+
+
+def test__client__credentials__overwrite_environment(monkeypatch):
+    monkeypatch.setenv("BING_API_KEY", "environment-key")
+    monkeypatch.setenv("HERE_APP_ID", "environment-id")
+    client = GeocoderClient(
+        credentials={"bing": "client-key", "here": {"app_code": "client-code"}}
+    )
+
+    assert client.provider_credentials("bing") == {"key": "client-key"}
+    assert client.provider_credentials("here") == {
+        "app_id": "environment-id",
+        "app_code": "client-code",
+    }
+    assert client.prepared("bing").bind(location).params["key"] == "client-key"
+
+
+def test__client__geocode__on_wrong_query__raise_value_error():
+    with pytest.raises(ValueError):
+        GeocoderClient().geocode(2)
+
+
+@pytest.mark.parametrize("client_option", [False, True])
+def test__client__given_session__used_for_query(local_server, client_option):
+    url = f"{local_server}/search"
+    with requests_session() as session:
+        if client_option:
+            client = GeocoderClient("osm", url=url, session=session)
+            g = client.geocode("Ottawa")
+        else:
+            client = GeocoderClient("osm", url=url)
+            g = client.geocode("Ottawa", session=session)
+
+    assert g.ok
+    assert g.session is session
+    assert client._sessions == {}
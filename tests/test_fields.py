@@ -0,0 +1,63 @@
+import pytest
+
+import geocoder
+from geocoder.providers import OpenCageQuery, OsmQuery, OsmReverse
+
+location = "Ottawa, Ontario"
+payload = [
+    {
+        "lat": "45.4",
+        "lon": "-75.7",
+        "display_name": "Ottawa",
+        "address": {"city": "Ottawa", "country_code": "ca"},
+    },
+]
+
+
+def test__fields__osm__skip_address_details_when_not_needed():
+    assert OsmQuery(location).params["addressdetails"] == 1
+    assert OsmQuery(location, fields=["latlng"]).params["addressdetails"] == 0
+    assert OsmReverse([45.4, -75.7], fields="latlng").params["addressdetails"] == 0
+
+    g = OsmQuery(location, fields=["latlng", "country_code"])
+    assert g.params["addressdetails"] == 1
+    assert g.fields == ("latlng", "country_code")
+    assert "fields" not in g.params
+
+
+def test__fields__opencage__skip_annotations_when_not_needed():
+    assert "no_annotations" not in OpenCageQuery(location, key="key").params
+    g = OpenCageQuery(location, key="key", fields=["lat", "lng"])
+    assert g.params["no_annotations"] == 1
+    g = OpenCageQuery(location, key="key", fields=["lat", "lng", "geohash"])
+    assert "no_annotations" not in g.params
+
+
+def test__fields__unknown_field__raise_value_error():
+    with pytest.raises(ValueError):
+        OsmQuery(location, fields=["latlng", "unknown"])
+    with pytest.raises(ValueError):
+        OsmQuery(location, fields=["_address"])
+
+
+@pytest.mark.parametrize("field", ["freeze", "debug", "project", "object_json"])
+def test__fields__methods_and_state__raise_value_error(field):
+    with pytest.raises(ValueError, match="Unknown"):
+        OsmQuery(location, fields=[field])
+
+
+def test__fields__results__parse_only_requested_fields():
+    g = OsmQuery.from_raw(payload, location=location, fields=["latlng", "city"])
+
+    assert g[0].fieldnames == ["latlng", "city"]
+    assert g[0].object_json == {"latlng": [45.4, -75.7], "city": "Ottawa", "ok": True}
+    # all other properties are still available
+    assert g.country_code == "ca"
+
+
+def test__fields__get_results__request_reduced_answer(local_server):
+    g = geocoder.get_results(location, url=f"{local_server}/search", fields=["latlng"])
+
+    assert g.ok
+    assert "addressdetails=0" in g.raw_response.url
+    assert g[0].object_json == {"latlng": g.latlng, "ok": True}
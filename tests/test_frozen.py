@@ -0,0 +1,101 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from geocoder.providers import (
+    BingBatchForward,
+    BingBatchReverse,
+    OsmQuery,
+    OsmReverse,
+    USCensusBatch,
+)
+
+payload = [
+    {
+        "lat": "45.4",
+        "lon": "-75.7",
+        "display_name": "Ottawa",
+        "boundingbox": ["45.2", "45.5", "-75.8", "-75.5"],
+    },
+    {"lat": "45.3", "lon": "-75.6", "display_name": "Ottawa, Kansas"},
+]
+
+
+def test__geojson__do_not_mutate_object_json():
+    result = OsmQuery.from_raw(payload, location="Ottawa")[0]
+    object_json = dict(result.object_json)
+    feature = result.geojson
+    feature["properties"]["extra"] = True
+    assert feature["properties"]["bbox"] == result.bbox
+    assert result.object_json == object_json
+
+
+def test__frozen__query_and_results__reject_changes():
+    g = OsmQuery.from_raw(payload, location="Ottawa", frozen=True)
+    assert g.frozen
+    assert all(result.frozen for result in g)
+    assert len(g) == 2
+
+    with pytest.raises(AttributeError):
+        g.location = "Paris"
+    with pytest.raises(AttributeError):
+        g[0].object_raw_json = {}
+    with pytest.raises(TypeError):
+        g.add(g[0])
+    with pytest.raises(TypeError):
+        del g[0]
+
+
+def test__frozen__shared_between_threads__return_same_output():
+    g = OsmQuery.from_raw(payload, location="Ottawa", frozen=True)
+    expected = g.geojson
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        outputs = list(executor.map(lambda _: g.geojson, range(100)))
+
+    assert all(output == expected for output in outputs)
+
+
+bing_header = "Bing Spatial Data Services, 2.0\n"
+families = [
+    pytest.param(OsmQuery, "Ottawa", payload, id="geocode"),
+    pytest.param(OsmReverse, [45.4, -75.7], payload[:1], id="reverse"),
+    pytest.param(
+        USCensusBatch,
+        ["1 Main St"],
+        b'"0","1 Main St","Match","Exact","1 MAIN ST","-75.7,45.4","1","L"\n',
+        id="uscensus-batch",
+    ),
+    pytest.param(
+        BingBatchForward,
+        ["1 Main St"],
+        (
+            f"{bing_header}Id,GeocodeRequest/Query,GeocodeResponse/Point/Latitude,"
+            "GeocodeResponse/Point/Longitude\n0,1 Main St,45.4,-75.7\n"
+        ).encode("utf-8"),
+        id="bing-batch",
+    ),
+    pytest.param(
+        BingBatchReverse,
+        [[45.4, -75.7]],
+        (
+            f"{bing_header}Id,GeocodeResponse/Address/FormattedAddress,"
+            "GeocodeResponse/Address/Locality,GeocodeResponse/Address/PostalCode,"
+            "GeocodeResponse/Address/AdminDistrict,"
+            "GeocodeResponse/Address/CountryRegion\n"
+            "0,1 Main St,Ottawa,K1A,ON,Canada\n"
+        ).encode("utf-8"),
+        id="bing-batch-reverse",
+    ),
+]
+
+
+@pytest.mark.parametrize("query_class, location, raw", families)
+def test__frozen__every_result_family__parse_and_freeze(query_class, location, raw):
+    g = query_class.from_raw(raw, location=location, frozen=True)
+
+    assert g.ok, g.error
+    assert g.frozen
+    assert all(result.frozen for result in g)
+    assert g[0].object_json["ok"]
+    assert "ok" in g[0].fieldnames
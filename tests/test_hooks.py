@@ -0,0 +1,137 @@
+import pytest
+
+import geocoder
+from geocoder import hooks
+from geocoder.providers import BingBatchForward, OsmQuery
+
+location = "Ottawa, Ontario"
+bing_result = (
+    b"Bing Spatial Data Services, 2.0\n"
+    b"Id,GeocodeRequest/Query,GeocodeResponse/Point/Latitude,"
+    b"GeocodeResponse/Point/Longitude\n"
+    b"0,Ottawa,45.4,-75.7\n"
+)
+
+
+@pytest.fixture
+def events():
+    recorded = []
+
+    def recorder(event):
+        return lambda query, **details: recorded.append((event, query, details))
+
+    for event in hooks.EVENTS:
+        hooks.subscribe(event, recorder(event))
+    yield recorded
+    hooks.clear()
+
+
+def test__hooks__successful_call__events_order(local_server, events):
+    g = geocoder.osm(location, url=f"{local_server}/search", key="secret")
+
+    assert [event for event, _, _ in events] == [
+        "before_request",
+        "after_response",
+        "on_parse_complete",
+        "after_call",
+    ]
+    assert all(query is g for _, query, _ in events)
+    assert events[0][2] == {
+        "url": f"{local_server}/search",
+        "params": g.redacted_params,
+    }
+    assert "secret" not in str(events[0][2]["params"])
+    assert events[1][2]["status_code"] == 200
+    assert events[1][2]["response"] is g.raw_response
+    assert events[2][2] == {"count": len(g)}
+
+
+def test__hooks__http_error__on_error(local_server, events):
+    g = geocoder.osm(location, url=f"{local_server}/status/500")
+
+    assert [event for event, _, _ in events] == [
+        "before_request",
+        "after_response",
+        "on_error",
+        "after_call",
+    ]
+    assert events[2][2] == {"error": g.error, "exception": g.exception}
+    assert events[2][1].timings.total is not None
+
+
+def test__hooks__from_raw__only_parse_complete(events):
+    OsmQuery.from_raw([{"lat": "45.4", "lon": "-75.7"}])
+
+    assert [(event, details) for event, _, details in events] == [
+        ("on_parse_complete", {"count": 1})
+    ]
+
+
+def test__hooks__bing_batch__on_batch_poll(local_server, events, monkeypatch):
+    polls = iter([False, True])
+    monkeypatch.setattr(BingBatchForward, "_BATCH_WAIT", 0)
+    monkeypatch.setattr(BingBatchForward, "extract_resource_id", lambda self, r: "1")
+    monkeypatch.setattr(BingBatchForward, "is_job_done", lambda self, job: next(polls))
+    monkeypatch.setattr(
+        BingBatchForward, "get_job_result", lambda self, job: bing_result
+    )
+
+    BingBatchForward(["Ottawa"], key="key", url=f"{local_server}/echo")()
+
+    polls = [details for event, _, details in events if event == "on_batch_poll"]
+    assert [(poll["attempt"], poll["done"], poll["job_id"]) for poll in polls] == [
+        (1, False, "1"),
+        (2, True, "1"),
+    ]
+    assert all(poll["elapsed"] >= 0 for poll in polls)
+
+
+def test__hooks__before_request__exception_cancel_request(local_server):
+    def throttle(query, **details):
+        raise RuntimeError(f"{query._PROVIDER} is throttled")
+
+    hooks.subscribe("before_request", throttle)
+    try:
+        with pytest.raises(RuntimeError, match="osm is throttled"):
+            geocoder.osm(location, url=f"{local_server}/search")
+    finally:
+        hooks.unsubscribe("before_request", throttle)
+
+    assert geocoder.osm(location, url=f"{local_server}/search").ok
+
+
+@pytest.mark.parametrize("event", ["after_response", "on_parse_complete", "after_call"])
+def test__hooks__observation_event__exception_is_logged(local_server, event, caplog):
+    def broken(query, **details):
+        raise RuntimeError("broken subscriber")
+
+    hooks.subscribe(event, broken)
+    try:
+        g = geocoder.osm(location, url=f"{local_server}/search")
+    finally:
+        hooks.unsubscribe(event, broken)
+
+    assert g.ok
+    assert f"of {event} event failed" in caplog.text
+
+
+def test__hooks__no_subscribers__redacted_params_not_built(local_server, monkeypatch):
+    def redacted_params(query):
+        raise AssertionError("Redacted params are built")
+
+    monkeypatch.setattr(OsmQuery, "redacted_params", property(redacted_params))
+    assert not hooks.has_subscribers("before_request")
+    assert geocoder.osm(location, url=f"{local_server}/search").ok
+
+
+def test__hooks__subscribe__decorator_and_unknown_event():
+    @hooks.subscribe("on_error")
+    def callback(query, **details):
+        pass
+
+    assert callback in hooks._subscribers["on_error"]
+    hooks.unsubscribe("on_error", callback)
+    assert hooks._subscribers["on_error"] == ()
+
+    with pytest.raises(ValueError, match="Unknown event"):
+        hooks.subscribe("on_anything", callback)
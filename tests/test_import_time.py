@@ -0,0 +1,77 @@
+"""Guard against regressions of ``import geocoder`` cold start cost."""
+import subprocess
+import sys
+
+import pytest
+
+# Cumulative import time of geocoder package itself (without interpreter startup),
+# in microseconds. Generous to stay stable on slow CI runners.
+IMPORT_TIME_BUDGET = 100_000
+
+
+def run_python(code: str, *args) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+
+@pytest.mark.parametrize(
+    "module",
+    ["requests", "ratelim", "click", "geocoder.cli", "geocoder.base"]
+    + ["geocoder.providers.osm", "geocoder.providers.google"],
+)
+def test__import_geocoder__do_not_import_heavy_modules(module):
+    result = run_python(f"import sys, geocoder; print({module!r} in sys.modules)")
+    assert result.stdout.strip() == "False"
+
+
+def test__import_geocoder__do_not_configure_root_logger():
+    result = run_python("import logging, geocoder; print(logging.root.handlers)")
+    assert result.stdout.strip() == "[]"
+
+
+def test__import_geocoder__fit_import_time_budget():
+    result = run_python("import geocoder", "-X", "importtime")
+    cumulative = [
+        int(line.split("|")[1])
+        for line in result.stderr.splitlines()
+        if line.split("|")[-1].strip() == "geocoder"
+    ]
+    assert cumulative
+    assert cumulative[0] < IMPORT_TIME_BUDGET
+
+
+def test__options__resolve_query_class_on_access():
+    result = run_python(
+        "import sys; from geocoder.api import options; "
+        "before = 'geocoder.providers.osm' in sys.modules; "
+        "options['osm']['geocode']; "
+        "print(before, 'geocoder.providers.osm' in sys.modules)"
+    )
+    assert result.stdout.strip() == "False True"
+
+
+@pytest.mark.parametrize(
+    "first",
+    ["geocoder.cli", "geocoder.cli_command", "importlib.import_module('geocoder.cli')"],
+)
+def test__cli_attributes__same_on_any_import_order(first):
+    result = run_python(
+        f"import importlib, types, geocoder; {first}; "
+        "print(isinstance(geocoder.cli, types.ModuleType), "
+        "geocoder.cli_command is geocoder.cli.cli)"
+    )
+    assert result.stdout.strip() == "True True"
+
+
+def test__console_script__resolves_to_command():
+    result = run_python(
+        "from importlib.metadata import EntryPoint; import geocoder; "
+        "command = geocoder.cli_command; "
+        "ep = EntryPoint('geocode', 'geocoder.cli:cli', 'console_scripts'); "
+        "print(ep.load() is command is geocoder.cli.cli)"
+    )
+    assert result.stdout.strip() == "True"
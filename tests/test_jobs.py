@@ -0,0 +1,165 @@
+import csv
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from geocoder.cli import cli
+from geocoder.jobs import GeocodeJob
+from geocoder.testing import MockProviderServer, MockResponse
+from geocoder.transport import requests_session
+
+locations = [f"{idx} Main St" for idx in range(10)]
+
+
+class FlakySearch(object):
+    """OSM search answer, that fails for locations starting with ``fail``"""
+
+    def __init__(self):
+        with open("tests/cassettes/osm_geocode.json") as cassette:
+            interaction = json.load(cassette)["interactions"][0]
+        self.body = interaction["response"]["body"]["string"]
+        self.recovered = False
+
+    def __call__(self, request):
+        if request.query["q"].startswith("fail") and not self.recovered:
+            return MockResponse({}, 500)
+        return MockResponse(self.body)
+
+
+@pytest.fixture
+def flaky():
+    return FlakySearch()
+
+
+@pytest.fixture
+def flaky_url(flaky):
+    with MockProviderServer() as server:
+        server.add_route("/search", flaky)
+        yield f"{server.url}/search"
+
+
+def interrupted(items, after: int):
+    """Input, that is killed after given number of rows"""
+    for idx, item in enumerate(items):
+        if idx == after:
+            raise KeyboardInterrupt
+        yield item
+
+
+def lines(path) -> list:
+    return path.read_text().splitlines()
+
+
+def test__job__runs_and_checkpoints(flaky_url, tmp_path):
+    output = tmp_path / "out.ndjson"
+    with GeocodeJob(str(output), url=flaky_url, checkpoint_every=3) as job:
+        job.run(locations)
+
+        assert (job.processed, job.succeeded, job.failed) == (10, 10, 0)
+        assert job.offset == 10
+        assert job.failed_rows == []
+    assert len(lines(output)) == 10
+    assert (tmp_path / "out.ndjson.checkpoint").exists()
+
+
+def test__job__resumes_after_interruption(flaky_url, tmp_path):
+    output = tmp_path / "out.ndjson"
+    with GeocodeJob(str(output), url=flaky_url, workers=2) as job:
+        # rows 4..7 are in flight, when row 8 is read
+        with pytest.raises(KeyboardInterrupt):
+            job.run(interrupted(locations, 8))
+        assert job.offset == 4
+    assert len(lines(output)) == 4
+
+    # rows written after last checkpoint, like before hard kill
+    with open(output, "a") as stream:
+        stream.write('{"partial": \n')
+
+    with GeocodeJob(str(output), url=flaky_url, workers=3) as job:
+        job.run(locations)
+        assert job.processed == 6
+        assert job.offset == 10
+    assert [json.loads(line)["type"] for line in lines(output)] == [
+        "FeatureCollection"
+    ] * 10
+
+    # finished job has nothing to do
+    with GeocodeJob(str(output), url=flaky_url) as job:
+        job.run(locations)
+        assert job.processed == 0
+    assert len(lines(output)) == 10
+
+
+def test__job__failed_rows_and_retry(flaky, flaky_url, tmp_path):
+    output = tmp_path / "out.csv"
+    checkpoint = tmp_path / "job.sqlite"
+    items = ["fail 1", "Ottawa", "fail 2", "Toronto"]
+    with GeocodeJob(
+        str(output), str(checkpoint), output_format="csv", url=flaky_url
+    ) as job:
+        job.run(items)
+
+        assert (job.succeeded, job.failed) == (2, 2)
+        assert [(row, location) for row, location, _ in job.failed_rows] == [
+            (0, "fail 1"),
+            (2, "fail 2"),
+        ]
+
+    # provider is back, only failed rows are geocoded and appended
+    flaky.recovered = True
+    with GeocodeJob(
+        str(output), str(checkpoint), output_format="csv", url=flaky_url
+    ) as job:
+        job.retry_failed()
+        assert (job.processed, job.succeeded) == (2, 2)
+        assert job.failed_rows == []
+        assert job.offset == 4
+
+    with open(output, newline="") as stream:
+        rows = list(csv.DictReader(stream))
+    assert [row["location"] for row in rows] == [
+        "Ottawa",
+        "Toronto",
+        "fail 1",
+        "fail 2",
+    ]
+
+
+def test__job__given_session__used_for_all_rows(flaky_url, tmp_path):
+    output = tmp_path / "out.ndjson"
+    with requests_session() as session:
+        with GeocodeJob(str(output), url=flaky_url, workers=2, session=session) as job:
+            job.run(locations)
+
+            assert (job.succeeded, job.failed) == (10, 0)
+        # session is not closed by job
+        assert session.get(flaky_url, params={"q": "Ottawa"}).ok
+    assert len(lines(output)) == 10
+
+
+def test__job__unsupported_output_format(tmp_path):
+    with pytest.raises(ValueError):
+        GeocodeJob(str(tmp_path / "out.geojson"), output_format="geojson")
+
+
+def test__cli__job_resume_and_retry(flaky, flaky_url, tmp_path):
+    source = tmp_path / "addresses.txt"
+    source.write_text("Ottawa\nfail 1\nToronto\n")
+    output = tmp_path / "out.ndjson"
+    arguments = ["job", str(source), "-f", str(output), "--url", flaky_url]
+
+    result = CliRunner().invoke(cli, arguments)
+    assert result.exit_code == 0, result.output
+    assert "2 succeeded, 1 failed" in result.stderr
+    assert len(lines(output)) == 2
+
+    result = CliRunner().invoke(cli, arguments)
+    assert result.exit_code == 0, result.output
+    assert "Processed 0 rows" in result.stderr
+
+    flaky.recovered = True
+    result = CliRunner().invoke(cli, arguments + ["--retry-failed"])
+    assert result.exit_code == 0, result.output
+    assert "1 succeeded, 0 failed, 0 failed rows in checkpoint" in result.stderr
+    assert len(lines(output)) == 3
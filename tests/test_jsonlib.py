@@ -0,0 +1,91 @@
+import importlib.util
+import json
+
+import pytest
+
+import geocoder
+from geocoder import jsonlib
+from geocoder.providers import BingBatchForward
+from geocoder.testing import MockProviderServer, MockResponse
+
+installed_backends = [
+    name
+    for name in jsonlib.BACKENDS
+    if name == "json" or importlib.util.find_spec(name) is not None
+]
+
+
+@pytest.fixture(params=installed_backends)
+def backend(request):
+    previous = jsonlib.backend
+    jsonlib.set_backend(request.param)
+    yield request.param
+    jsonlib.set_backend(previous)
+
+
+def test__loads__from_bytes_and_str__return_same_object(backend):
+    content = '{"display_name": "Москва", "lat": "55.75", "boundingbox": [1, 2.5]}'
+    assert jsonlib.loads(content.encode("utf-8")) == jsonlib.loads(content)
+    assert jsonlib.loads(content)["display_name"] == "Москва"
+
+
+def test__loads__on_malformed_json__raise_value_error(backend):
+    with pytest.raises(ValueError):
+        jsonlib.loads(b"<html>Bad gateway</html>")
+
+
+def test__dumps__round_trip(backend):
+    obj = {"lat": 45.4215296, "name": "Ottawa", "bbox": [1.5, 2.5], "ok": True}
+    assert jsonlib.loads(jsonlib.dumps(obj)) == obj
+    assert jsonlib.loads(jsonlib.dumpb(obj, indent=2, sort_keys=True)) == obj
+
+
+def test__set_backend__on_unknown_backend__raise_value_error():
+    with pytest.raises(ValueError):
+        jsonlib.set_backend("pickle")
+
+
+@pytest.mark.parametrize(
+    "charset, name",
+    [("iso-8859-1", "Montréal"), ("cp1251", "Москва"), ("utf-16", "Москва, Montréal")],
+)
+def test__query__non_utf8_charset__decode_with_declared_charset(backend, charset, name):
+    answer = [{"lat": "45.5", "lon": "-73.5", "display_name": name}]
+    body = json.dumps(answer, ensure_ascii=False)
+    headers = {"Content-Type": f"application/json; charset={charset}"}
+    with MockProviderServer() as server:
+        route = MockResponse(body.encode(charset), headers=headers)
+        server.add_route("/search", route)
+        g = geocoder.osm(name, url=f"{server.url}/search")
+
+    assert g.ok, g.error
+    assert g.address == name
+
+
+def test__bing_batch__non_utf8_job_answers__decode_with_declared_charset(
+    backend, monkeypatch
+):
+    monkeypatch.setattr(BingBatchForward, "_BATCH_WAIT", 0)
+    headers = {"Content-Type": "application/json; charset=cp1251"}
+    resource = {"id": "job", "status": "Completed", "description": "Москва"}
+    job = json.dumps({"resourceSets": [{"resources": [resource]}]}, ensure_ascii=False)
+    with MockProviderServer() as server:
+        url = server.url_for(BingBatchForward._URL)
+        path = url[len(server.url) :]
+        body = job.encode("cp1251")
+        server.add_route(path, MockResponse(body, 201, headers), method="POST")
+        server.add_route(f"{path}/job", MockResponse(body, 200, headers))
+        server.add_route(
+            f"{path}/job/output/succeeded",
+            MockResponse(
+                "Bing Spatial Data Services, 2.0\n"
+                "Id,GeocodeRequest/Query,GeocodeResponse/Point/Latitude,"
+                "GeocodeResponse/Point/Longitude\n"
+                "0,Ottawa,45.4,-75.7\n",
+                headers={"Content-Type": "text/plain"},
+            ),
+        )
+        g = BingBatchForward(["Ottawa"], key="key", url=url)()
+
+    assert g.ok, g.error
+    assert g.latlng == [45.4, -75.7]
@@ -0,0 +1,56 @@
+import pytest
+
+from geocoder.base import LazyResults
+from geocoder.providers import OsmQuery
+
+payload = [
+    {"lat": "45.4", "lon": "-75.7", "display_name": "Ottawa"},
+    {"lat": "45.3", "lon": "-75.6", "display_name": "Ottawa, Kansas"},
+    {"lat": "41.3", "lon": "-88.8", "display_name": "Ottawa, Illinois"},
+]
+
+
+def test__lazy_results__build_only_accessed_results():
+    g = OsmQuery.from_raw(payload, location="Ottawa")
+
+    assert isinstance(g.results_list, LazyResults)
+    assert len(g) == 3
+    assert g.results_list.built_count == 1
+    assert g.current_result is g[0]
+    assert g.address == "Ottawa"
+
+    assert g[-1].address == "Ottawa, Illinois"
+    assert g.results_list.built_count == 2
+    assert [result.address for result in g][1] == "Ottawa, Kansas"
+    assert g.results_list.built_count == 3
+    assert g[1] is g[1]
+    assert g[0:2] == [g[0], g[1]]
+
+
+def test__lazy_results__modes_applied_to_later_built_results():
+    g = OsmQuery.from_raw(payload, fields=["latlng"], lean=True, frozen=True)
+
+    assert g.results_list.built_count == 1
+    last = g[2]
+    assert last.frozen and last.lean
+    assert last.fieldnames == ["latlng"]
+    with pytest.raises(TypeError):
+        g.results_list[0] = last
+    with pytest.raises(TypeError):
+        g.add(last)
+
+
+def test__lazy_results__list_changes():
+    g = OsmQuery.from_raw(payload, location="Ottawa")
+    first = g[0]
+
+    del g[1]
+    g.insert(0, first)
+    g.add(first)
+    assert len(g) == 4
+    assert [result.address for result in g] == [
+        "Ottawa",
+        "Ottawa",
+        "Ottawa, Illinois",
+        "Ottawa",
+    ]
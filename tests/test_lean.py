@@ -0,0 +1,71 @@
+import pytest
+import vcr
+
+import geocoder
+from geocoder.providers import OsmQuery
+
+requests_recorder_ro = vcr.VCR(
+    serializer="json",
+    cassette_library_dir="tests/cassettes/",
+    filter_headers=["Authorization"],
+    filter_query_parameters=["key"],
+    record_mode="none",
+    match_on=["method", "path", "query"],
+    decode_compressed_response=True,
+)
+location = "Ottawa, Ontario"
+payload = [
+    {
+        "lat": "45.4",
+        "lon": "-75.7",
+        "display_name": "Ottawa",
+        "address": {"city": "Ottawa", "country_code": "ca"},
+    },
+]
+
+
+@requests_recorder_ro.use_cassette("osm_geocode.json", allow_playback_repeats=True)
+def test__lean__drop_response_and_keep_results():
+    full = geocoder.osm(location)
+    g = geocoder.osm(location, lean=True)
+
+    assert g.ok
+    assert g.raw_response is None
+    assert g.raw_json is None
+    assert g.session is None
+    assert g.status_code == 200
+    assert g.latlng == full.latlng
+    assert g.address == full.address
+    assert g.geojson == full.geojson
+    assert "lean" not in g.params
+
+
+def test__lean__results_do_not_keep_parsed_json():
+    result = OsmQuery.from_raw(payload, location="Ottawa", lean=True)[0]
+
+    assert result.lean
+    assert result.object_json["city"] == "Ottawa"
+    assert "city" in result.fieldnames
+    assert result._object_json is None
+    assert result._fieldnames is None
+
+
+def test__object_json__parsed_once_on_first_access():
+    result = OsmQuery.from_raw(payload, location="Ottawa")[0]
+
+    assert result._object_json is None
+    assert result.object_json is result.object_json
+    assert result.make_lean()._object_json is None
+
+
+def test__lean__class_default_and_frozen_mode(monkeypatch):
+    monkeypatch.setattr(OsmQuery, "_LEAN", True)
+    g = OsmQuery.from_raw(payload, location="Ottawa", frozen=True)
+
+    assert g.frozen and g[0].lean
+    assert g.raw_json is None
+    with pytest.raises(TypeError):
+        g.make_lean()
+    with pytest.raises(AttributeError):
+        g[0].make_lean()
+    assert not OsmQuery.from_raw(payload, lean=False)[0].lean
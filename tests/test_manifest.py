@@ -0,0 +1,138 @@
+import csv
+import io
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from geocoder.cli import cli
+from geocoder.manifest import ManifestPipeline
+from geocoder.streaming import CSVWriter, GeoJSONWriter, NDJSONWriter
+from geocoder.testing import MockProviderServer, MockResponse
+from geocoder.transport import requests_session
+
+
+@pytest.fixture
+def server():
+    with open("tests/cassettes/osm_geocode.json") as cassette:
+        interaction = json.load(cassette)["interactions"][0]
+    body = interaction["response"]["body"]["string"]
+    with MockProviderServer() as server:
+        server.add_route(
+            "/search",
+            lambda request: (
+                MockResponse({}, 500)
+                if request.query["q"].startswith("fail")
+                else MockResponse(body)
+            ),
+        )
+        yield server
+
+
+def run(manifest, server, locations, writer_class=CSVWriter, **kwargs):
+    stream = io.StringIO()
+    url = f"{server.url}/search"
+    with ManifestPipeline(str(manifest), url=url, **kwargs) as pipeline:
+        with writer_class(stream) as writer:
+            before = server.request_count
+            pipeline.run(locations, writer)
+            pipeline.sent = server.request_count - before
+    return pipeline, stream.getvalue()
+
+
+def test__manifest__geocodes_only_changed_rows(server, tmp_path):
+    manifest = tmp_path / "addresses.manifest"
+    first, first_output = run(manifest, server, ["A St", "B St", "C St"])
+    assert (first.total, first.reused, first.requested) == (3, 0, 3)
+    assert first.sent == 3
+
+    second, second_output = run(manifest, server, ["A St", "B St", "C St"])
+    assert (second.reused, second.requested, second.sent) == (3, 0, 0)
+    assert second_output == first_output
+
+    # B changed, D added, C removed
+    third, third_output = run(manifest, server, ["A St", "B Ave", "D St"], workers=2)
+    assert (third.reused, third.requested, third.sent) == (1, 2, 2)
+    assert third.removed == 2
+    rows = list(csv.DictReader(io.StringIO(third_output)))
+    assert [row["location"] for row in rows] == ["A St", "B Ave", "D St"]
+
+    with ManifestPipeline(str(manifest)) as pipeline:
+        assert len(pipeline) == 3
+
+
+def test__manifest__failed_rows_are_retried(server, tmp_path):
+    manifest = tmp_path / "addresses.manifest"
+    first, output = run(manifest, server, ["A St", "fail St"])
+    assert first.failed == 1
+    assert len(output.splitlines()) == 3
+
+    second, _ = run(manifest, server, ["A St", "fail St"])
+    assert (second.reused, second.requested, second.failed) == (1, 1, 1)
+
+
+def test__manifest__output_format_is_part_of_hash(server, tmp_path):
+    manifest = tmp_path / "addresses.manifest"
+    run(manifest, server, ["A St", "B St"], NDJSONWriter)
+    pipeline, output = run(manifest, server, ["A St", "B St"], GeoJSONWriter)
+
+    assert pipeline.sent == 2
+    features = json.loads(output)["features"]
+    assert {feature["properties"]["query"] for feature in features} == {
+        "A St",
+        "B St",
+    }
+
+    pipeline, cached = run(manifest, server, ["A St", "B St"], GeoJSONWriter)
+    assert pipeline.sent == 0
+    assert json.loads(cached) == json.loads(output)
+
+
+def test__manifest__option_change_geocodes_again(server, tmp_path):
+    manifest = tmp_path / "addresses.manifest"
+    run(manifest, server, ["A St", "B St"], language="en")
+
+    pipeline, _ = run(manifest, server, ["A St", "B St"], language="fr")
+    assert (pipeline.reused, pipeline.sent) == (0, 2)
+
+    pipeline, _ = run(manifest, server, ["A St", "B St"], language="fr")
+    assert (pipeline.reused, pipeline.sent) == (2, 0)
+
+
+def test__manifest__given_session__used_and_not_closed(server, tmp_path):
+    manifest = tmp_path / "addresses.manifest"
+    with requests_session() as session:
+        first, output = run(manifest, server, ["A St", "B St"], session=session)
+        assert (first.requested, first.failed, first.sent) == (2, 0, 2)
+        assert len(output.splitlines()) == 3
+
+        # session is not part of row hash
+        second, _ = run(manifest, server, ["A St", "B St"], session=session)
+        assert (second.reused, second.sent) == (2, 0)
+        assert session.get(f"{server.url}/search", params={"q": "A St"}).ok
+
+
+def test__manifest__row_exception__logged(server, tmp_path, caplog):
+    manifest = tmp_path / "addresses.manifest"
+    pipeline, output = run(manifest, server, ["A St"], method="unknown")
+
+    assert (pipeline.requested, pipeline.failed) == (1, 1)
+    assert output.splitlines() == [",".join(CSVWriter.columns)]
+    assert "Row 'A St' is skipped" in caplog.text
+
+
+def test__cli__manifest(server, tmp_path):
+    source = tmp_path / "addresses.txt"
+    source.write_text("A St\nB St\n")
+    manifest = tmp_path / "addresses.manifest"
+    arguments = ["--url", f"{server.url}/search", "--manifest", str(manifest)]
+
+    result = CliRunner().invoke(cli, arguments + [str(source)])
+    assert result.exit_code == 0, result.output
+    assert "reused 0, requested 2" in result.stderr
+
+    source.write_text("A St\nB St\nC St\n")
+    result = CliRunner().invoke(cli, arguments + [str(source)])
+    assert result.exit_code == 0, result.output
+    assert "reused 2, requested 1" in result.stderr
+    assert len(result.stdout.splitlines()) == 3
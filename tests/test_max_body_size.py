@@ -0,0 +1,97 @@
+import pytest
+
+import geocoder
+from geocoder.base import MultipleResultsQuery
+from geocoder.providers import OsmQuery, OsmQueryDetail
+from geocoder.transport import HTTPXTransport, Urllib3Transport, requests_session
+
+location = "Ottawa, Ontario"
+transports = [
+    pytest.param(requests_session, id="requests"),
+    pytest.param(Urllib3Transport, id="urllib3"),
+    pytest.param(lambda: HTTPXTransport(http2=False), id="httpx"),
+]
+
+
+@pytest.mark.parametrize("path", ["search", "chunked"])
+@pytest.mark.parametrize("factory", transports)
+def test__max_body_size__exceeded__abort_with_error(local_server, factory, path):
+    with factory() as transport:
+        g = geocoder.osm(
+            location,
+            url=f"{local_server}/{path}",
+            session=transport,
+            max_body_size=100,
+        )
+
+    assert not g.ok
+    assert g.status_code == 200
+    assert "exceeds max_body_size of 100 bytes" in g.error
+    assert "max_body_size" not in g.params
+
+
+@pytest.mark.parametrize("factory", transports)
+def test__max_body_size__chunked_answer__read_fully(local_server, factory):
+    with factory() as transport:
+        g = geocoder.osm(location, url=f"{local_server}/chunked", session=transport)
+        # connection is returned to pool and reused
+        second = geocoder.osm(location, url=f"{local_server}/search", session=transport)
+
+    assert g.ok and second.ok
+    assert g.latlng == second.latlng
+    assert g.raw_response.content == second.raw_response.content
+
+
+class _StreamedResponse(object):
+    def __init__(self, body: bytes, headers: dict):
+        self.body = body
+        self.headers = headers
+        self.chunk_sizes = []
+
+    def iter_content(self, chunk_size: int):
+        self.chunk_sizes.append(chunk_size)
+        for start in range(0, len(self.body), chunk_size):
+            yield self.body[start : start + chunk_size]
+
+    def close(self):
+        pass
+
+
+@pytest.mark.parametrize(
+    "headers, chunk_size",
+    [
+        ({"Content-Length": "200000"}, 200000),
+        ({"Content-Length": "200000", "Content-Encoding": "gzip"}, 64 * 1024),
+        ({}, 64 * 1024),
+    ],
+)
+def test__max_body_size__declared_size__read_with_one_chunk(headers, chunk_size):
+    body = b"x" * 200000
+    response = _StreamedResponse(body, headers)
+    query = OsmQuery(location)
+
+    content = query._read_body(response)
+    assert response.chunk_sizes == [chunk_size]
+    assert content == body
+    assert (content is body) == (chunk_size == len(body))
+    assert query.response_size == len(body)
+
+
+def test__max_body_size__provider_defaults():
+    assert MultipleResultsQuery._MAX_BODY_SIZE == 16 * 1024 * 1024
+    assert OsmQueryDetail._MAX_BODY_SIZE > OsmQuery._MAX_BODY_SIZE
+    assert OsmQuery(location).max_body_size == OsmQuery._MAX_BODY_SIZE
+    assert OsmQuery(location, max_body_size=1024).max_body_size == 1024
+    assert OsmQuery(location, max_body_size=None).max_body_size is None
+    prepared = geocoder.prepare("osm", max_body_size=None)
+    assert prepared.bind(location).max_body_size is None
+
+
+def test__max_body_size__none__disable_check(local_server, monkeypatch):
+    monkeypatch.setattr(OsmQuery, "_MAX_BODY_SIZE", 100)
+    url = f"{local_server}/search"
+
+    assert not geocoder.osm(location, url=url).ok
+    g = geocoder.osm(location, url=url, max_body_size=None)
+    assert g.ok
+    assert g.response_size > 100
@@ -0,0 +1,43 @@
+from geocoder.base import memoized_property
+from geocoder.providers import OsmQuery, OsmResult
+
+payload = [
+    {
+        "lat": "45.4",
+        "lon": "-75.7",
+        "display_name": "Ottawa",
+        "boundingbox": ["45.2", "45.5", "-75.8", "-75.5"],
+    },
+]
+
+
+class CountingResult(OsmResult):
+    calls = 0
+
+    @memoized_property
+    def bbox(self):
+        type(self).calls += 1
+        return super().bbox
+
+
+def test__memoized_property__computed_once_per_instance():
+    result = CountingResult(payload[0])
+    result.geojson, result.object_json, result.confidence, result.bounds
+
+    assert CountingResult.calls == 1
+    assert result.bbox is result.bbox
+    assert result.__dict__["bbox"] == [-75.8, 45.2, -75.5, 45.5]
+    assert isinstance(OsmResult.__dict__["bbox"], memoized_property)
+
+
+def test__memoized_property__frozen_and_lean_results():
+    frozen = OsmQuery.from_raw(payload, frozen=True)[0]
+    assert frozen.confidence == frozen.__dict__["confidence"]
+
+    result = OsmQuery.from_raw(payload)[0]
+    assert result.wkt == "POINT(-75.7 45.4)"
+    assert "wkt" in result.__dict__
+    result.make_lean()
+    assert "wkt" not in result.__dict__
+    assert result.wkt == "POINT(-75.7 45.4)"
+    assert "wkt" not in result.__dict__
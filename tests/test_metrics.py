@@ -0,0 +1,113 @@
+import pytest
+import requests
+
+import geocoder
+from geocoder import metrics
+from geocoder.providers import OsmQuery
+
+location = "Ottawa, Ontario"
+
+
+@pytest.fixture
+def registry():
+    default = metrics.registry
+    custom = metrics.MetricsRegistry()
+    metrics.enable(custom)
+    yield custom
+    metrics.disable()
+    metrics.registry = default
+
+
+def test__metrics__disabled_by_default__nothing_recorded(local_server):
+    geocoder.osm(location, url=f"{local_server}/search")
+
+    assert metrics.enabled is False
+    assert metrics.registry.requests.value("osm", "geocode", "200", "ok") == 0
+
+
+def test__metrics__ok_call__record_counter_and_histograms(local_server, registry):
+    g = geocoder.osm(location, url=f"{local_server}/search")
+
+    assert g.outcome == "ok"
+    assert registry.requests.value("osm", "geocode", "200", "ok") == 1
+    assert registry.duration.count("osm", "geocode", "ok") == 1
+    assert registry.duration.sum("osm", "geocode", "ok") == g.timings.total
+    assert registry.ratelimit_wait.count("osm", "geocode") == 1
+    assert registry.response_size.sum("osm", "geocode") == g.response_size > 0
+
+
+@pytest.mark.parametrize(
+    "path,status_code,outcome",
+    [("/status/404", "404", "http_error"), ("/status/503", "503", "http_error")],
+)
+def test__metrics__http_error__outcome_label(
+    local_server, registry, path, status_code, outcome
+):
+    g = geocoder.osm(location, url=f"{local_server}{path}")
+
+    assert g.outcome == outcome
+    assert registry.requests.value("osm", "geocode", status_code, outcome) == 1
+
+
+def test__metrics__timeout__outcome_label(registry, monkeypatch):
+    def timeout(self, url, **kwargs):
+        raise requests.exceptions.ReadTimeout("Read timed out")
+
+    monkeypatch.setattr(OsmQuery, "rate_limited_get", timeout)
+    g = geocoder.osm(location)
+
+    assert g.outcome == "timeout"
+    assert registry.requests.value("osm", "geocode", "None", "timeout") == 1
+    assert registry.response_size.count("osm", "geocode") == 0
+
+
+def test__metrics__outcome__not_called_and_no_results():
+    assert OsmQuery(location).outcome == "not_called"
+    assert OsmQuery.from_raw([]).outcome == "no_results"
+
+
+def test__metrics__export_text__prometheus_format(local_server, registry):
+    geocoder.osm(location, url=f"{local_server}/search")
+    text = metrics.export_text()
+
+    assert "# TYPE geocoder_requests_total counter" in text
+    assert (
+        'geocoder_requests_total{provider="osm",method="geocode",'
+        'status_code="200",outcome="ok"} 1'
+    ) in text
+    assert "# TYPE geocoder_request_duration_seconds histogram" in text
+    assert (
+        'geocoder_request_duration_seconds_bucket{provider="osm",method="geocode",'
+        'outcome="ok",le="+Inf"} 1'
+    ) in text
+    assert 'geocoder_response_size_bytes_count{provider="osm",method="geocode"} 1' in (
+        text
+    )
+
+
+def test__metrics__histogram__cumulative_buckets():
+    histogram = metrics.Histogram("test", "Test", ("name",), buckets=(1, 5))
+    for value in (0.5, 2, 3, 10):
+        histogram.observe(value, 'a"b')
+
+    samples = list(histogram.samples())
+    assert samples == [
+        ("test_bucket", '{name="a\\"b",le="1"}', 1),
+        ("test_bucket", '{name="a\\"b",le="5"}', 3),
+        ("test_bucket", '{name="a\\"b",le="+Inf"}', 4),
+        ("test_sum", '{name="a\\"b"}', 15.5),
+        ("test_count", '{name="a\\"b"}', 4),
+    ]
+
+
+def test__metrics__start_http_server__serve_registry(local_server, registry):
+    geocoder.osm(location, url=f"{local_server}/search")
+    server = metrics.start_http_server(0, custom_registry=registry)
+    try:
+        response = requests.get(f"http://127.0.0.1:{server.server_address[1]}/metrics")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert response.headers["Content-Type"] == metrics.CONTENT_TYPE
+    assert response.text == registry.export_text()
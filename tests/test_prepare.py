@@ -0,0 +1,72 @@
+import pytest
+import vcr
+
+import geocoder
+from geocoder.base import PreparedQuery
+from geocoder.providers import OsmQuery, OsmReverse
+
+requests_recorder_ro = vcr.VCR(
+    serializer="json",
+    cassette_library_dir="tests/cassettes/",
+    filter_headers=["Authorization"],
+    filter_query_parameters=["key"],
+    record_mode="none",
+    match_on=["method", "path", "query"],
+    decode_compressed_response=True,
+)
+location = "Ottawa, Ontario"
+
+
+@requests_recorder_ro.use_cassette("osm_geocode.json", allow_playback_repeats=True)
+def test__prepare__call__return_same_result_as_get_results():
+    prepared = geocoder.prepare("osm", max_results=5)
+    expected = geocoder.osm(location, max_results=5)
+
+    first, second = prepared(location), prepared(location)
+    assert first is not second
+    assert len(first) == len(second) == len(expected) == 5
+    assert first.latlng == second.latlng == expected.latlng
+
+
+@pytest.mark.parametrize(
+    "provider, method, expected_error_text",
+    [
+        ("no_provider", "geocode", "Invalid provider"),
+        ("osm", "fake_method", "Invalid method"),
+    ],
+)
+def test__prepare__on_wrong_arguments__raise_value_error(
+    provider, method, expected_error_text
+):
+    with pytest.raises(ValueError, match=expected_error_text):
+        geocoder.prepare(provider, method)
+
+
+def test__prepared_query__bind__reuse_static_setup_only():
+    prepared = geocoder.prepare(" OSM ", headers={"User-Agent": "test"}, max_results=2)
+    assert isinstance(prepared, PreparedQuery)
+
+    first, second = prepared.bind("Ottawa"), prepared.bind("Toronto")
+    assert isinstance(first, OsmQuery)
+    assert first.headers == second.headers
+    assert first.headers is not second.headers
+    assert first._options is not second._options
+
+    # changes of one query do not leak to other queries
+    first.headers["X-Test"] = "1"
+    assert "X-Test" not in second.headers
+    assert "X-Test" not in prepared.bind("Montreal").headers
+    assert first.params["q"] == "Ottawa"
+    assert second.params["q"] == "Toronto"
+    assert second.params["limit"] == 2
+    assert not second.is_called
+
+    with pytest.raises(ValueError, match="Query should be a string"):
+        prepared.bind(2)
+
+
+def test__prepared_query__reverse__bind_location():
+    prepared = geocoder.prepare("osm", "reverse")
+    query = prepared.bind([45.4215296, -75.6971930])
+    assert isinstance(query, OsmReverse)
+    assert query.params["q"] == "45.4215296, -75.697193"
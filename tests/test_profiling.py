@@ -0,0 +1,100 @@
+import json
+import pstats
+import time
+
+from click.testing import CliRunner
+
+import geocoder
+from geocoder import hooks
+from geocoder.cli import cli
+from geocoder.profiling import PHASES, ProfileSummary, profile_calls
+from geocoder.providers.osm import OsmResult
+
+location = "Ottawa, Ontario"
+
+
+def test__profile_calls__summary_and_stats_file(local_server, tmp_path):
+    path = tmp_path / "geocoder.prof"
+    with profile_calls(str(path)) as summary:
+        for _ in range(3):
+            geocoder.osm(location, url=f"{local_server}/search").geojson
+
+    assert summary.queries == 3
+    assert hooks._subscribers["after_call"] == ()
+    phases = summary.as_dict()
+    assert set(phases) == set(PHASES) | {"other", "total"}
+    assert phases["network"] > 0
+    assert phases["total"] >= sum(summary.phases.values())
+    assert "cumulative" in summary.top
+    assert pstats.Stats(str(path)).total_calls > 0
+
+
+def test__profile_calls__lazy_results__counted_as_result_parsing(
+    local_server, monkeypatch
+):
+    def slow_address(result):
+        time.sleep(0.01)
+        return result.object_raw_json.get("display_name")
+
+    monkeypatch.setattr(OsmResult, "address", property(slow_address))
+    with profile_calls(top=0) as summary:
+        g = geocoder.osm(location, url=f"{local_server}/search")
+
+    assert summary.phases["result_parsing"] >= 0.01 * len(g) > 0
+    # results are already built, serialization does not parse them again
+    assert g[0].object_json["address"]
+
+
+def test__profile_calls__without_file_and_top():
+    with profile_calls(top=0) as summary:
+        pass
+
+    assert summary.queries == 0
+    assert summary.top == ""
+    assert "Queries: 0" in summary.format()
+
+
+def test__cli__profile__summary_to_stderr(local_server, tmp_path):
+    path = tmp_path / "cli.prof"
+    result = CliRunner().invoke(
+        cli,
+        [
+            "-o",
+            "geojson",
+            "--url",
+            f"{local_server}/search",
+            "--profile",
+            "--profile-output",
+            str(path),
+            location,
+        ],
+    )
+
+    assert result.exit_code == 0, result.stderr
+    assert json.loads(result.stdout)["type"] == "FeatureCollection"
+    assert "json_decode" in result.stderr
+    assert f"written to {path}" in result.stderr
+    assert path.exists()
+
+
+def test__profile_summary__overlapped_calls():
+    summary = ProfileSummary()
+    summary.wall = 1.0
+    summary.phases["network"] = 3.0
+
+    assert summary.overlapped
+    assert summary.as_dict()["other"] is None
+    text = summary.format()
+    assert "summed phase time" in text
+    assert "100.0%" in text
+    assert "other" not in text
+
+
+def test__cli__profile__refused_with_workers(tmp_path):
+    result = CliRunner().invoke(
+        cli,
+        ["--profile", "-w", "4", "--profile-output", str(tmp_path / "p"), location],
+    )
+
+    assert result.exit_code == 2
+    assert "--workers" in result.stderr
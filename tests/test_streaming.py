@@ -0,0 +1,305 @@
+import csv
+import importlib
+import io
+import json
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+from click.testing import CliRunner
+
+from geocoder.cli import cli
+from geocoder.jobs import JOB_OUTPUT_FORMATS
+from geocoder.streaming import (
+    INPUT_FORMATS,
+    OUTPUT_FORMATS,
+    CSVWriter,
+    GeoJSONWriter,
+    NDJSONWriter,
+    _Writer,
+    detect_format,
+    geocode_stream,
+    get_writer,
+    ordered_map,
+    read_locations,
+)
+
+location = "Ottawa, Ontario"
+cli_module = importlib.import_module("geocoder.cli")
+
+
+def test__detect_format():
+    assert detect_format("addresses.CSV") == "csv"
+    assert detect_format("addresses.jsonl") == "ndjson"
+    assert detect_format("addresses.ndjson") == "ndjson"
+    assert detect_format("addresses.txt") == "text"
+    assert detect_format("") == "text"
+
+
+def test__read_locations__text_skips_blank_lines():
+    stream = io.StringIO("Ottawa\n\n  Toronto  \n")
+    assert list(read_locations(stream)) == ["Ottawa", "Toronto"]
+
+
+def test__read_locations__csv_column_by_name_and_index():
+    content = "id,address\n1,Ottawa\n2,\n3,Toronto\n"
+    assert list(read_locations(io.StringIO(content), "csv", "address")) == [
+        "Ottawa",
+        "Toronto",
+    ]
+    assert list(read_locations(io.StringIO(content), "csv", "1")) == [
+        "address",
+        "Ottawa",
+        "Toronto",
+    ]
+    with pytest.raises(ValueError):
+        list(read_locations(io.StringIO(content), "csv", "missing"))
+
+
+def test__read_locations__ndjson():
+    content = '{"location": "Ottawa"}\n\n"Toronto"\n{"address": "Montreal"}\n'
+    assert list(read_locations(io.StringIO(content), "ndjson")) == [
+        "Ottawa",
+        "Toronto",
+    ]
+    assert list(read_locations(io.StringIO(content), "ndjson", "address")) == [
+        "Toronto",
+        "Montreal",
+    ]
+
+
+@pytest.mark.parametrize("record", ["[1, 2]", "42", "null"])
+def test__read_locations__ndjson_wrong_record(record):
+    content = f'"Ottawa"\n{record}\n'
+    locations = read_locations(io.StringIO(content), "ndjson")
+
+    assert next(locations) == "Ottawa"
+    with pytest.raises(ValueError, match="NDJSON line 2 should be string or object"):
+        next(locations)
+
+
+def test__read_locations__is_lazy():
+    def lines():
+        yield "Ottawa\n"
+        raise AssertionError("Read ahead")
+
+    assert next(read_locations(lines())) == "Ottawa"
+
+
+def test__read_locations__unknown_format():
+    with pytest.raises(ValueError):
+        list(read_locations(io.StringIO(""), "xml"))
+
+
+def test__ordered_map__keeps_order_with_workers():
+    def slow_square(value):
+        # earlier items finish later
+        time.sleep((10 - value) / 1000)
+        return value * value
+
+    results = list(ordered_map(slow_square, range(10), workers=4))
+    assert results == [(value, value * value) for value in range(10)]
+
+
+def test__ordered_map__reads_ahead_bounded_window():
+    consumed = []
+    lock = threading.Lock()
+
+    def items():
+        for value in range(100):
+            with lock:
+                consumed.append(value)
+            yield value
+
+    results = ordered_map(lambda value: value, items(), workers=3)
+    assert next(results) == (0, 0)
+    assert len(consumed) <= 2 * 3 + 1
+    assert len(list(results)) == 99
+
+
+def test__geocode_stream__shared_session(local_server):
+    locations = [location] * 5
+    results = list(geocode_stream(locations, workers=3, url=f"{local_server}/search"))
+
+    assert [loc for loc, _ in results] == locations
+    sessions = {id(g.session) for _, g in results}
+    assert len(sessions) == 1
+    assert all(g.ok for _, g in results)
+
+
+class _Query(object):
+    status = "OK"
+    lat = 45.4
+    lng = -75.7
+    address = "Ottawa"
+    wkt = "POINT(-75.7 45.4)"
+    geojson = {
+        "type": "FeatureCollection",
+        "features": [
+            {"type": "Feature", "properties": {"address": "Ottawa"}, "geometry": {}}
+        ],
+    }
+
+    def __len__(self):
+        return 1
+
+
+def test__writers():
+    stream = io.StringIO()
+    with NDJSONWriter(stream, "wkt") as writer:
+        writer.write(location, _Query())
+        writer.write(location, _Query())
+    assert stream.getvalue().splitlines() == ['"POINT(-75.7 45.4)"'] * 2
+
+    stream = io.StringIO()
+    with CSVWriter(stream) as writer:
+        writer.write(location, _Query())
+    rows = list(csv.reader(io.StringIO(stream.getvalue())))
+    assert rows == [
+        list(CSVWriter.columns),
+        [location, "OK", "45.4", "-75.7", "Ottawa"],
+    ]
+
+    stream = io.StringIO()
+    query = _Query()
+    with GeoJSONWriter(stream) as writer:
+        writer.write(location, query)
+        writer.write("Ottawa", query)
+    collection = json.loads(stream.getvalue())
+    assert [f["properties"]["query"] for f in collection["features"]] == [
+        location,
+        "Ottawa",
+    ]
+    # query geojson is not modified
+    assert "query" not in query.geojson["features"][0]["properties"]
+
+    stream = io.StringIO()
+    with GeoJSONWriter(stream):
+        pass
+    assert json.loads(stream.getvalue())["features"] == []
+
+    with pytest.raises(ValueError):
+        get_writer("xml", io.StringIO())
+
+
+@pytest.fixture
+def addresses_csv(tmp_path):
+    path = tmp_path / "addresses.csv"
+    path.write_text(
+        "id,address\n" + "".join(f'{idx},"{location}"\n' for idx in range(6))
+    )
+    return path
+
+
+def test__cli__csv_input_to_csv_output(local_server, addresses_csv):
+    result = CliRunner().invoke(
+        cli,
+        [
+            "--url",
+            f"{local_server}/search",
+            "--column",
+            "address",
+            "-w",
+            "4",
+            "--output-format",
+            "csv",
+            str(addresses_csv),
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    rows = list(csv.DictReader(io.StringIO(result.stdout)))
+    assert len(rows) == 6
+    assert {row["location"] for row in rows} == {location}
+    assert all(row["status"] == "OK" and row["lat"] for row in rows)
+
+
+def test__cli__stdin_ndjson_to_geojson(local_server):
+    result = CliRunner().invoke(
+        cli,
+        [
+            "--url",
+            f"{local_server}/search",
+            "--input-format",
+            "ndjson",
+            "--output-format",
+            "geojson",
+            "-w",
+            "2",
+        ],
+        input=f'{{"location": "{location}"}}\n' * 3,
+    )
+
+    assert result.exit_code == 0, result.output
+    collection = json.loads(result.stdout)
+    assert collection["type"] == "FeatureCollection"
+    assert {f["properties"]["query"] for f in collection["features"]} == {location}
+
+
+def test__cli__json_output(local_server):
+    result = CliRunner().invoke(cli, ["--url", f"{local_server}/search", location])
+
+    assert result.exit_code == 0, result.output
+    assert isinstance(json.loads(result.stdout), dict)
+
+
+@pytest.mark.parametrize(
+    "arguments",
+    [["-o", "geojson", "--url", "{url}", "--", "job"]]
+    + [["geocode", "job", "-o", "geojson", "--url", "{url}"]],
+)
+def test__cli__location_equal_to_command_name(local_server, arguments):
+    arguments = [
+        argument.format(url=f"{local_server}/search") for argument in arguments
+    ]
+    result = CliRunner().invoke(cli, arguments)
+
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.stdout)["type"] == "FeatureCollection"
+
+
+@pytest.mark.parametrize(
+    "error, exit_code", [(BrokenPipeError, 0), (PermissionError, 1)]
+)
+def test__cli__only_broken_pipe_is_silent(local_server, monkeypatch, error, exit_code):
+    def write_serialized(self, chunk):
+        raise error
+
+    monkeypatch.setattr(NDJSONWriter, "write_serialized", write_serialized)
+    result = CliRunner().invoke(
+        cli, ["--url", f"{local_server}/search", "--output-format", "ndjson", location]
+    )
+
+    assert result.exit_code == exit_code
+    assert isinstance(result.exception, (type(None), error))
+
+
+def test__writer__serialize_is_abstract():
+    with pytest.raises(TypeError):
+        _Writer(io.StringIO())
+
+
+def test__cli__choices_match_library_constants():
+    import geocoder.transport
+
+    assert tuple(cli_module.input_formats) == INPUT_FORMATS
+    assert tuple(cli_module.output_formats) == OUTPUT_FORMATS
+    assert tuple(cli_module.job_output_formats) == JOB_OUTPUT_FORMATS
+    assert cli_module.transports == list(geocoder.transport.TRANSPORTS)
+
+
+def test__cli__import_does_not_load_heavy_modules():
+    modules = ["geocoder.jobs", "geocoder.streaming", "geocoder.transport", "sqlite3"]
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys, geocoder.cli; print([m in sys.modules for m in {modules}])",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    assert result.stdout.strip() == str([False] * len(modules))
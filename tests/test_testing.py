@@ -0,0 +1,145 @@
+import threading
+import time
+
+import pytest
+import requests
+
+import geocoder
+from geocoder.providers import BingBatchForward, OsmQuery, USCensusBatch
+from geocoder.testing import MockProviderServer, MockResponse
+
+location = "Ottawa, Ontario"
+cassette = "tests/cassettes/osm_geocode.json"
+
+
+def test__mock_server__cassette__match_by_query():
+    with MockProviderServer([cassette]) as server:
+        url = server.url_for(OsmQuery._URL)
+        single = geocoder.osm(location, url=url)
+        several = geocoder.osm(location, url=url, max_results=5)
+        # not recorded query answered with first recorded interaction
+        other = geocoder.osm("Toronto", url=url)
+
+    assert len(single) == 1
+    assert len(several) == 5
+    assert len(other) == 1
+    assert server.request_count == 3
+    assert server.requests[0].query["q"] == location
+
+
+def test__mock_server__unknown_path__not_found():
+    with MockProviderServer([cassette]) as server:
+        g = geocoder.osm(location, url=f"{server.url}/unknown")
+
+    assert g.status_code == 404
+    assert g.outcome == "http_error"
+
+
+def test__mock_server__injected_failures__reproducible_with_seed():
+    def statuses():
+        server = MockProviderServer(
+            [cassette], error_rate=0.3, rate_limit_rate=0.2, seed=1
+        )
+        with server, requests.Session() as session:
+            url = server.url_for(OsmQuery._URL)
+            return [session.get(url).status_code for _ in range(40)]
+
+    first = statuses()
+    assert first == statuses()
+    assert {200, 429, 500} == set(first)
+
+
+def test__mock_server__latency_and_slow_body():
+    server = MockProviderServer(
+        [cassette], latency=lambda rng: 0.05, chunk_size=200, chunk_delay=0.01
+    )
+    with server:
+        started = time.perf_counter()
+        g = geocoder.osm(location, url=server.url_for(OsmQuery._URL))
+        elapsed = time.perf_counter() - started
+
+    assert g.ok
+    assert g.timings.ttfb >= 0.05
+    # recorded answer of 687 bytes is streamed with 4 chunks
+    assert elapsed >= 0.05 + 0.04
+
+
+def test__mock_server__bing_batch__polling_loop(monkeypatch):
+    monkeypatch.setattr(BingBatchForward, "_BATCH_WAIT", 0)
+    statuses = iter(["Pending", "Pending", "Completed"])
+    job = {"resourceSets": [{"resources": [{"id": "job"}]}]}
+
+    def status(request):
+        resource = {"id": "job", "status": next(statuses)}
+        return MockResponse({"resourceSets": [{"resources": [resource]}]})
+
+    with MockProviderServer() as server:
+        url = server.url_for(BingBatchForward._URL)
+        path = url[len(server.url) :]
+        server.add_route(path, MockResponse(job, 201), method="POST")
+        server.add_route(f"{path}/job", status)
+        server.add_route(
+            f"{path}/job/output/succeeded",
+            MockResponse(
+                "Bing Spatial Data Services, 2.0\n"
+                "Id,GeocodeRequest/Query,GeocodeResponse/Point/Latitude,"
+                "GeocodeResponse/Point/Longitude\n"
+                "0,Ottawa,45.4,-75.7\n",
+                headers={"Content-Type": "text/plain"},
+            ),
+        )
+        g = BingBatchForward(["Ottawa"], key="key", url=url)()
+
+    assert g.ok
+    assert g.latlng == [45.4, -75.7]
+    assert len(g.timings.polls) == 3
+
+
+def test__mock_server__uscensus_batch__upload():
+    def answer(request):
+        assert b'filename="addresses.csv"' in request.body
+        return MockResponse(
+            '"0","Ottawa","Match","Exact","Ottawa","-75.7,45.4"\n',
+            headers={"Content-Type": "text/csv"},
+        )
+
+    with MockProviderServer() as server:
+        url = server.url_for(USCensusBatch._URL)
+        server.add_route(url[len(server.url) :], answer, method="POST")
+        g = USCensusBatch(["Ottawa"], url=url)()
+
+    assert g.ok
+    assert server.requests[0].method == "POST"
+
+
+def test__mock_server__concurrent_load():
+    with MockProviderServer([cassette]) as server:
+        client = geocoder.GeocoderClient(pool_maxsize=8)
+        url = server.url_for(OsmQuery._URL)
+        errors = []
+
+        def worker():
+            for _ in range(25):
+                if not client.geocode(location, url=url).ok:
+                    errors.append(1)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        client.close()
+
+    assert not errors
+    assert server.request_count == 200
+
+
+def test__mock_server__invalid_usage():
+    with pytest.raises(ValueError, match="error_rate"):
+        MockProviderServer(error_rate=0.6, rate_limit_rate=0.6)
+    server = MockProviderServer()
+    with pytest.raises(RuntimeError, match="not started"):
+        server.url
+    with server:
+        with pytest.raises(RuntimeError, match="already started"):
+            server.start()
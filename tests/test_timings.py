@@ -0,0 +1,72 @@
+import pytest
+
+import geocoder
+from geocoder.providers import BingBatchForward, OsmQuery
+from geocoder.timings import QueryTimings
+from geocoder.transport import HTTPXTransport
+
+location = "Ottawa, Ontario"
+bing_result = (
+    b"Bing Spatial Data Services, 2.0\n"
+    b"Id,GeocodeRequest/Query,GeocodeResponse/Point/Latitude,"
+    b"GeocodeResponse/Point/Longitude\n"
+    b"0,Ottawa,45.4,-75.7\n"
+)
+
+
+def test__timings__call__record_all_phases(local_server):
+    g = geocoder.osm(location, url=f"{local_server}/search")
+    timings = g.timings
+
+    assert isinstance(timings, QueryTimings)
+    for phase in ("ratelimit_wait", "ttfb", "download", "decode", "adapt", "parse"):
+        assert getattr(timings, phase) >= 0
+    # requests does not report connection establishment
+    assert timings.connect is None
+    assert timings.total >= timings.ttfb + timings.download + timings.parse
+    assert timings.as_dict()["polls"] == []
+
+
+def test__timings__httpx_transport__report_connect(local_server):
+    with HTTPXTransport(http2=False) as transport:
+        first = geocoder.osm(location, url=f"{local_server}/search", session=transport)
+        second = geocoder.osm(location, url=f"{local_server}/search", session=transport)
+
+    assert first.timings.connect > 0
+    # connection is reused
+    assert second.timings.connect == 0
+
+
+def test__timings__from_raw__only_parsing_phases():
+    g = OsmQuery.from_raw([{"lat": "45.4", "lon": "-75.7"}])
+
+    assert g.timings.ttfb is None
+    assert g.timings.total is None
+    assert g.timings.catch_errors >= 0
+    assert g.timings.parse >= 0
+    assert "parse=" in repr(g.timings)
+
+
+def test__timings__bing_batch__record_polls(local_server, monkeypatch):
+    polls = iter([False, False, True])
+    monkeypatch.setattr(BingBatchForward, "_BATCH_WAIT", 0)
+    monkeypatch.setattr(BingBatchForward, "extract_resource_id", lambda self, r: "1")
+    monkeypatch.setattr(BingBatchForward, "is_job_done", lambda self, job: next(polls))
+    monkeypatch.setattr(
+        BingBatchForward, "get_job_result", lambda self, job: bing_result
+    )
+
+    g = BingBatchForward(["Ottawa"], key="key", url=f"{local_server}/echo")()
+
+    assert g.ok
+    assert len(g.timings.polls) == 3
+    assert g.timings.adapt >= 0
+    assert g.timings.ttfb >= 0
+
+
+@pytest.mark.parametrize("name", ["parse", "download"])
+def test__timings__add__sum_multiple_measures(name):
+    timings = QueryTimings()
+    timings.add(name, 1.0)
+    timings.add(name, 0.5)
+    assert getattr(timings, name) == 1.5
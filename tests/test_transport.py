@@ -0,0 +1,87 @@
+import pytest
+import requests
+
+import geocoder
+from geocoder.transport import (
+    HTTPXTransport,
+    Transport,
+    Urllib3Transport,
+    get_transport,
+    requests_session,
+)
+
+location = "Ottawa, Ontario"
+transports = [
+    pytest.param(requests_session, id="requests"),
+    pytest.param(Urllib3Transport, id="urllib3"),
+    pytest.param(lambda: HTTPXTransport(http2=False), id="httpx"),
+]
+
+
+@pytest.mark.parametrize("factory", transports)
+def test__transport__osm_geocode__same_result(local_server, factory):
+    with factory() as transport:
+        g = geocoder.osm(location, url=f"{local_server}/search", session=transport)
+
+    assert g.ok
+    assert g.session is transport
+    assert isinstance(transport, Transport)
+    assert g.latlng == [45.3969506, -75.6851593]
+    assert "q=Ottawa%2C+Ontario" in g.raw_response.url
+
+
+@pytest.mark.parametrize("factory", transports)
+def test__transport__http_error__raise_requests_exception(local_server, factory):
+    with factory() as transport:
+        response = transport.get(f"{local_server}/status/503", timeout=5)
+        with pytest.raises(requests.exceptions.HTTPError):
+            response.raise_for_status()
+
+        g = geocoder.osm(location, url=f"{local_server}/status/429", session=transport)
+        assert not g.ok
+        assert g.status_code == 429
+        assert g.error.startswith("ERROR - 429")
+
+
+@pytest.mark.parametrize("factory", transports)
+def test__transport__connection_error__raise_requests_exception(factory):
+    with factory() as transport:
+        with pytest.raises(requests.exceptions.ConnectionError):
+            transport.get("http://127.0.0.1:9/search", timeout=1)
+
+
+@pytest.mark.parametrize("factory", transports)
+def test__transport__redirect__follow_with_final_url(local_server, factory):
+    with factory() as transport:
+        response = transport.get(f"{local_server}/redirect", params={"q": None})
+
+    assert response.status_code == 200
+    assert response.url.endswith("/search?q=redirected")
+
+
+@pytest.mark.parametrize("factory", transports)
+def test__transport__post_files__send_multipart_form(local_server, factory):
+    files = {"benchmark": (None, "4"), "addressFile": ("addresses.csv", "1,Ottawa")}
+    with factory() as transport:
+        answer = transport.post(f"{local_server}/echo", files=files).json()
+
+    assert answer["content_type"].startswith("multipart/form-data")
+    assert 'name="benchmark"\r\n\r\n4' in answer["body"]
+    assert 'filename="addresses.csv"' in answer["body"]
+
+
+def test__get_transport__names_and_factories():
+    assert get_transport(" URLLIB3 ") is Urllib3Transport
+    assert get_transport(requests_session) is requests_session
+    with pytest.raises(ValueError):
+        get_transport("curl")
+
+
+def test__client__transport__used_for_all_sessions(local_server):
+    client = geocoder.GeocoderClient(transport="urllib3", pool_maxsize=4)
+    g = client.geocode(location, url=f"{local_server}/search")
+
+    assert g.ok
+    assert isinstance(g.session, Urllib3Transport)
+    assert g.session.pool_kwargs["maxsize"] == 4
+    client.close()